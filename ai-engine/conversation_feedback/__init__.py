@@ -6,10 +6,17 @@ conversation_feedback - 대화 후 피드백 생성 패키지
 피드백을 생성합니다.
 
 [사용법]
-from conversation_feedback import generate_feedback
+from conversation_feedback import generate_feedback, generate_feedback_async
 
 result = generate_feedback(messages, session_id)
+result = await generate_feedback_async(messages, session_id)  # 이벤트 루프 안에서
 """
-from .feedback_service import generate_feedback
+__all__ = ["generate_feedback", "generate_feedback_async"]
 
-__all__ = ["generate_feedback"]
+
+def __getattr__(name):
+    # feedback_service는 backend 설정(app.core.config)을 읽으므로 실제로 사용할 때 로드
+    if name in __all__:
+        from . import feedback_service
+        return getattr(feedback_service, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,149 @@
+"""
+feedback_schema.py - 피드백 구조화 출력 스키마 / 청크 분할 / 결과 병합
+
+[역할]
+- LLM 응답 형식을 JSON Schema(Structured Outputs)로 고정하고 pydantic으로 검증합니다.
+  (자유 텍스트에서 정규식으로 JSON을 찾아내던 방식 대체)
+- 긴 대화는 메시지 청크로 나눠 병렬 분석하고, 결과를 message_id 기준으로 합칩니다.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ValidationError
+
+# 청크 사이에 겹쳐 넣는 앞 청크의 메시지 수 (맥락용, 피드백 대상 아님)
+CHUNK_OVERLAP_MESSAGES = 2
+
+
+class FeedbackDetail(BaseModel):
+    message_id: int
+    fb_before: str
+    fb_content: str
+    fb_after: str
+
+
+class FeedbackAnalysis(BaseModel):
+    summary: Optional[str] = None
+    feedback_top3_ids: list[int] = []
+    feedback_details: list[FeedbackDetail] = []
+
+
+def response_format(with_summary: bool) -> dict:
+    """
+    chat.completions의 response_format (strict JSON Schema)
+    with_summary=False면 summary 필드 없이 피드백만 요청합니다. (청크 분석용)
+    """
+    properties = {
+        "feedback_top3_ids": {
+            "type": "array",
+            "items": {"type": "integer"},
+            "description": "가장 중요한 오류의 message_id, 중요도 순 최대 3개",
+        },
+        "feedback_details": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "message_id": {"type": "integer"},
+                    "fb_before": {"type": "string", "description": "학습자가 말한 원래 문장"},
+                    "fb_content": {"type": "string", "description": "왜 틀렸는지 한국어로 간결하게"},
+                    "fb_after": {"type": "string", "description": "수정된 올바른 문장"},
+                },
+                "required": ["message_id", "fb_before", "fb_content", "fb_after"],
+                "additionalProperties": False,
+            },
+        },
+    }
+    if with_summary:
+        properties = {
+            "summary": {
+                "type": "string",
+                "description": "대화 내용을 영어 1문장으로 요약 (어떤 주제를 연습했는지)",
+            },
+            **properties,
+        }
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "conversation_feedback" if with_summary else "conversation_feedback_chunk",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+def parse_analysis(content: Optional[str]) -> FeedbackAnalysis:
+    """
+    구조화 출력 검증. 스키마와 다르면(거부 응답 등) 빈 결과를 반환합니다.
+    """
+    if not content:
+        return FeedbackAnalysis()
+    try:
+        return FeedbackAnalysis.model_validate_json(content)
+    except ValidationError:
+        return FeedbackAnalysis()
+
+
+def split_chunks(messages: list[dict], chunk_size: int) -> list[tuple[list[dict], set]]:
+    """
+    메시지를 chunk_size개씩 나눕니다.
+
+    Returns:
+        [(LLM에 보낼 메시지(앞 청크 일부 포함), 이 청크가 피드백을 책임지는 message_id 집합)]
+    """
+    if chunk_size <= 0 or len(messages) <= chunk_size:
+        return [(messages, {msg.get("id") for msg in messages})]
+
+    chunks = []
+    for start in range(0, len(messages), chunk_size):
+        owned = messages[start:start + chunk_size]
+        context_start = max(start - CHUNK_OVERLAP_MESSAGES, 0)
+        chunks.append((messages[context_start:start + chunk_size], {msg.get("id") for msg in owned}))
+    return chunks
+
+
+def merge_analyses(
+    messages: list[dict],
+    chunks: list[tuple[list[dict], set]],
+    analyses: list[FeedbackAnalysis],
+) -> tuple[list[int], list[dict]]:
+    """
+    청크별 결과를 합칩니다.
+    - feedback_details: 청크가 책임지는 학습자 메시지만 채택, message_id 기준 중복 제거 후 대화 순서로 정렬
+    - feedback_top3_ids: 청크별 순위를 번갈아(1위들 -> 2위들 ...) 합쳐 최대 3개
+
+    Returns:
+        (feedback_top3_ids, feedback_details)
+    """
+    learner_ids = [msg.get("id") for msg in messages if msg.get("role") == "user"]
+    if all(message_id is None for message_id in learner_ids):
+        # ID 없이 전달된 대화는 검증 기준이 없으므로 청크 결과를 순서대로 이어 붙임
+        details_list = [detail.model_dump() for analysis in analyses for detail in analysis.feedback_details]
+        top3_ids = [message_id for analysis in analyses for message_id in analysis.feedback_top3_ids]
+        return top3_ids[:3], details_list
+
+    order = {message_id: index for index, message_id in enumerate(learner_ids)}
+
+    details: dict[int, dict] = {}
+    rankings: list[list[int]] = []
+    for (_, owned), analysis in zip(chunks, analyses):
+        accepted = set()
+        for detail in analysis.feedback_details:
+            # 입력에 없는 ID(환각)나 튜터 메시지, 다른 청크 담당 메시지는 버림
+            if detail.message_id not in order or detail.message_id not in owned:
+                continue
+            details.setdefault(detail.message_id, detail.model_dump())
+            accepted.add(detail.message_id)
+        rankings.append([message_id for message_id in analysis.feedback_top3_ids if message_id in accepted])
+
+    top3: list[int] = []
+    for rank in range(max((len(ranking) for ranking in rankings), default=0)):
+        for ranking in rankings:
+            if rank < len(ranking) and ranking[rank] not in top3:
+                top3.append(ranking[rank])
+    return top3[:3], sorted(details.values(), key=lambda detail: order[detail["message_id"]])
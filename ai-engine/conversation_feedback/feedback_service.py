@@ -1,14 +1,16 @@
-import json
+import asyncio
 import logging
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from langsmith import traceable, wrappers
 
 from app.core.config import settings
+from scenario.openai_clients import get_async_openai_client, get_client_registry, get_openai_client
+from .feedback_schema import FeedbackAnalysis, merge_analyses, parse_analysis, response_format, split_chunks
 
 # LangSmith 트레이싱 설정
 if settings.LANGCHAIN_TRACING_V2 and settings.LANGCHAIN_API_KEY:
@@ -30,6 +32,8 @@ feedback_service.py - 대화 후 피드백 생성 서비스 (단순화 버전)
 - LangChain 제거, OpenAI SDK 직접 사용
 - LangSmith traceable 데코레이터로 트레이싱
 - 프롬프트는 feedback_prompts.yaml에서 로드
+- 요약 + 메시지별 피드백을 구조화 출력(JSON Schema) 1회 호출로 생성
+- 긴 대화는 FEEDBACK_CHUNK_MESSAGES개씩 나눠 병렬 분석 후 message_id 기준으로 병합
 """
 
 # 프롬프트 파일 경로
@@ -37,6 +41,7 @@ PROMPTS_PATH = Path(__file__).parent / "feedback_prompts.yaml"
 
 # OpenAI 클라이언트 (Lazy Initialization)
 _client = None
+_async_client = None
 _prompts = None
 
 
@@ -58,7 +63,8 @@ def _get_client() -> OpenAI:
     """OpenAI 클라이언트 Lazy Initialization (LangSmith 래핑)"""
     global _client
     if _client is None:
-        base_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # 프로세스 공용 커넥션 풀을 공유하는 복사본 (LangSmith 래핑이 다른 서비스에 번지지 않도록)
+        base_client = get_openai_client(settings.OPENAI_API_KEY).with_options()
         # LangSmith 트레이싱이 활성화된 경우 래핑
         if settings.LANGCHAIN_TRACING_V2 and settings.LANGCHAIN_API_KEY:
             _client = wrappers.wrap_openai(base_client)
@@ -67,6 +73,18 @@ def _get_client() -> OpenAI:
     return _client
 
 
+def _get_async_client() -> AsyncOpenAI:
+    """AsyncOpenAI 클라이언트 Lazy Initialization (LangSmith 래핑)"""
+    global _async_client
+    if _async_client is None:
+        base_client = get_async_openai_client(settings.OPENAI_API_KEY).with_options()
+        if settings.LANGCHAIN_TRACING_V2 and settings.LANGCHAIN_API_KEY:
+            _async_client = wrappers.wrap_openai(base_client)
+        else:
+            _async_client = base_client
+    return _async_client
+
+
 def _convert_messages_to_text(messages: list) -> str:
     """
     메시지 리스트를 분석용 텍스트로 변환합니다.
@@ -96,109 +114,116 @@ def _convert_messages_to_text(messages: list) -> str:
     return "\n".join(lines)
 
 
-@traceable(name="generate_summary")
-def _generate_summary(conversation_text: str) -> str:
+def _build_request(messages: list[dict], with_summary: bool) -> dict:
     """
-    대화 내용을 영어 1문장으로 요약합니다.
+    피드백 분석 요청 파라미터 (chat.completions.create kwargs)
 
     Args:
-        conversation_text: 대화 텍스트
-
-    Returns:
-        영어 1문장 요약
+        with_summary: True면 요약도 같은 응답에서 생성, False면 피드백만 (청크 분석)
     """
     prompts = _load_prompts()
-    client = _get_client()
+    conversation_text = _convert_messages_to_text(messages)
+
+    system_prompt = prompts.get("feedback_system", "")
+    if with_summary:
+        system_prompt += "\n" + prompts.get("feedback_summary_instruction", "")
+    user_prompt = prompts.get("feedback_user", "{conversation}").format(conversation=conversation_text)
+
+    return {
+        "model": settings.OPENAI_MODEL,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        "response_format": response_format(with_summary),
+    }
+
+
+def _build_summary_request(messages: list[dict]) -> dict:
+    """요약 전용 요청 (청크로 나눈 긴 대화에서 피드백 분석과 병렬로 실행)"""
+    prompts = _load_prompts()
+    conversation_text = _convert_messages_to_text(messages)
 
     system_prompt = prompts.get("summary_system", "Summarize the conversation in ONE English sentence.")
     user_prompt = prompts.get("summary_user", "{conversation}").format(conversation=conversation_text)
-
-    response = client.chat.completions.create(
-        model=settings.OPENAI_MODEL,
-        messages=[
+    return {
+        "model": settings.OPENAI_MODEL,
+        "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-    )
-    return response.choices[0].message.content.strip()
+    }
 
 
 @traceable(name="analyze_feedback")
-def _analyze_feedback(conversation_text: str) -> dict:
-    """
-    대화를 분석하여 피드백 JSON을 생성합니다.
+def _analyze_feedback(messages: list[dict], with_summary: bool) -> FeedbackAnalysis:
+    """대화(또는 청크)를 구조화 출력 1회 호출로 분석합니다."""
+    client = _get_client()
+    with get_client_registry().limit("feedback"):
+        response = client.chat.completions.create(**_build_request(messages, with_summary))
+    return parse_analysis(response.choices[0].message.content)
 
-    Args:
-        conversation_text: 분석할 대화 텍스트
 
-    Returns:
-        {
-            "summary": str,
-            "feedback_top3_ids": [int],
-            "feedback_details": [...]
-        }
-    """
-    prompts = _load_prompts()
+@traceable(name="analyze_feedback_async")
+async def _analyze_feedback_async(messages: list[dict], with_summary: bool) -> FeedbackAnalysis:
+    client = _get_async_client()
+    async with get_client_registry().async_limit("feedback"):
+        response = await client.chat.completions.create(**_build_request(messages, with_summary))
+    return parse_analysis(response.choices[0].message.content)
+
+
+@traceable(name="generate_summary")
+def _generate_summary(messages: list[dict]) -> FeedbackAnalysis:
     client = _get_client()
+    with get_client_registry().limit("feedback"):
+        response = client.chat.completions.create(**_build_summary_request(messages))
+    return FeedbackAnalysis(summary=(response.choices[0].message.content or "").strip())
 
-    system_prompt = prompts.get("feedback_system", "")
-    user_prompt = prompts.get("feedback_user", "{conversation}").format(conversation=conversation_text)
 
-    response = client.chat.completions.create(
-        model=settings.OPENAI_MODEL,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-    )
-    return _parse_response(response.choices[0].message.content)
+@traceable(name="generate_summary_async")
+async def _generate_summary_async(messages: list[dict]) -> FeedbackAnalysis:
+    client = _get_async_client()
+    async with get_client_registry().async_limit("feedback"):
+        response = await client.chat.completions.create(**_build_summary_request(messages))
+    return FeedbackAnalysis(summary=(response.choices[0].message.content or "").strip())
 
 
-def _parse_response(llm_output: str) -> dict:
-    """
-    LLM 출력에서 JSON을 파싱합니다.
+def _empty_result(session_id: str | None) -> dict:
+    return {
+        "session_id": session_id,
+        "scenario_summary": "",
+        "message_count": 0,
+        "feedback_top3_ids": [],
+        "feedback_details": [],
+    }
 
-    Args:
-        llm_output: LLM이 반환한 텍스트
 
-    Returns:
-        파싱된 딕셔너리, 실패 시 기본값 반환
-    """
-    # JSON 블록 추출 (```json ... ``` 또는 { ... })
-    json_match = re.search(r'```json\s*([\s\S]*?)\s*```', llm_output)
-
-    if json_match:
-        json_str = json_match.group(1)
-    else:
-        # ```json 없이 바로 JSON인 경우
-        json_match = re.search(r'\{[\s\S]*"feedback_details"[\s\S]*\}', llm_output)
-        if json_match:
-            json_str = json_match.group(0)
-        else:
-            logger.warning("LLM 출력에서 JSON을 찾을 수 없음")
-            return {
-                "feedback_top3_ids": [],
-                "feedback_details": []
-            }
-
-    try:
-        parsed = json.loads(json_str)
-        return {
-            "feedback_top3_ids": parsed.get("feedback_top3_ids", []),
-            "feedback_details": parsed.get("feedback_details", [])
-        }
-    except json.JSONDecodeError as e:
-        logger.warning(f"JSON 파싱 실패: {e}")
-        return {
-            "feedback_top3_ids": [],
-            "feedback_details": []
-        }
+def _build_result(
+    messages: list[dict],
+    session_id: str | None,
+    chunks: list[tuple[list[dict], set]],
+    analyses: list[FeedbackAnalysis],
+    summary: str,
+) -> dict:
+    feedback_top3_ids, feedback_details = merge_analyses(messages, chunks, analyses)
+    logger.info(
+        f"피드백 생성 완료 - session_id: {session_id}, 청크 {len(chunks)}개, "
+        f"상세 피드백 {len(feedback_details)}개, TOP3: {feedback_top3_ids}"
+    )
+    return {
+        "session_id": session_id,
+        "scenario_summary": summary,
+        "message_count": len(messages),
+        "feedback_top3_ids": feedback_top3_ids,
+        "feedback_details": feedback_details,
+    }
 
 
 @traceable(name="generate_feedback")
 def generate_feedback(messages: list[dict], session_id: str | None = None) -> dict:
     """
     Backend 서비스에서 전달받은 메시지로 피드백을 생성합니다.
+    (동기 버전 - 청크는 스레드에서 병렬 처리. 이벤트 루프 안에서는 generate_feedback_async 사용)
 
     Args:
         messages: [{"id": int, "role": "user"|"assistant", "content": "..."}] 형식의 리스트
@@ -224,31 +249,42 @@ def generate_feedback(messages: list[dict], session_id: str | None = None) -> di
 
     if not messages:
         logger.info("대화 내용 없음")
-        return {
-            "session_id": session_id,
-            "scenario_summary": "",
-            "message_count": 0,
-            "feedback_top3_ids": [],
-            "feedback_details": [],
-        }
+        return _empty_result(session_id)
 
-    # 메시지를 분석용 텍스트로 변환 (ID 포함)
-    conversation_text = _convert_messages_to_text(messages)
+    chunks = split_chunks(messages, settings.FEEDBACK_CHUNK_MESSAGES)
+    if len(chunks) == 1:
+        # 요약 + 피드백을 한 번의 호출로 생성
+        analysis = _analyze_feedback(messages, with_summary=True)
+        return _build_result(messages, session_id, chunks, [analysis], analysis.summary or "")
 
-    # 1. 대화 요약 생성
-    logger.info("대화 요약 생성 중...")
-    scenario_summary = _generate_summary(conversation_text)
+    # 긴 대화: 요약(전체)과 청크별 피드백을 동시에 요청
+    with ThreadPoolExecutor(max_workers=len(chunks) + 1) as executor:
+        summary_future = executor.submit(_generate_summary, messages)
+        chunk_futures = [executor.submit(_analyze_feedback, chunk, False) for chunk, _ in chunks]
+        analyses = [future.result() for future in chunk_futures]
+        summary = summary_future.result().summary or ""
+    return _build_result(messages, session_id, chunks, analyses, summary)
 
-    # 2. 피드백 분석 (단일 LLM 호출)
-    logger.info("피드백 분석 중...")
-    analysis_result = _analyze_feedback(conversation_text)
 
-    logger.info(f"피드백 생성 완료 - session_id: {session_id}, 상세 피드백 {len(analysis_result['feedback_details'])}개, TOP3: {analysis_result['feedback_top3_ids']}")
+@traceable(name="generate_feedback_async")
+async def generate_feedback_async(messages: list[dict], session_id: str | None = None) -> dict:
+    """
+    generate_feedback의 비동기 버전 (AsyncOpenAI, 청크는 asyncio.gather로 병렬 처리)
+    반환 형식은 generate_feedback과 같습니다.
+    """
+    logger.info(f"피드백 생성 시작 (async) - session_id: {session_id}, 메시지 {len(messages)}개")
 
-    return {
-        "session_id": session_id,
-        "scenario_summary": scenario_summary,
-        "message_count": len(messages),
-        "feedback_top3_ids": analysis_result["feedback_top3_ids"],
-        "feedback_details": analysis_result["feedback_details"],
-    }
+    if not messages:
+        logger.info("대화 내용 없음")
+        return _empty_result(session_id)
+
+    chunks = split_chunks(messages, settings.FEEDBACK_CHUNK_MESSAGES)
+    if len(chunks) == 1:
+        analysis = await _analyze_feedback_async(messages, with_summary=True)
+        return _build_result(messages, session_id, chunks, [analysis], analysis.summary or "")
+
+    summary, *analyses = await asyncio.gather(
+        _generate_summary_async(messages),
+        *[_analyze_feedback_async(chunk, False) for chunk, _ in chunks],
+    )
+    return _build_result(messages, session_id, chunks, analyses, summary.summary or "")
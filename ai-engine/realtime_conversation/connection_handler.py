@@ -1,11 +1,19 @@
 import asyncio
 import json
 import logging
+import time
+from typing import Callable, Optional
+
 import websockets
 from fastapi import WebSocket, WebSocketDisconnect
 from .conversation_manager import ConversationManager
 from .conversation_tracker import ConversationTracker
 from .conversation_tracker import ConversationTracker
+from .history_compactor import HISTORY_KEEP_MESSAGES, HistorySummary, build_history_events, compact_history
+from .upstream_metrics import upstream_switch_metrics
+from scenario.config import send_queue_options_from_env
+from scenario.send_queue import ClientSendQueue
+from scenario.upstream_pool import claim_upstream
 # from conversation_feedback.feedback_service import generate_feedback (Moved to ChatService)
 
 # Configure logging
@@ -14,6 +22,37 @@ logger = logging.getLogger(__name__)
 
 OPENAI_REALTIME_API_URL = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview"
 
+# [Fast Path] 오디오 델타 프레임 식별용 접두사
+# OpenAI는 항상 "type" 키를 맨 앞에 직렬화하므로 접두사만 보고도 이벤트 종류를 알 수 있음
+_AUDIO_DELTA_PREFIXES = (
+    '{"type":"response.audio.delta"',
+    '{"type": "response.audio.delta"',
+)
+_CLIENT_AUDIO_DELTA_PREFIX = '{"type":"audio.delta"'
+
+# [Warm Standby] 전사(transcription) 완료를 기다리는 최대 시간 - 이후에는 응답/발화 종료만 보고 교체
+UPSTREAM_SWITCH_TRANSCRIPTION_GRACE_SEC = 3.0
+
+
+def rewrite_audio_delta_frame(message) -> Optional[str]:
+    """
+    [Zero-Parse Passthrough]
+    OpenAI의 response.audio.delta 원본 프레임을 JSON 파싱 없이 클라이언트용 audio.delta 프레임으로 변환합니다.
+
+    type 값만 문자열 치환하고 나머지 필드(delta 등)는 그대로 전달하므로
+    base64 오디오를 디코드/재인코드하지 않습니다.
+
+    Returns:
+        변환된 프레임 문자열. 오디오 델타가 아니면 None (일반 파싱 경로로 처리)
+    """
+    if not isinstance(message, str):
+        return None
+    for prefix in _AUDIO_DELTA_PREFIXES:
+        if message.startswith(prefix):
+            return _CLIENT_AUDIO_DELTA_PREFIX + message[len(prefix):]
+    return None
+
+
 class ConnectionHandler:
     """
     [WebSocket 연결 핸들러]
@@ -35,7 +74,9 @@ class ConnectionHandler:
        - 사용자/AI 대화 내용(Transcript) 처리 및 로그 출력
        - 에러 핸들링 및 세션 초기화
     """
-    def __init__(self, client_ws: WebSocket, api_key: str, history: list = None, session_id: str = None, context: dict = None, voice: str = None):
+    def __init__(self, client_ws: WebSocket, api_key: str, history: list = None, session_id: str = None, context: dict = None, voice: str = None,
+                 on_context_update: Optional[Callable[["ConnectionHandler"], None]] = None,
+                 history_summary: Optional[HistorySummary] = None, history_keep_last: int = HISTORY_KEEP_MESSAGES):
         self.client_ws = client_ws
         self.api_key = api_key
         self.conversation_manager = ConversationManager()
@@ -48,10 +89,28 @@ class ConnectionHandler:
         self.openai_ws = None
         self.openai_task = None
         self.history = history or [] # 대화 히스토리 저장
+        # [History Compaction] 앞부분 요약(세션 행 캐시) + 원문으로 재생할 최근 메시지 수
+        self.history_summary = history_summary
+        self.history_keep_last = history_keep_last
+
+        # [Warm Standby] 턴 상태 (연결 교체는 턴 경계에서만 수행)
+        self.standby_task = None
+        self._response_active = False
+        self._user_speaking = False
+        self._transcription_pending = False
+        self._turn_state_changed = asyncio.Event()
+
+        # [Session Registry] 자막이 추가될 때마다 호출 (다른 워커의 힌트 생성용 컨텍스트 게시)
+        self.on_context_update = on_context_update
+
+        # [Backpressure] 클라이언트 전송은 전용 writer 태스크가 처리 (느린 클라이언트가 OpenAI 수신을 막지 않도록)
+        self.outbound = ClientSendQueue(self._write_to_client, logger=logger, **send_queue_options_from_env())
 
     async def start(self):
         """[메인 실행 루프]"""
         try:
+            self.outbound.start()
+
             # 1. 초기 연결
             await self.connect_to_openai()
 
@@ -67,10 +126,24 @@ class ConnectionHandler:
             # 반환값 전달 (Session Report)
             return await self.cleanup()  
 
+    async def _write_to_client(self, payload):
+        """[Writer] 큐에서 꺼낸 메시지를 실제 클라이언트 소켓으로 전송"""
+        if isinstance(payload, str):
+            await self.client_ws.send_text(payload)
+        else:
+            await self.client_ws.send_json(payload)
+
+    async def send_to_client(self, payload, droppable: bool = False):
+        """
+        클라이언트 전송 큐에 메시지를 넣습니다.
+        droppable=True (오디오 델타)인 메시지는 클라이언트가 밀릴 때 오래된 것부터 버려집니다.
+        """
+        await self.outbound.put(payload, droppable=droppable)
+
     async def send_error_to_client(self, code: str, message: str):
         """클라이언트에게 에러 메시지 전송"""
         try:
-            await self.client_ws.send_json({
+            await self.send_to_client({
                 "type": "error",
                 "code": code,
                 "message": message
@@ -88,36 +161,55 @@ class ConnectionHandler:
         )
 
 
-    async def connect_to_openai(self):
-        """OpenAI 연결 및 수신 태스크 시작"""
-        try:
-            if self.openai_ws:
-                await self.openai_ws.close()
-            
-            self.openai_ws = await websockets.connect(
+    async def _open_upstream(self, session_update: str):
+        """
+        OpenAI 연결을 열고 세션 설정 + 압축된 히스토리까지 주입합니다.
+
+        Returns:
+            (연결된 소켓, 주입 시점의 tracker 메시지 수)
+        """
+        # [Upstream Pool] 미리 연결해 둔 소켓이 있으면 핸드셰이크 없이 바로 사용
+        openai_ws = await claim_upstream(OPENAI_REALTIME_API_URL, self.api_key)
+        if openai_ws is None:
+            openai_ws = await websockets.connect(
                 OPENAI_REALTIME_API_URL,
                 additional_headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "OpenAI-Beta": "realtime=v1"
                 }
             )
-            logger.info("OpenAI Realtime API에 연결되었습니다.")
-            
+        try:
+            await openai_ws.send(session_update)
+
+            # 히스토리 주입 (요약 1개 + 최근 N개만 재생하여 재연결 시간을 대화 길이와 무관하게 유지)
+            primed_count = len(self.tracker.messages)
+            full_history = self.history + self.tracker.messages
+            if full_history:
+                summary_text, recent = compact_history(full_history, self.history_summary, self.history_keep_last)
+                await self.conversation_manager.inject_history(recent, summary=summary_text, openai_ws=openai_ws)
+        except Exception:
+            await openai_ws.close()
+            raise
+        return openai_ws, primed_count
+
+    async def connect_to_openai(self):
+        """OpenAI 연결 및 수신 태스크 시작"""
+        try:
+            if self.openai_ws:
+                await self.openai_ws.close()
+
             # 세션 초기화 (컨텍스트 전달 & 보이스 오버라이드)
             override_config = {}
             if self.voice:
                 override_config["voice"] = self.voice
-                
-            await self.conversation_manager.initialize_session(
-                self.openai_ws, 
+
+            session_update = self.conversation_manager.build_session_update(
                 context=self.context,
                 override_config=override_config
             )
-            
-            # 히스토리 주입
-            full_history = self.history + self.tracker.messages
-            if full_history:
-                await self.conversation_manager.inject_history(full_history)
+            self.openai_ws, _ = await self._open_upstream(session_update)
+            self.conversation_manager.openai_ws = self.openai_ws
+            logger.info("OpenAI Realtime API에 연결되었습니다.")
 
             # [Stable Start] 설정 적용될 시간 확보 (Minimized to 0.1s)
             await asyncio.sleep(0.1)
@@ -148,13 +240,13 @@ class ConnectionHandler:
             if self.openai_task and not self.openai_task.done():
                 self.openai_task.cancel()
             
-            self.openai_task = asyncio.create_task(self.receive_from_openai())
+            self.openai_task = asyncio.create_task(self.receive_from_openai(self.openai_ws))
 
         except Exception as e:
             logger.error(f"OpenAI 연결 실패: {e}")
 
     async def reconnect_to_openai(self):
-        """세션 재연결 (설정 변경 시 사용)"""
+        """세션 재연결 (Warm Standby 교체에 실패했을 때의 대체 경로)"""
         logger.info("OpenAI 세션을 재연결합니다 (Voice 변경 적용)...")
         # 기존 태스크 정리
         if self.openai_task:
@@ -166,6 +258,91 @@ class ConnectionHandler:
         
         await self.connect_to_openai()
 
+    def request_upstream_switch(self):
+        """
+        [Warm Standby]
+        설정 변경(Voice)을 새 OpenAI 연결로 옮깁니다. (논블로킹)
+        기존 연결은 교체 직전까지 계속 오디오를 중계하므로 끊김이 없습니다.
+        진행 중인 교체가 있으면 취소하고 최신 설정으로 다시 준비합니다.
+        """
+        if self.standby_task and not self.standby_task.done():
+            self.standby_task.cancel()
+        self.standby_task = asyncio.create_task(self._switch_upstream())
+
+    def _at_turn_boundary(self, ignore_transcription: bool = False) -> bool:
+        """AI 응답 중도, 사용자 발화 중도 아니고 사용자 전사도 끝난 상태"""
+        if self._response_active or self._user_speaking:
+            return False
+        return ignore_transcription or not self._transcription_pending
+
+    def _set_turn_state(self, **state):
+        for key, value in state.items():
+            setattr(self, f"_{key}", value)
+        self._turn_state_changed.set()
+
+    async def _switch_upstream(self):
+        """
+        1. 새 연결을 열어 현재 설정 + 압축 히스토리로 준비 (기존 연결은 그대로 동작)
+        2. 턴 경계가 될 때까지 대기
+        3. 준비 이후 추가된 대화만 새 연결에 주입하고 소켓/수신 태스크를 한 번에 교체
+        """
+        started = time.perf_counter()
+        standby_ws = None
+        try:
+            standby_ws, primed_count = await self._open_upstream(self.conversation_manager.current_session_update())
+            primed = time.perf_counter()
+
+            grace_deadline = primed + UPSTREAM_SWITCH_TRANSCRIPTION_GRACE_SEC
+            while not self._at_turn_boundary(ignore_transcription=time.perf_counter() >= grace_deadline):
+                self._turn_state_changed.clear()
+                timeout = max(grace_deadline - time.perf_counter(), 0.05)
+                try:
+                    await asyncio.wait_for(self._turn_state_changed.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+            boundary = time.perf_counter()
+
+            # 준비 중에 끝난 턴(자막)을 새 연결에도 반영
+            for event in build_history_events(None, self.tracker.messages[primed_count:]):
+                await standby_ws.send(event)
+
+            old_ws, old_task = self.openai_ws, self.openai_task
+            self.openai_ws = standby_ws
+            self.conversation_manager.openai_ws = standby_ws
+            self.openai_task = asyncio.create_task(self.receive_from_openai(standby_ws))
+            standby_ws = None
+        except asyncio.CancelledError:
+            if standby_ws:
+                await standby_ws.close()
+            raise
+        except Exception as e:
+            logger.error(f"Warm standby 준비 실패, 전체 재연결로 전환: {e}")
+            upstream_switch_metrics.record_failure()
+            if standby_ws:
+                await standby_ws.close()
+            await self.reconnect_to_openai()
+            return
+
+        # 기존 연결 종료 (수신 루프는 소켓이 닫히면 조용히 끝남)
+        if old_ws:
+            try:
+                await old_ws.close()
+            except Exception:
+                pass
+        if old_task and old_task is not asyncio.current_task():
+            old_task.cancel()
+
+        finished = time.perf_counter()
+        upstream_switch_metrics.record(
+            prime_ms=(primed - started) * 1000,
+            wait_ms=(boundary - primed) * 1000,
+            total_ms=(finished - started) * 1000,
+        )
+        logger.info(
+            f"OpenAI 연결 교체 완료 (voice={self.voice}) - 준비 {(primed - started) * 1000:.0f}ms, "
+            f"턴 경계 대기 {(boundary - primed) * 1000:.0f}ms"
+        )
+
     async def receive_from_client(self):
         """[Client -> Server 메시지 루프]"""
         try:
@@ -208,7 +385,8 @@ class ConnectionHandler:
                                 self.voice = new_config["voice"]
                                 logger.info(f"Voice setting updated to: {self.voice}")
 
-                            await self.reconnect_to_openai()
+                            # 새 연결을 미리 준비해 두고 턴 경계에서 교체 (기존 연결은 계속 중계)
+                            self.request_upstream_switch()
 
                 elif data.get("type") == "disconnect":
                     logger.info("클라이언트로부터 연결 종료 요청 수신")
@@ -219,24 +397,26 @@ class ConnectionHandler:
         except Exception as e:
             logger.error(f"클라이언트 읽기 오류: {e}")
 
-    async def receive_from_openai(self):
-        """[OpenAI -> Client 중계 루프]"""
+    async def receive_from_openai(self, openai_ws=None):
+        """[OpenAI -> Client 중계 루프] (openai_ws: 이 루프가 담당하는 연결)"""
+        openai_ws = openai_ws or self.openai_ws
         try:
-            async for message in self.openai_ws:
+            async for message in openai_ws:
+                # 연결이 교체된 뒤 남은 이벤트는 버림
+                if openai_ws is not self.openai_ws:
+                    break
+
+                # [Fast Path] 오디오 델타(트래픽 대부분)는 파싱 없이 type만 바꿔서 바로 전달
+                audio_frame = rewrite_audio_delta_frame(message)
+                if audio_frame is not None:
+                    await self.send_to_client(audio_frame, droppable=True)
+                    continue
+
+                # 트래커/설정에 필요한 컨트롤 이벤트만 전체 파싱
                 event = json.loads(message)
                 event_type = event.get("type")
-                
-                # 로그 필터링 (디버깅을 위해 일시 해제)
-                # if event_type not in ["response.audio.delta", "response.audio_transcript.delta"]:
-                #    pass
-                
-                # 모든 이벤트 로그 출력 (너무 많으면 나중에 다시 필터링)
-                print(f"[OpenAI Event] {event_type}") 
-                pass # print는 주석처리하고 필요한 중요 로그만 아래에서 처리하도록 내버려두거나,
-                     # 아니면 디버깅을 위해 다 찍어볼 수도 있음. 
-                     # 여기서는 사용자가 원인 파악을 원하므로 'Warning' 이상이나 'Error'는 무조건 찍히게 되어있지만,
-                     # RateLimit 같은 걸 보려면 다 찍는 게 좋음.
-                     
+                logger.debug(f"[OpenAI Event] {event_type}")
+
                 if event_type == "error":
                     logger.error(f"OpenAI 오류 발생: {json.dumps(event, ensure_ascii=False)}")
                 
@@ -246,43 +426,55 @@ class ConnectionHandler:
                     # 기본값 로그는 헷갈리므로 생략하거나 명확히 표시
                     logger.debug(f"OpenAI 기본 세션 생성됨: {event.get('session', {}).get('voice')}")
                 
+                elif event_type == "response.created":
+                    self._set_turn_state(response_active=True)
+                elif event_type == "response.done":
+                    self._set_turn_state(response_active=False)
+                elif event_type == "conversation.item.input_audio_transcription.failed":
+                    self._set_turn_state(transcription_pending=False)
+
                 elif event_type == "session.updated":
                     logger.info(f"OpenAI 세션 설정 업데이트 완료: {event.get('session', {}).get('voice')}")
                 
                 elif event_type == "response.audio.delta":
-                    await self.client_ws.send_json({
+                    await self.send_to_client({
                         "type": "audio.delta",
                         "delta": event["delta"]
-                    })
+                    }, droppable=True)
                 elif event_type == "response.audio.done":
-                     await self.client_ws.send_json({"type": "audio.done"})
+                     await self.send_to_client({"type": "audio.done"})
                 elif event_type == "response.audio_transcript.done":
                     # 텍스트 자막
-                    await self.client_ws.send_json({
+                    await self.send_to_client({
                         "type": "transcript.done",
                         "transcript": event["transcript"]
                     })
                     # [Tracker] AI 응답 자막 기록
                     self.tracker.add_transcript("assistant", event["transcript"])
+                    self._notify_context_update()
                 elif event_type == "input_audio_buffer.speech_started":
                     logger.info("VAD가 발화 시작을 감지함")
-                    await self.client_ws.send_json({"type": "speech.started"})
+                    await self.send_to_client({"type": "speech.started"})
                     # [Tracker] 사용자 발화 시작
                     self.tracker.start_user_speech()
+                    self._set_turn_state(user_speaking=True)
 
                 elif event_type == "input_audio_buffer.speech_stopped":
                     # [Tracker] 사용자 발화 종료 (VAD)
                     self.tracker.stop_user_speech()
-                    await self.client_ws.send_json({"type": "speech.stopped"})
+                    self._set_turn_state(user_speaking=False, transcription_pending=True)
+                    await self.send_to_client({"type": "speech.stopped"})
                 elif event_type == "conversation.item.input_audio_transcription.completed":
                     transcript = event.get("transcript", "")
                     logger.info(f"사용자 자막: {transcript}")
-                    await self.client_ws.send_json({
+                    await self.send_to_client({
                         "type": "user.transcript",
                         "transcript": transcript
                     })
                     # [Tracker] 사용자 자막 기록 & WPM 분석
                     wpm_status = self.tracker.add_transcript("user", transcript)
+                    self._set_turn_state(transcription_pending=False)
+                    self._notify_context_update()
                     
                     # [Manager] 발화 속도에 따라 스타일 업데이트 (비동기 호출)
                     await self.conversation_manager.update_speaking_style(wpm_status)
@@ -290,23 +482,30 @@ class ConnectionHandler:
                     logger.error(f"OpenAI 오류: {event.get('error')}")
 
         except Exception as e:
+            if openai_ws is not self.openai_ws:
+                return  # 교체되어 닫힌 이전 연결
             logger.error(f"OpenAI 수신 루프 중지됨: {e}")
             await self.handle_openai_disconnect(str(e))
         finally:
             # 정상적으로 루프가 끝난 경우에도 연결이 끊긴 것으로 간주
-            if self.openai_ws:
-                try:
-                    await self.openai_ws.close()
-                except Exception:
-                    pass
+            try:
+                await openai_ws.close()
+            except Exception:
+                pass
 
 
     async def cleanup(self):
         """자원 정리"""
+        if self.standby_task and not self.standby_task.done():
+            self.standby_task.cancel()
         if self.openai_task:
             self.openai_task.cancel()
         if self.openai_ws:
             await self.openai_ws.close()
+
+        # 큐에 남은 메시지를 먼저 흘려보낸 뒤 writer 종료
+        await self.outbound.close()
+        logger.info(f"클라이언트 전송 큐 통계: {self.outbound.stats()}")
             
         # [Tracker] 세션 종료 및 리포트 생성 (전송 & 반환)
         if hasattr(self, 'tracker'):
@@ -327,6 +526,15 @@ class ConnectionHandler:
             return report
         return None
 
+    def _notify_context_update(self):
+        """컨텍스트 변경 알림 (콜백 오류가 중계 루프를 멈추지 않도록 격리)"""
+        if self.on_context_update is None:
+            return
+        try:
+            self.on_context_update(self)
+        except Exception as e:
+            logger.error(f"Context update callback failed: {e}")
+
     def get_transcript_context(self, limit: int = 10) -> list:
         """
         [Hint Generation]
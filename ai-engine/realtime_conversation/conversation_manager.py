@@ -3,6 +3,8 @@ import json
 import logging
 import os
 
+from .history_compactor import build_history_events
+
 logger = logging.getLogger(__name__)
 
 class ConversationManager:
@@ -110,19 +112,15 @@ class ConversationManager:
         # 현재 설정에 즉시 반영 (아직 초기화 전이라면 이 값이 initialize_session때 사용됨)
         self.current_config["instructions"] = self._assemble_instructions()
 
-    async def initialize_session(self, openai_ws, context: dict = None, override_config: dict = None):
+    def build_session_update(self, context: dict = None, override_config: dict = None) -> str:
         """
-        OpenAI 세션을 초기화합니다.
-        기본 설정(Default)에 오버라이드 설정(User Preference)을 적용하여 전송합니다.
-        
+        세션 초기화용 session.update 이벤트를 만듭니다. (전송하지 않음)
+        기본 설정(Default)에 오버라이드 설정(User Preference)을 적용합니다.
+
         Args:
-            openai_ws: WebSocket connection to OpenAI
             context (dict): Optional session context data (title, place, etc.)
             override_config (dict): Optional configuration overrides (e.g., {"voice": "shimmer"})
         """
-        self.openai_ws = openai_ws # 웹소켓 객체 저장 (나중에 업데이트 할 때 사용)
-        
-        # [New] 세션 컨텍스트 주입 (if provided)
         # [New] 세션 컨텍스트 주입 (기본값 적용을 위해 항상 호출)
         self.inject_session_context(context)
             
@@ -143,48 +141,58 @@ class ConversationManager:
         # 현재 저장된 설정값 로그 출력
         logger.info(f"세션 초기화 시작. 적용할 설정: {json.dumps(self.current_config, ensure_ascii=False)}")
 
-        session_config = {
+        return json.dumps({
             "type": "session.update",
             "session": self.current_config
-        }
+        })
+
+    def current_session_update(self) -> str:
+        """
+        현재 설정(클라이언트 변경 사항 포함) 그대로의 session.update 이벤트
+        (진행 중인 세션을 새 연결로 옮길 때 사용 - 기본값으로 되돌리지 않음)
+        """
+        self.current_config["instructions"] = self._assemble_instructions()
+        return json.dumps({
+            "type": "session.update",
+            "session": self.current_config
+        })
+
+    async def initialize_session(self, openai_ws, context: dict = None, override_config: dict = None):
+        """
+        OpenAI 세션을 초기화합니다.
+        build_session_update로 만든 설정을 전송하고, 이후 업데이트를 보낼 소켓으로 저장합니다.
         
-        await openai_ws.send(json.dumps(session_config))
+        Args:
+            openai_ws: WebSocket connection to OpenAI
+            context (dict): Optional session context data (title, place, etc.)
+            override_config (dict): Optional configuration overrides (e.g., {"voice": "shimmer"})
+        """
+        self.openai_ws = openai_ws # 웹소켓 객체 저장 (나중에 업데이트 할 때 사용)
+        await openai_ws.send(self.build_session_update(context, override_config))
         logger.info("-> session.update 전송 완료 (초기화)")
 
-    async def inject_history(self, messages: list):
+    async def inject_history(self, messages: list, summary: str = None, openai_ws=None):
         """
         이전 대화 기록을 OpenAI 세션에 주입합니다.
-        
+        이벤트를 미리 직렬화해 두고 응답을 기다리지 않고 연달아 전송합니다.
+        (긴 히스토리는 호출 전에 compact_history로 요약 1개 + 최근 N개로 줄여서 전달)
+
         Args:
             messages (list): [{role: 'user'|'assistant', content: '...'}, ...] 형태의 리스트
+            summary (str): 앞부분 대화 요약 (있으면 system 아이템으로 먼저 주입)
+            openai_ws: 주입 대상 소켓 (기본: 현재 세션 소켓, 교체 대기 중인 소켓을 준비할 때 지정)
         """
-        if not self.openai_ws:
+        openai_ws = openai_ws or self.openai_ws
+        if not openai_ws:
             logger.warning("OpenAI WebScoket이 연결되지 않아 히스토리를 주입할 수 없습니다.")
             return
 
-        logger.info(f"대화 히스토리 주입 시작 ({len(messages)}건)")
-        
-        for msg in messages:
-            # role 매핑 ('user' -> 'user', 'assistant' -> 'assistant')
-            # system 메시지는 보통 제외하거나 session instructions에 녹임
-            if msg['role'] not in ['user', 'assistant']:
-                continue
-                
-            item_event = {
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "message",
-                    "role": msg['role'],
-                    "content": [
-                        {
-                            "type": "input_text" if msg['role'] == "user" else "text",
-                            "text": msg['content']
-                        } 
-                    ]
-                }
-            }
-            await self.openai_ws.send(json.dumps(item_event))
-            
+        events = build_history_events(summary, messages)
+        logger.info(f"대화 히스토리 주입 시작 ({len(events)}건, 요약 포함: {bool(summary)})")
+
+        for event in events:
+            await openai_ws.send(event)
+
         logger.info("-> 대화 히스토리 주입 완료")
 
     def _assemble_instructions(self) -> str:
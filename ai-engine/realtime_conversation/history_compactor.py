@@ -0,0 +1,158 @@
+import json
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 원문 그대로 재생하는 최근 메시지 수
+HISTORY_KEEP_MESSAGES = 12
+# 캐시된 요약이 없을 때 오래된 대화를 압축하는 텍스트의 최대 길이
+FALLBACK_SUMMARY_MAX_CHARS = 1500
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You maintain a running summary of an English learning conversation between a Learner and a Tutor. "
+    "Update the previous summary with the new turns. Keep facts the tutor needs to continue naturally: "
+    "topics discussed, decisions made, names, numbers and the learner's recurring mistakes. "
+    "Write at most 8 short English sentences."
+)
+
+
+@dataclass
+class HistorySummary:
+    """
+    [History Summary]
+    대화 앞부분 message_count개 메시지를 요약한 텍스트 (세션 행에 캐시)
+    """
+    text: str
+    message_count: int
+
+
+def _dialogue_messages(messages: list) -> list:
+    return [msg for msg in messages if msg.get("role") in ("user", "assistant")]
+
+
+def _format_lines(messages: list) -> str:
+    return "\n".join(
+        f"{'Learner' if msg['role'] == 'user' else 'Tutor'}: {msg.get('content', '')}"
+        for msg in messages
+    )
+
+
+def condense_messages(messages: list, max_chars: int = FALLBACK_SUMMARY_MAX_CHARS) -> str:
+    """
+    LLM 요약 없이 오래된 대화를 한 덩어리 텍스트로 압축합니다. (최근 쪽을 우선 보존)
+    """
+    text = _format_lines(messages)
+    if len(text) <= max_chars:
+        return text
+    return "..." + text[-max_chars:]
+
+
+def compact_history(
+    messages: list,
+    summary: Optional[HistorySummary] = None,
+    keep_last: int = HISTORY_KEEP_MESSAGES,
+) -> Tuple[Optional[str], list]:
+    """
+    [History Compaction]
+    최근 keep_last개 메시지만 원문으로 남기고, 그 앞은 요약 1개로 접습니다.
+    재생 이벤트 수가 대화 길이와 무관하게 최대 keep_last + 1개로 고정됩니다.
+
+    - 캐시된 요약(summary)이 앞부분을 덮으면 그대로 사용
+    - 요약이 뒤처졌으면(덮지 못한 구간이 있으면) 그 구간만 condense_messages로 덧붙임
+    - 요약이 없으면 앞부분 전체를 condense_messages로 압축
+
+    Returns:
+        (요약 텍스트 or None, 원문으로 재생할 메시지 리스트)
+    """
+    messages = _dialogue_messages(messages)
+    if len(messages) <= keep_last:
+        return None, messages
+
+    fold_until = len(messages) - keep_last
+    recent = messages[fold_until:]
+
+    if summary and summary.text and 0 < summary.message_count <= len(messages):
+        covered = min(summary.message_count, fold_until)
+        summary_text = summary.text
+        if covered < fold_until:
+            summary_text += "\n\nLater turns:\n" + condense_messages(messages[covered:fold_until])
+        return summary_text, recent
+
+    return condense_messages(messages[:fold_until]), recent
+
+
+def build_history_events(summary_text: Optional[str], messages: list) -> List[str]:
+    """
+    히스토리 재생용 conversation.item.create 이벤트를 미리 직렬화합니다.
+    """
+    events = []
+    if summary_text:
+        events.append(json.dumps({
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": "system",
+                "content": [{
+                    "type": "input_text",
+                    "text": f"[Summary of the earlier conversation]\n{summary_text}",
+                }],
+            },
+        }))
+    for msg in _dialogue_messages(messages):
+        events.append(json.dumps({
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": msg["role"],
+                "content": [{
+                    "type": "input_text" if msg["role"] == "user" else "text",
+                    "text": msg["content"],
+                }],
+            },
+        }))
+    return events
+
+
+async def summarize_history(
+    client,
+    model: str,
+    messages: list,
+    previous: Optional[HistorySummary] = None,
+    keep_last: int = HISTORY_KEEP_MESSAGES,
+    offset: int = 0,
+) -> Optional[HistorySummary]:
+    """
+    최근 keep_last개를 제외한 앞부분을 LLM으로 요약합니다. (세션 종료 후 백그라운드에서 호출)
+    이전 요약이 있으면 그 뒤에 추가된 구간만 요약에 반영합니다.
+
+    Args:
+        client: AsyncOpenAI 클라이언트
+        offset: messages 앞에서 생략된 대화 메시지 수 (이전 요약이 덮는 구간은 불러오지 않아도 됨)
+
+    Returns:
+        갱신된 요약. 접을 구간이 없거나 이미 최신이면 None
+    """
+    messages = _dialogue_messages(messages)
+    fold_until = offset + len(messages) - keep_last
+    covered = previous.message_count if previous and previous.text else 0
+    if fold_until <= 0 or covered >= fold_until:
+        return None
+    if covered < offset:
+        raise ValueError(f"offset({offset}) must not exceed the summarized message count({covered})")
+
+    new_turns = _format_lines(messages[covered - offset:fold_until - offset])
+    user_prompt = f"Previous summary:\n{previous.text if covered else '(none)'}\n\nNew turns:\n{new_turns}"
+    response = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ],
+    )
+    text = (response.choices[0].message.content or "").strip()
+    if not text:
+        return None
+    logger.info(f"히스토리 요약 갱신: 메시지 {covered} -> {fold_until}개")
+    return HistorySummary(text=text, message_count=fold_until)
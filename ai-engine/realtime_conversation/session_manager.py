@@ -1,26 +1,86 @@
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, Optional, Protocol, TYPE_CHECKING
+import asyncio
 import logging
+from datetime import datetime, timezone
 
 if TYPE_CHECKING:
     from .connection_handler import ConnectionHandler
 
 logger = logging.getLogger(__name__)
 
+# 공유 컨텍스트에 싣는 최근 메시지 수 (힌트 생성용)
+CONTEXT_MESSAGE_LIMIT = 10
+
+
+class SessionContextStore(Protocol):
+    """
+    세션별 대화 컨텍스트 저장소 인터페이스
+    여러 워커 프로세스가 같은 저장소를 보면 어느 워커에서든 힌트를 생성할 수 있습니다.
+    """
+    async def put(self, session_id: str, context: dict) -> None: ...
+    async def get(self, session_id: str) -> Optional[dict]: ...
+    async def delete(self, session_id: str) -> None: ...
+
+
+class InMemorySessionContextStore:
+    """
+    [기본 저장소] 프로세스 로컬 dict (단일 워커 / 테스트용)
+    """
+    def __init__(self):
+        self._contexts: Dict[str, dict] = {}
+
+    async def put(self, session_id: str, context: dict) -> None:
+        self._contexts[session_id] = context
+
+    async def get(self, session_id: str) -> Optional[dict]:
+        return self._contexts.get(session_id)
+
+    async def delete(self, session_id: str) -> None:
+        self._contexts.pop(session_id, None)
+
+
+def build_session_context(handler: 'ConnectionHandler', limit: int = CONTEXT_MESSAGE_LIMIT) -> dict:
+    """
+    핸들러 상태를 공유용 컨텍스트(최근 메시지 + 시나리오 컨텍스트)로 요약합니다.
+    """
+    messages = [
+        {"role": msg.get("role"), "content": msg.get("content")}
+        for msg in handler.get_transcript_context(limit=limit)
+    ]
+    return {
+        "messages": messages,
+        "context": getattr(handler, "context", None),
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 class SessionManager:
     """
-    [In-Memory Session Manager]
+    [Session Registry]
     실시간으로 진행 중인 WebSocket 세션(ConnectionHandler)을 관리합니다.
     싱글톤 패턴으로 동작하여 어디서든 동일한 인스턴스에 접근할 수 있습니다.
+
+    - 핸들러 객체는 WebSocket을 가진 프로세스에만 존재 (active_sessions)
+    - 대화 컨텍스트는 context_store에 게시되어 다른 워커에서도 조회 가능
+      (set_context_store로 공유 저장소를 주입, 기본은 프로세스 로컬)
     """
     _instance = None
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(SessionManager, cls).__new__(cls)
             cls._instance.active_sessions: Dict[str, 'ConnectionHandler'] = {}
+            cls._instance.context_store: SessionContextStore = InMemorySessionContextStore()
+            cls._instance._pending_contexts: Dict[str, dict] = {}
+            cls._instance._publishers: Dict[str, asyncio.Task] = {}
             logger.info("SessionManager initialized")
         return cls._instance
 
+    def set_context_store(self, store: SessionContextStore):
+        """공유 컨텍스트 저장소 교체 (앱 시작 시 1회)"""
+        self.context_store = store
+        logger.info(f"SessionManager context store: {type(store).__name__}")
+
     def add_session(self, session_id: str, handler: 'ConnectionHandler'):
         """세션 등록"""
         if session_id in self.active_sessions:
@@ -29,11 +89,59 @@ class SessionManager:
         logger.info(f"Session {session_id} registered. Total active: {len(self.active_sessions)}")
 
     def remove_session(self, session_id: str):
-        """세션 제거"""
+        """세션 제거 (로컬 핸들러만, 공유 컨텍스트는 discard_session 사용)"""
         if session_id in self.active_sessions:
             del self.active_sessions[session_id]
             logger.info(f"Session {session_id} removed. Total active: {len(self.active_sessions)}")
 
+    async def discard_session(self, session_id: str):
+        """세션 제거 + 게시 중인 컨텍스트 정리"""
+        self.remove_session(session_id)
+        self._pending_contexts.pop(session_id, None)
+        publisher = self._publishers.pop(session_id, None)
+        if publisher:
+            publisher.cancel()
+            try:
+                await publisher
+            except (asyncio.CancelledError, Exception):
+                pass
+        try:
+            await self.context_store.delete(session_id)
+        except Exception as e:
+            logger.error(f"Session {session_id} context delete failed: {e}")
+
     def get_session(self, session_id: str) -> Optional['ConnectionHandler']:
-        """세션(핸들러) 조회"""
+        """세션(핸들러) 조회 - 이 프로세스에 연결된 세션만"""
         return self.active_sessions.get(session_id)
+
+    def publish_context(self, session_id: str, context: dict):
+        """
+        세션 컨텍스트를 공유 저장소에 게시합니다. (논블로킹)
+        쓰기가 진행 중이면 최신 컨텍스트만 남겨 두었다가 이어서 한 번 더 씁니다.
+        """
+        self._pending_contexts[session_id] = context
+        publisher = self._publishers.get(session_id)
+        if publisher is None or publisher.done():
+            self._publishers[session_id] = asyncio.create_task(self._publish_loop(session_id))
+
+    async def _publish_loop(self, session_id: str):
+        while session_id in self._pending_contexts:
+            context = self._pending_contexts.pop(session_id)
+            try:
+                await self.context_store.put(session_id, context)
+            except Exception as e:
+                logger.error(f"Session {session_id} context publish failed: {e}")
+
+    async def get_context(self, session_id: str) -> Optional[dict]:
+        """
+        세션 컨텍스트 조회
+        이 프로세스에 핸들러가 있으면 바로 요약하고, 없으면 공유 저장소에서 읽습니다.
+        """
+        handler = self.get_session(session_id)
+        if handler is not None:
+            return build_session_context(handler)
+        try:
+            return await self.context_store.get(session_id)
+        except Exception as e:
+            logger.error(f"Session {session_id} context lookup failed: {e}")
+            return None
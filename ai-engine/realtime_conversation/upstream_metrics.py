@@ -0,0 +1,51 @@
+import threading
+from typing import Dict
+
+
+class UpstreamSwitchMetrics:
+    """
+    [Upstream Switch Metrics]
+    보이스 변경 등으로 OpenAI 연결을 교체한 시간 통계 (프로세스 전체)
+
+    - prime_ms: 새 연결 + 세션 설정 + 히스토리 주입까지 (기존 연결은 계속 동작)
+    - wait_ms: 준비 완료 후 턴 경계(응답/발화 종료)까지 기다린 시간
+    - total_ms: 요청부터 교체 완료까지
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.switches = 0
+            self.failures = 0
+            self._sums = {"prime_ms": 0.0, "wait_ms": 0.0, "total_ms": 0.0}
+            self._max = {"prime_ms": 0.0, "wait_ms": 0.0, "total_ms": 0.0}
+            self.last: Dict[str, float] = {}
+
+    def record(self, prime_ms: float, wait_ms: float, total_ms: float):
+        sample = {"prime_ms": prime_ms, "wait_ms": wait_ms, "total_ms": total_ms}
+        with self._lock:
+            self.switches += 1
+            for key, value in sample.items():
+                self._sums[key] += value
+                self._max[key] = max(self._max[key], value)
+            self.last = {key: round(value, 1) for key, value in sample.items()}
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            count = self.switches
+            return {
+                "switches": count,
+                "failures": self.failures,
+                "avg": {key: round(value / count, 1) if count else 0.0 for key, value in self._sums.items()},
+                "max": {key: round(value, 1) for key, value in self._max.items()},
+                "last": dict(self.last),
+            }
+
+
+upstream_switch_metrics = UpstreamSwitchMetrics()
@@ -1,3 +1,11 @@
-from .hint_service import generate_hints
+from .hint_engine import HintEngine, transcript_tail_hash
 
-__all__ = ["generate_hints"]
+__all__ = ["HintEngine", "generate_hints", "generate_hints_async", "transcript_tail_hash"]
+
+
+def __getattr__(name):
+    # hint_service는 backend 설정(app.core.config)을 읽으므로 실제로 사용할 때 로드
+    if name in ("generate_hints", "generate_hints_async"):
+        from . import hint_service
+        return getattr(hint_service, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,117 @@
+"""
+hint_engine.py - 힌트 캐시 / 중복 요청 병합 / 선생성
+
+[역할]
+프론트엔드는 침묵이 5초 이어질 때마다 힌트를 요청하는데, 대화가 바뀌지 않았다면 매번 같은 LLM 호출이 됩니다.
+HintEngine은 (세션, 최근 대화 해시) 단위로 결과를 캐시하고, 같은 키의 동시 요청은 하나의 호출로 합칩니다.
+AI 응답 자막이 끝난 직후 prefetch로 미리 생성해 두면 침묵 후 요청은 캐시에서 바로 응답됩니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from scenario.ttl_cache import SingleFlightCache
+
+logger = logging.getLogger(__name__)
+
+# 힌트 생성에 사용하는 최근 메시지 수
+HINT_CONTEXT_MESSAGES = 5
+
+HintGenerator = Callable[[List[dict], Optional[dict]], Awaitable[List[str]]]
+HintKey = Tuple[str, str]  # (session_id, 대화 꼬리 해시)
+
+
+def transcript_tail_hash(messages: List[dict], context: Optional[dict] = None) -> str:
+    """최근 메시지(role/content) + 시나리오 컨텍스트의 해시 (대화가 바뀌면 키도 바뀜)"""
+    tail = [
+        [msg.get("role"), msg.get("content")]
+        for msg in messages[-HINT_CONTEXT_MESSAGES:]
+    ]
+    payload = json.dumps([tail, context], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class HintEngine:
+    """
+    [Hint Engine]
+    - 캐시: (session_id, 대화 꼬리 해시) -> 힌트. LRU + TTL, 빈 결과(생성 실패)는 캐시하지 않음
+    - 병합: 같은 키로 진행 중인 생성이 있으면 새로 호출하지 않고 그 결과를 기다림
+    - 선생성: prefetch는 백그라운드 태스크로 생성만 시작하고 바로 반환
+    """
+    def __init__(
+        self,
+        generator: HintGenerator,
+        max_entries: int = 1024,
+        ttl_sec: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._generator = generator
+        self._ttl = ttl_sec
+        self._clock = clock
+        self._cache: "SingleFlightCache[HintKey, List[str]]" = SingleFlightCache(max(max_entries, 1), clock)
+
+    @staticmethod
+    def make_key(session_id: str, messages: List[dict], context: Optional[dict] = None) -> HintKey:
+        return (session_id, transcript_tail_hash(messages, context))
+
+    def peek(self, key: HintKey) -> Optional[List[str]]:
+        """캐시된 힌트 조회 (없거나 만료되면 None)"""
+        return self._cache.peek(key)
+
+    def put(self, key: HintKey, hints: List[str]):
+        if not hints or self._ttl <= 0:
+            return
+        self._cache.put(key, hints, self._clock() + self._ttl)
+
+    async def get_hints(self, session_id: str, messages: List[dict], context: Optional[dict] = None) -> List[str]:
+        """
+        힌트 조회 (캐시 -> 진행 중인 생성 -> 새 생성 순)
+        """
+        messages = messages[-HINT_CONTEXT_MESSAGES:]
+        key = self.make_key(session_id, messages, context)
+        # 요청이 취소되어도 다른 대기자를 위해 생성은 계속 진행
+        try:
+            return await self._cache.get_or_load(key, self._loader(key, messages, context))
+        except asyncio.CancelledError:
+            # discard_session으로 생성이 취소된 경우는 빈 힌트 (요청 자체가 취소된 경우는 그대로 전파)
+            if not asyncio.current_task().cancelling():
+                return []
+            raise
+
+    def prefetch(self, session_id: str, messages: List[dict], context: Optional[dict] = None) -> Optional[asyncio.Task]:
+        """
+        힌트를 백그라운드에서 미리 생성합니다. (이미 캐시/생성 중이면 아무것도 하지 않음)
+        """
+        if not messages:
+            return None
+        messages = messages[-HINT_CONTEXT_MESSAGES:]
+        key = self.make_key(session_id, messages, context)
+        task = self._cache.inflight(key)
+        if task is not None:
+            return task
+        if self.peek(key) is not None:
+            return None
+        return self._cache.load(key, self._loader(key, messages, context))
+
+    def _loader(self, key: HintKey, messages: List[dict], context: Optional[dict]):
+        async def load() -> Tuple[List[str], Optional[float]]:
+            try:
+                hints = await self._generator(messages, context)
+            except Exception as e:
+                logger.error(f"힌트 생성 실패 (session={key[0]}): {e}")
+                hints = []
+            if not hints or self._ttl <= 0:
+                return hints, None
+            return hints, self._clock() + self._ttl
+        return load
+
+    def discard_session(self, session_id: str):
+        """세션 종료 시 해당 세션의 캐시 제거 + 진행 중인 생성 취소"""
+        self._cache.discard_where(lambda key: key[0] == session_id)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
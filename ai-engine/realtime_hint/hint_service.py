@@ -11,6 +11,7 @@ hint_service.py - 실시간 대화 힌트 생성 서비스
 - LangChain 제거, OpenAI SDK 직접 사용
 - LangSmith traceable 데코레이터로 트레이싱
 - 프롬프트는 hint_prompts.yaml에서 로드
+- generate_hints_async: 이벤트 루프를 막지 않는 비동기 버전 (HintEngine 캐시/중복 제거와 함께 사용)
 """
 
 import json
@@ -19,10 +20,11 @@ import os
 from pathlib import Path
 
 import yaml
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from langsmith import traceable, wrappers
 
 from app.core.config import settings
+from scenario.openai_clients import get_async_openai_client, get_client_registry, get_openai_client
 
 # LangSmith 트레이싱 설정
 if settings.LANGCHAIN_TRACING_V2 and settings.LANGCHAIN_API_KEY:
@@ -38,6 +40,7 @@ PROMPTS_PATH = Path(__file__).parent / "hint_prompts.yaml"
 
 # OpenAI 클라이언트 (Lazy Initialization)
 _client = None
+_async_client = None
 _prompts = None
 
 
@@ -59,7 +62,8 @@ def _get_client() -> OpenAI:
     """OpenAI 클라이언트 Lazy Initialization (LangSmith 래핑)"""
     global _client
     if _client is None:
-        base_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        # 프로세스 공용 커넥션 풀을 공유하는 복사본 (LangSmith 래핑이 다른 서비스에 번지지 않도록)
+        base_client = get_openai_client(settings.OPENAI_API_KEY).with_options()
         # LangSmith 트레이싱이 활성화된 경우 래핑
         if settings.LANGCHAIN_TRACING_V2 and settings.LANGCHAIN_API_KEY:
             _client = wrappers.wrap_openai(base_client)
@@ -68,6 +72,18 @@ def _get_client() -> OpenAI:
     return _client
 
 
+def _get_async_client() -> AsyncOpenAI:
+    """AsyncOpenAI 클라이언트 Lazy Initialization (LangSmith 래핑)"""
+    global _async_client
+    if _async_client is None:
+        base_client = get_async_openai_client(settings.OPENAI_API_KEY).with_options()
+        if settings.LANGCHAIN_TRACING_V2 and settings.LANGCHAIN_API_KEY:
+            _async_client = wrappers.wrap_openai(base_client)
+        else:
+            _async_client = base_client
+    return _async_client
+
+
 def _format_conversation(messages: list[dict]) -> str:
     """메시지 리스트를 대화 형식으로 변환"""
     lines = []
@@ -98,6 +114,34 @@ def _format_scenario_context(context: dict | None) -> str:
     return ""
 
 
+def _build_prompt_messages(messages: list[dict], context: dict | None) -> list[dict]:
+    """시스템/유저 프롬프트 구성"""
+    prompts = _load_prompts()
+
+    conversation_text = _format_conversation(messages)
+    scenario_context = _format_scenario_context(context)
+
+    system_template = prompts.get("hint_system", "")
+    user_template = prompts.get("hint_user", "{conversation}")
+
+    return [
+        {"role": "system", "content": system_template.format(scenario_context=scenario_context)},
+        {"role": "user", "content": user_template.format(conversation=conversation_text)},
+    ]
+
+
+def _parse_hints(result: str) -> list[str]:
+    """LLM 응답(JSON 배열)에서 힌트 최대 3개 추출"""
+    hints = json.loads(result)
+
+    if isinstance(hints, list) and len(hints) > 0:
+        logger.info(f"힌트 {len(hints)}개 생성 완료")
+        return hints[:3]  # 최대 3개
+
+    logger.warning("LLM 응답 파싱 실패, 빈 리스트 반환")
+    return []
+
+
 @traceable(name="generate_hints")
 def generate_hints(messages: list[dict], context: dict | None = None) -> list[str]:
     """
@@ -117,38 +161,47 @@ def generate_hints(messages: list[dict], context: dict | None = None) -> list[st
         return []
 
     try:
-        prompts = _load_prompts()
         client = _get_client()
 
-        conversation_text = _format_conversation(messages)
-        scenario_context = _format_scenario_context(context)
+        logger.info("LLM 호출 중...")
+        with get_client_registry().limit("hint"):
+            response = client.chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=_build_prompt_messages(messages, context),
+            )
+
+        return _parse_hints(response.choices[0].message.content)
 
-        system_template = prompts.get("hint_system", "")
-        user_template = prompts.get("hint_user", "{conversation}")
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON 파싱 오류: {e}")
+        return []
+    except Exception as e:
+        logger.error(f"힌트 생성 오류: {e}")
+        return []
 
-        system_prompt = system_template.format(scenario_context=scenario_context)
-        user_prompt = user_template.format(conversation=conversation_text)
 
-        logger.info("LLM 호출 중...")
-        response = client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-        )
+@traceable(name="generate_hints_async")
+async def generate_hints_async(messages: list[dict], context: dict | None = None) -> list[str]:
+    """
+    generate_hints의 비동기 버전 (AsyncOpenAI 사용, 이벤트 루프 블로킹 없음)
+    """
+    logger.info(f"힌트 생성 시작 (async) - 메시지 {len(messages)}개")
 
-        result = response.choices[0].message.content
+    if not messages:
+        logger.info("대화 내용 없음")
+        return []
 
-        # JSON 파싱
-        hints = json.loads(result)
+    try:
+        client = _get_async_client()
 
-        if isinstance(hints, list) and len(hints) > 0:
-            logger.info(f"힌트 {len(hints)}개 생성 완료")
-            return hints[:3]  # 최대 3개
+        logger.info("LLM 호출 중...")
+        async with get_client_registry().async_limit("hint"):
+            response = await client.chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=_build_prompt_messages(messages, context),
+            )
 
-        logger.warning("LLM 응답 파싱 실패, 빈 리스트 반환")
-        return []
+        return _parse_hints(response.choices[0].message.content)
 
     except json.JSONDecodeError as e:
         logger.error(f"JSON 파싱 오류: {e}")
@@ -1,20 +1,24 @@
 from .config import AppConfig
 from .fallbacks import build_realtime_error_handler
+from .audio_pacer import AudioPacer
 from .audio_relay import RealtimeAudioRelay
 from .factory import build_scenario_builder
-from .llm_client import OpenAIScenarioLLM
+from .llm_client import AsyncOpenAIScenarioLLM, OpenAIScenarioLLM
 from .logging_utils import configure_root, get_logger
+from .openai_clients import OpenAIClientRegistry, get_async_openai_client, get_client_registry, get_openai_client
 from .prompts import build_extraction_prompt, build_followup_prompt, build_final_prompt
 from .realtime_adapters import (
     build_audio_response_sender,
     build_response_create_sender,
     build_text_response_sender,
 )
-from .realtime_handlers import fanout_event_handler
+from .realtime_handlers import RealtimeEventRouter, fanout_event_handler
 from .realtime_pipeline import RealtimeScenarioPipeline
 from .realtime_session import RealtimeConfig, RealtimeSessionInfo, RealtimeSessionManager, RealtimeWebSocketClient
 from .scenario_builder import ScenarioBuilder
 from .scenario_state import ScenarioState
+from .send_queue import ClientSendQueue
+from .tts_cache import TTSCache
 
 __all__ = [
     "AppConfig",
@@ -22,15 +26,24 @@ __all__ = [
     "ScenarioState",
     "RealtimeScenarioPipeline",
     "RealtimeAudioRelay",
+    "AudioPacer",
     "RealtimeConfig",
     "RealtimeSessionInfo",
     "RealtimeSessionManager",
     "RealtimeWebSocketClient",
+    "ClientSendQueue",
+    "TTSCache",
     "build_audio_response_sender",
     "build_text_response_sender",
     "build_response_create_sender",
     "fanout_event_handler",
+    "RealtimeEventRouter",
     "OpenAIScenarioLLM",
+    "AsyncOpenAIScenarioLLM",
+    "OpenAIClientRegistry",
+    "get_client_registry",
+    "get_openai_client",
+    "get_async_openai_client",
     "build_realtime_error_handler",
     "build_scenario_builder",
     "configure_root",
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+Clock = Callable[[], float]
+
+PCM16_BYTES_PER_SAMPLE = 2
+
+
+class AudioPacer:
+    """Wall-clock pacing for server-generated audio.
+
+    The pacer tracks the client playhead: the monotonic time at which all audio
+    sent so far will have finished playing. A chunk is released when the
+    playhead is within ``lead_ms`` of now, so the first ``lead_ms`` of every
+    utterance goes out immediately and later chunks follow real time without
+    accumulating send or scheduling jitter.
+    """
+
+    def __init__(self, *, lead_ms: int = 300, clock: Clock = time.monotonic) -> None:
+        self._lead = max(lead_ms, 0) / 1000.0
+        self._clock = clock
+        self._playhead: Optional[float] = None
+        self._cancelled = asyncio.Event()
+        # Bumped by cancel(); audio queued under an older epoch belongs to an interrupted utterance.
+        self.epoch = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def buffered_seconds(self) -> float:
+        if self._playhead is None:
+            return 0.0
+        return max(self._playhead - self._clock(), 0.0)
+
+    async def wait_turn(self, duration_sec: float) -> bool:
+        """Wait until a chunk of ``duration_sec`` may be sent. Returns False after cancel()."""
+        if self._cancelled.is_set():
+            return False
+        epoch = self.epoch
+        now = self._clock()
+        if self._playhead is None or self._playhead < now:
+            self._playhead = now
+        delay = self._playhead - self._lead - now
+        if delay > 0:
+            try:
+                await asyncio.wait_for(self._cancelled.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            # A cancel() during the wait ends this utterance even if resume() already followed.
+            if self._cancelled.is_set() or self.epoch != epoch:
+                return False
+        self._playhead += max(duration_sec, 0.0)
+        return True
+
+    def cancel(self) -> None:
+        """Barge-in: stop the current utterance and forget the buffered playhead."""
+        self._cancelled.set()
+        self._playhead = None
+        self.epoch += 1
+
+    def resume(self) -> None:
+        self._cancelled.clear()
+
+
+def pcm16_duration(byte_count: int, sample_rate: int, channels: int = 1) -> float:
+    if sample_rate <= 0:
+        return 0.0
+    return byte_count / float(sample_rate * channels * PCM16_BYTES_PER_SAMPLE)
+
+
+def base64_decoded_length(encoded: str) -> int:
+    padding = 0
+    if encoded.endswith("=="):
+        padding = 2
+    elif encoded.endswith("="):
+        padding = 1
+    return (len(encoded) * 3) // 4 - padding
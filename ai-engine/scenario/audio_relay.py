@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import binascii
 from typing import Any, Awaitable, Callable, Optional, Union
 
+from .audio_pacer import AudioPacer, base64_decoded_length, pcm16_duration
 
 AudioChunkHandler = Callable[[bytes], Union[Awaitable[None], None]]
 AudioChunkBase64Handler = Callable[[str], Union[Awaitable[None], None]]
@@ -17,29 +19,61 @@ class RealtimeAudioRelay:
         on_audio_chunk: Optional[AudioChunkHandler] = None,
         on_audio_chunk_base64: Optional[AudioChunkBase64Handler] = None,
         on_transcript: Optional[TranscriptHandler] = None,
+        pacer: Optional[AudioPacer] = None,
+        sample_rate: int = 24000,
     ) -> None:
         self._on_audio_chunk = on_audio_chunk
         self._on_audio_chunk_base64 = on_audio_chunk_base64
         self._on_transcript = on_transcript
+        self._pacer = pacer
+        self._sample_rate = sample_rate
+        self._pending: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        self._writer: Optional[asyncio.Task] = None
+        self._routes = self.event_routes()
+
+    def event_routes(self) -> dict[str, Callable[[dict[str, Any]], Awaitable[None]]]:
+        """Event type -> handler, for subscribing to a RealtimeEventRouter."""
+        return {
+            "response.created": self._handle_response_created,
+            "response.audio.delta": self._handle_audio_delta,
+            "response.audio_transcript.delta": self._handle_transcript_delta,
+            "response.audio_transcript.done": self._handle_transcript_done,
+        }
 
     async def handle_event(self, event: dict[str, Any]) -> None:
-        event_type = event.get("type", "")
+        handler = self._routes.get(event.get("type", ""))
+        if handler is not None:
+            await handler(event)
 
-        if event_type == "response.audio.delta":
-            await self._handle_audio_delta(event)
-            return
-        if event_type == "response.audio.done":
-            return
-        if event_type == "response.audio_transcript.delta":
-            await self._handle_transcript(event, is_final=False)
-            return
-        if event_type == "response.audio_transcript.done":
-            await self._handle_transcript(event, is_final=True)
+    async def _handle_response_created(self, event: dict[str, Any]) -> None:
+        if self._pacer is not None:
+            self._pacer.resume()
 
     async def _handle_audio_delta(self, event: dict[str, Any]) -> None:
         chunk_base64 = event.get("delta") or event.get("audio")
         if not isinstance(chunk_base64, str) or not chunk_base64:
             return
+        if self._pacer is None:
+            await self._emit(chunk_base64)
+            return
+        # Paced chunks wait on the writer task so the receive loop keeps reading
+        # (speech_started must be able to cancel playback mid-utterance).
+        self._pending.put_nowait((self._pacer.epoch, chunk_base64))
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_paced())
+
+    async def _write_paced(self) -> None:
+        pacer = self._pacer
+        while True:
+            epoch, chunk_base64 = await self._pending.get()
+            if epoch != pacer.epoch:
+                continue
+            duration = pcm16_duration(base64_decoded_length(chunk_base64), self._sample_rate)
+            if not await pacer.wait_turn(duration):
+                continue
+            await self._emit(chunk_base64)
+
+    async def _emit(self, chunk_base64: str) -> None:
         if self._on_audio_chunk_base64 is not None:
             result = self._on_audio_chunk_base64(chunk_base64)
             if hasattr(result, "__await__"):
@@ -53,6 +87,23 @@ class RealtimeAudioRelay:
             if hasattr(result, "__await__"):
                 await result
 
+    async def close(self) -> None:
+        """Stop the paced writer and drop audio that has not been sent yet."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+        self._pending = asyncio.Queue()
+
+    async def _handle_transcript_delta(self, event: dict[str, Any]) -> None:
+        await self._handle_transcript(event, is_final=False)
+
+    async def _handle_transcript_done(self, event: dict[str, Any]) -> None:
+        await self._handle_transcript(event, is_final=True)
+
     async def _handle_transcript(self, event: dict[str, Any], *, is_final: bool) -> None:
         transcript = event.get("transcript_delta") or event.get("transcript")
         if not isinstance(transcript, str) or not transcript:
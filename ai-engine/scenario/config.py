@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -13,6 +14,14 @@ class AppConfig:
     llm_model: str = "gpt-4o-mini"
     max_attempts: int = 3
     max_retries: int = 1
+    audio_lead_ms: int = 300
+    send_queue_max_size: int = 256
+    send_queue_high_watermark: int = 128
+    send_queue_low_watermark: int = 32
+    llm_timeout_sec: float = 20.0
+    speculative_followups: bool = True
+    tts_cache_max_bytes: int = 32 * 1024 * 1024
+    tts_cache_dir: Optional[str] = None
 
     @staticmethod
     def from_env() -> "AppConfig":
@@ -28,8 +37,43 @@ class AppConfig:
             raise RuntimeError("OPENAI_API_KEY is required")
         realtime_model = os.getenv("OPENAI_REALTIME_MODEL", "").strip()
         llm_model = os.getenv("OPENAI_LLM_MODEL", "").strip()
+        audio_lead_ms = os.getenv("AUDIO_LEAD_MS", "").strip()
+        send_queue = send_queue_options_from_env()
+        llm_timeout = os.getenv("OPENAI_LLM_TIMEOUT_SEC", "").strip()
+        speculative = os.getenv("SCENARIO_SPECULATIVE_FOLLOWUPS", "").strip().lower()
+        tts_cache_mb = os.getenv("TTS_CACHE_MAX_MB", "").strip()
+        tts_cache_dir = os.getenv("TTS_CACHE_DIR", "").strip()
         return AppConfig(
             api_key=api_key,
             realtime_model=realtime_model or AppConfig.realtime_model,
             llm_model=llm_model or AppConfig.llm_model,
+            audio_lead_ms=int(audio_lead_ms) if audio_lead_ms else AppConfig.audio_lead_ms,
+            send_queue_max_size=send_queue["max_size"],
+            send_queue_high_watermark=send_queue["high_watermark"],
+            send_queue_low_watermark=send_queue["low_watermark"],
+            llm_timeout_sec=float(llm_timeout) if llm_timeout else AppConfig.llm_timeout_sec,
+            speculative_followups=speculative not in ("0", "false", "no", "off"),
+            tts_cache_max_bytes=(
+                int(tts_cache_mb) * 1024 * 1024 if tts_cache_mb else AppConfig.tts_cache_max_bytes
+            ),
+            tts_cache_dir=tts_cache_dir or None,
         )
+
+    def send_queue_options(self) -> dict[str, int]:
+        return {
+            "max_size": self.send_queue_max_size,
+            "high_watermark": self.send_queue_high_watermark,
+            "low_watermark": self.send_queue_low_watermark,
+        }
+
+
+def send_queue_options_from_env() -> dict[str, int]:
+    """ClientSendQueue sizing from SEND_QUEUE_MAX_SIZE / SEND_QUEUE_HIGH_WATERMARK / SEND_QUEUE_LOW_WATERMARK."""
+    max_size = os.getenv("SEND_QUEUE_MAX_SIZE", "").strip()
+    high_watermark = os.getenv("SEND_QUEUE_HIGH_WATERMARK", "").strip()
+    low_watermark = os.getenv("SEND_QUEUE_LOW_WATERMARK", "").strip()
+    return {
+        "max_size": int(max_size) if max_size else AppConfig.send_queue_max_size,
+        "high_watermark": int(high_watermark) if high_watermark else AppConfig.send_queue_high_watermark,
+        "low_watermark": int(low_watermark) if low_watermark else AppConfig.send_queue_low_watermark,
+    }
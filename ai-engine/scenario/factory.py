@@ -2,19 +2,24 @@ from __future__ import annotations
 
 from typing import Optional
 
-from .llm_client import OpenAIScenarioLLM
+from .llm_client import AsyncOpenAIScenarioLLM
 from .prompts import KOREAN_FALLBACK_MESSAGE
+from .question_cache import FollowUpQuestionCache
 from .scenario_builder import ScenarioBuilder
 from .scenario_state import ScenarioState
 
+_question_cache = FollowUpQuestionCache()
+
 
 def build_scenario_builder(
     api_key: str,
     model: str,
     max_attempts: int = 3,
     logger: Optional[object] = None,
+    timeout: float = 20.0,
+    speculative: bool = True,
 ) -> ScenarioBuilder:
-    llm = OpenAIScenarioLLM(api_key=api_key, model=model, logger=logger)
+    llm = AsyncOpenAIScenarioLLM(api_key=api_key, model=model, logger=logger, timeout=timeout)
     return ScenarioBuilder(
         state=ScenarioState(),
         extractor=llm.extract_fields,
@@ -23,5 +28,7 @@ def build_scenario_builder(
         fallback_generator=llm.generate_fallback,
         max_attempts=max_attempts,
         fallback_korean_prompt=KOREAN_FALLBACK_MESSAGE,
+        question_cache=_question_cache,
+        speculative=speculative,
         logger=logger,
     )
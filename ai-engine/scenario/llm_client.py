@@ -1,38 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any, Optional
 
-from openai import OpenAI
-
+from .openai_clients import get_async_openai_client, get_client_registry, get_openai_client
 from .prompts import build_extraction_prompt, build_fallback_prompt, build_final_prompt, build_followup_prompt
 from .scenario_state import ScenarioState
 
 
+EXTRACTION_RESPONSE_FORMAT = {"type": "json_object"}
+
+
 class OpenAIScenarioLLM:
     def __init__(self, api_key: str, model: str, logger: Optional[Any] = None) -> None:
-        self._client = OpenAI(api_key=api_key)
+        self._client = get_openai_client(api_key)
         self._model = model
         self._logger = logger
 
     def extract_fields(self, user_text: str) -> dict[str, str | None]:
-        prompt = build_extraction_prompt(user_text)
-        text = self._create_text_response(prompt, response_format={"type": "json_object"})
+        text = self._create_text_response(
+            build_extraction_prompt(user_text), response_format=EXTRACTION_RESPONSE_FORMAT
+        )
         return _safe_json_loads(text)
 
     def generate_followup(self, state: ScenarioState, missing_fields: list[str]) -> str:
-        prompt = build_followup_prompt(state.place, state.partner, state.goal, missing_fields)
-        return self._create_text_response(prompt)
+        return self._create_text_response(_followup_prompt(state, missing_fields))
 
     def generate_final(self, state: ScenarioState) -> str:
-        if not (state.place and state.partner and state.goal):
-            raise ValueError("ScenarioState is incomplete for final response generation")
-        prompt = build_final_prompt(state.place, state.partner, state.goal)
-        return self._create_text_response(prompt)
+        return self._create_text_response(_final_prompt(state))
 
     def generate_fallback(self, state: ScenarioState) -> str:
-        prompt = build_fallback_prompt(state.place, state.partner, state.goal)
-        return self._create_text_response(prompt)
+        return self._create_text_response(_fallback_prompt(state))
 
     def _create_text_response(
         self,
@@ -40,31 +39,132 @@ class OpenAIScenarioLLM:
         *,
         response_format: Optional[dict[str, Any]] = None,
     ) -> str:
-        if hasattr(self._client, "responses"):
+        with get_client_registry().limit("llm"):
+            return self._request_text(prompt, response_format=response_format)
+
+    def _request_text(
+        self,
+        prompt: str,
+        *,
+        response_format: Optional[dict[str, Any]] = None,
+    ) -> str:
+        api = _select_api(self._client)
+        if api == "responses":
+            request = _responses_request(self._model, prompt, response_format)
             try:
-                response = self._client.responses.create(
-                    model=self._model,
-                    input=prompt,
-                    response_format=response_format,
-                )
+                response = self._client.responses.create(**request)
             except TypeError:
-                response = self._client.responses.create(
-                    model=self._model,
-                    input=prompt,
-                )
-            text = getattr(response, "output_text", None)
-            if isinstance(text, str) and text.strip():
-                return text.strip()
-            return _extract_text_from_response(response)
+                response = self._client.responses.create(**_without_response_format(request))
+            return _responses_text(response)
+        response = self._client.chat.completions.create(**_chat_request(self._model, prompt))
+        return _chat_text(response)
 
-        if hasattr(self._client, "chat"):
-            response = self._client.chat.completions.create(
-                model=self._model,
-                messages=[{"role": "user", "content": prompt}],
+
+class AsyncOpenAIScenarioLLM:
+    """Awaitable counterpart of ``OpenAIScenarioLLM`` so scenario turns never block the event loop."""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        logger: Optional[Any] = None,
+        *,
+        timeout: float = 20.0,
+    ) -> None:
+        self._client = get_async_openai_client(api_key)
+        self._model = model
+        self._logger = logger
+        self._timeout = timeout
+
+    async def extract_fields(self, user_text: str) -> dict[str, str | None]:
+        text = await self._create_text_response(
+            build_extraction_prompt(user_text), response_format=EXTRACTION_RESPONSE_FORMAT
+        )
+        return _safe_json_loads(text)
+
+    async def generate_followup(self, state: ScenarioState, missing_fields: list[str]) -> str:
+        return await self._create_text_response(_followup_prompt(state, missing_fields))
+
+    async def generate_final(self, state: ScenarioState) -> str:
+        return await self._create_text_response(_final_prompt(state))
+
+    async def generate_fallback(self, state: ScenarioState) -> str:
+        return await self._create_text_response(_fallback_prompt(state))
+
+    async def _create_text_response(
+        self,
+        prompt: str,
+        *,
+        response_format: Optional[dict[str, Any]] = None,
+    ) -> str:
+        async with get_client_registry().async_limit("llm"):
+            return await asyncio.wait_for(
+                self._request_text(prompt, response_format=response_format),
+                timeout=self._timeout,
             )
-            return response.choices[0].message.content.strip()
 
-        raise RuntimeError("OpenAI client does not support responses or chat completions")
+    async def _request_text(
+        self,
+        prompt: str,
+        *,
+        response_format: Optional[dict[str, Any]] = None,
+    ) -> str:
+        api = _select_api(self._client)
+        if api == "responses":
+            request = _responses_request(self._model, prompt, response_format)
+            try:
+                response = await self._client.responses.create(**request)
+            except TypeError:
+                response = await self._client.responses.create(**_without_response_format(request))
+            return _responses_text(response)
+        response = await self._client.chat.completions.create(**_chat_request(self._model, prompt))
+        return _chat_text(response)
+
+
+def _followup_prompt(state: ScenarioState, missing_fields: list[str]) -> str:
+    return build_followup_prompt(state.place, state.partner, state.goal, missing_fields)
+
+
+def _final_prompt(state: ScenarioState) -> str:
+    if not (state.place and state.partner and state.goal):
+        raise ValueError("ScenarioState is incomplete for final response generation")
+    return build_final_prompt(state.place, state.partner, state.goal)
+
+
+def _fallback_prompt(state: ScenarioState) -> str:
+    return build_fallback_prompt(state.place, state.partner, state.goal)
+
+
+def _select_api(client: Any) -> str:
+    if hasattr(client, "responses"):
+        return "responses"
+    if hasattr(client, "chat"):
+        return "chat"
+    raise RuntimeError("OpenAI client does not support responses or chat completions")
+
+
+def _responses_request(model: str, prompt: str, response_format: Optional[dict[str, Any]]) -> dict[str, Any]:
+    return {"model": model, "input": prompt, "response_format": response_format}
+
+
+def _without_response_format(request: dict[str, Any]) -> dict[str, Any]:
+    # Older SDKs reject response_format on responses.create.
+    return {key: value for key, value in request.items() if key != "response_format"}
+
+
+def _chat_request(model: str, prompt: str) -> dict[str, Any]:
+    return {"model": model, "messages": [{"role": "user", "content": prompt}]}
+
+
+def _responses_text(response: Any) -> str:
+    text = getattr(response, "output_text", None)
+    if isinstance(text, str) and text.strip():
+        return text.strip()
+    return _extract_text_from_response(response)
+
+
+def _chat_text(response: Any) -> str:
+    return response.choices[0].message.content.strip()
 
 
 def _safe_json_loads(text: str) -> dict[str, str | None]:
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+DEFAULT_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=120.0)
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+PURPOSE_LIMITS: dict[str, int] = {
+    "llm": 16,
+    "tts": 32,
+    "realtime_session": 8,
+    "title": 4,
+    "feedback": 4,
+    "hint": 8,
+}
+DEFAULT_PURPOSE_LIMIT = 8
+
+
+class OpenAIClientRegistry:
+    """Process-wide OpenAI clients that share keep-alive connection pools.
+
+    One sync and one async client is kept per API key. ``limit``/``async_limit``
+    bound in-flight requests per purpose so a burst of one kind of call (e.g. TTS)
+    cannot starve the others of pooled connections.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits = DEFAULT_POOL_LIMITS,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        purpose_limits: Optional[dict[str, int]] = None,
+    ) -> None:
+        self._limits = limits
+        self._timeout = timeout
+        self._purpose_limits = dict(PURPOSE_LIMITS if purpose_limits is None else purpose_limits)
+        self._lock = threading.Lock()
+        self._sync_clients: dict[str, OpenAI] = {}
+        self._async_clients: dict[str, AsyncOpenAI] = {}
+        self._sync_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._async_slots: dict[str, asyncio.Semaphore] = {}
+
+    def get(self, api_key: str) -> OpenAI:
+        with self._lock:
+            client = self._sync_clients.get(api_key)
+            if client is None:
+                client = OpenAI(
+                    api_key=api_key,
+                    timeout=self._timeout,
+                    http_client=DefaultHttpxClient(limits=self._limits, timeout=self._timeout),
+                )
+                self._sync_clients[api_key] = client
+            return client
+
+    def get_async(self, api_key: str) -> AsyncOpenAI:
+        with self._lock:
+            client = self._async_clients.get(api_key)
+            if client is None:
+                client = AsyncOpenAI(
+                    api_key=api_key,
+                    timeout=self._timeout,
+                    http_client=DefaultAsyncHttpxClient(limits=self._limits, timeout=self._timeout),
+                )
+                self._async_clients[api_key] = client
+            return client
+
+    def purpose_limit(self, purpose: str) -> int:
+        return self._purpose_limits.get(purpose, DEFAULT_PURPOSE_LIMIT)
+
+    @contextmanager
+    def limit(self, purpose: str) -> Iterator[None]:
+        with self._lock:
+            slot = self._sync_slots.get(purpose)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.purpose_limit(purpose))
+                self._sync_slots[purpose] = slot
+        with slot:
+            yield
+
+    @asynccontextmanager
+    async def async_limit(self, purpose: str) -> AsyncIterator[None]:
+        slot = self._async_slots.get(purpose)
+        if slot is None:
+            slot = asyncio.Semaphore(self.purpose_limit(purpose))
+            self._async_slots[purpose] = slot
+        async with slot:
+            yield
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._sync_clients.values())
+            self._sync_clients.clear()
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        self.close()
+        with self._lock:
+            clients = list(self._async_clients.values())
+            self._async_clients.clear()
+            self._async_slots.clear()
+        for client in clients:
+            await client.close()
+
+
+_registry = OpenAIClientRegistry()
+
+
+def get_client_registry() -> OpenAIClientRegistry:
+    return _registry
+
+
+def get_openai_client(api_key: str) -> OpenAI:
+    return _registry.get(api_key)
+
+
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    return _registry.get_async(api_key)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import math
+from typing import Awaitable, Callable, Optional
+
+from .ttl_cache import SingleFlightCache
+
+QuestionKey = tuple[str, str, str, str]
+
+
+class FollowUpQuestionCache(SingleFlightCache[QuestionKey, str]):
+    """LRU of generated follow-up questions keyed on target field and known scenario fields.
+
+    Questions do not expire. Concurrent requests for the same key (prebuild and
+    speculation, or several sessions) share one generation.
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        super().__init__(max(max_entries, 1))
+
+    @staticmethod
+    def make_key(target: str, place: Optional[str], partner: Optional[str], goal: Optional[str]) -> QuestionKey:
+        return (
+            target,
+            (place or "").strip().lower(),
+            (partner or "").strip().lower(),
+            (goal or "").strip().lower(),
+        )
+
+    def __contains__(self, key: QuestionKey) -> bool:
+        return self.peek(key) is not None
+
+    def put(self, key: QuestionKey, question: str, expires_at: float = math.inf) -> None:
+        super().put(key, question, expires_at)
+
+    async def get_or_generate(self, key: QuestionKey, generate: Callable[[], Awaitable[str]]) -> str:
+        async def load() -> tuple[str, float]:
+            return await generate(), math.inf
+
+        return await self.get_or_load(key, load)
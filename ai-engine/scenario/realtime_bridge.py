@@ -4,29 +4,35 @@ import asyncio
 import base64
 import binascii
 import json
-from io import BytesIO
-import wave
+import time
 import uuid
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 from datetime import datetime, timezone
 import sys
 from pathlib import Path
 
 import websockets
-from openai import OpenAI
 
 from .config import AppConfig
-from .realtime_handlers import fanout_event_handler
+from .realtime_handlers import RealtimeEventRouter
 from .realtime_pipeline import RealtimeScenarioPipeline
 from .realtime_session import RealtimeConfig, RealtimeSessionManager, RealtimeWebSocketClient
+from .audio_pacer import AudioPacer, pcm16_duration
 from .audio_relay import RealtimeAudioRelay
 from .fallbacks import build_realtime_error_handler
 from .factory import build_scenario_builder
 from .logging_utils import get_logger
+from .openai_clients import get_async_openai_client, get_client_registry, get_openai_client
 from .scenario_builder import ScenarioBuilder
+from .send_queue import ClientSendQueue
+from .tts_cache import DEFAULT_TTS_SAMPLE_RATE, TTSCache, cache_pcm16_stream, iter_cached_pcm16
+from .tts_metrics import tts_first_audio_metrics
+from .tts_stream import read_ahead, stream_tts_pcm16
 
 ClientSender = Callable[[dict[str, Any]], Awaitable[None]]
 
+_tts_cache: Optional[TTSCache] = None
+
 BACKEND_ROOT = Path(__file__).resolve().parents[2] / "backend"
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.append(str(BACKEND_ROOT))
@@ -56,9 +62,9 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
     logger.info("Client connected [%s]: %s", client_id, client_peer)
 
     config = AppConfig.from_env()
-    session_info = RealtimeSessionManager(
+    session_info = await RealtimeSessionManager(
         RealtimeConfig(api_key=config.api_key, model=config.realtime_model, max_retries=config.max_retries)
-    ).create_session()
+    ).create_session_async()
 
     use_server_vad = True
     session_config = {
@@ -85,9 +91,15 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         max_retries=config.max_retries,
     )
 
-    async def send_to_client(payload: dict[str, Any]) -> None:
+    async def write_to_client(payload: dict[str, Any]) -> None:
         await client_ws.send(json.dumps(payload))
 
+    outbound = ClientSendQueue(write_to_client, logger=logger, **config.send_queue_options())
+    outbound.start()
+
+    async def send_to_client(payload: dict[str, Any]) -> None:
+        await outbound.put(payload, droppable=payload.get("type") == "response.audio.delta")
+
     state = {
         "has_audio": False,
         "total_bytes": 0,
@@ -105,9 +117,11 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         }
         await send_to_client(payload)
 
+    pacer = AudioPacer(lead_ms=config.audio_lead_ms)
     audio_relay = RealtimeAudioRelay(
         on_audio_chunk_base64=lambda chunk: send_to_client({"type": "response.audio.delta", "delta": chunk}),
         on_transcript=on_transcript,
+        pacer=pacer,
     )
 
     builder = build_scenario_builder(
@@ -115,13 +129,44 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         model=config.llm_model,
         max_attempts=config.max_attempts,
         logger=logger,
+        timeout=config.llm_timeout_sec,
+        speculative=config.speculative_followups,
     )
+    prebuild_task = asyncio.create_task(builder.prebuild_questions())
 
-    tts_client = OpenAI(api_key=config.api_key)
+    tts_client = get_async_openai_client(config.api_key)
+    tts_cache = _get_tts_cache(config)
 
     async def send_response(text: str) -> None:
-        audio_bytes, sample_rate = await asyncio.to_thread(_tts_pcm16_from_text, tts_client, text)
-        await _send_pcm16_audio(send_to_client, audio_bytes, sample_rate=sample_rate)
+        requested_at = time.monotonic()
+        pacer.resume()
+
+        cache_key = TTSCache.make_key(text)
+        cached = tts_cache.get(cache_key)
+
+        def on_first_audio() -> None:
+            elapsed_ms = (time.monotonic() - requested_at) * 1000.0
+            tts_first_audio_metrics.record(elapsed_ms, cached=cached is not None)
+            logger.info("TTS time-to-first-audio [%s]: %.0f ms", client_id, elapsed_ms)
+
+        if cached is not None:
+            chunks = iter_cached_pcm16(cached, DEFAULT_TTS_SAMPLE_RATE)
+        else:
+            # The TTS slot covers only the HTTP stream; pacing and cache replay run outside it.
+            chunks = read_ahead(
+                cache_pcm16_stream(tts_cache, cache_key, stream_tts_pcm16(tts_client, text)),
+                limit=get_client_registry().async_limit("tts"),
+            )
+
+        try:
+            await _send_pcm16_stream(
+                send_to_client,
+                chunks,
+                pacer=pacer,
+                on_first_audio=on_first_audio,
+            )
+        except Exception as exc:
+            logger.error("TTS streaming failed [%s]: %s", client_id, exc)
         if not state.get("completed_sent"):
             await send_to_client(
                 {
@@ -188,87 +233,94 @@ async def handle_client(client_ws, user_id: Optional[int] = None) -> None:
         send_final_response=False,
     )
     async def forward_user_transcript(event: dict[str, Any]) -> None:
-        event_type = event.get("type", "")
-        if event_type in (
-            "input_audio_buffer.transcription.completed",
-            "conversation.item.input_audio_transcription.completed",
-        ):
-            transcript = event.get("transcript")
-            if isinstance(transcript, str) and transcript.strip():
-                if builder.state.completed:
-                    return
-                await send_to_client({"type": "input_audio.transcript", "transcript": transcript})
-                state["user_transcripts"].append(transcript)
+        transcript = event.get("transcript")
+        if isinstance(transcript, str) and transcript.strip():
+            if builder.state.completed:
+                return
+            await send_to_client({"type": "input_audio.transcript", "transcript": transcript})
+            state["user_transcripts"].append(transcript)
 
     ready_event = asyncio.Event()
     session_ready = {"updated": False, "cleared": False}
 
-    async def log_event_type(event: dict[str, Any]) -> None:
-        event_type = event.get("type", "unknown")
-        if event_type == "session.updated":
-            session_ready["updated"] = True
-            await openai_client.send_event({"type": "input_audio_buffer.clear"})
-        if event_type == "input_audio_buffer.cleared":
-            session_ready["cleared"] = True
+    def check_session_ready() -> None:
         if session_ready["updated"] and session_ready["cleared"]:
             ready_event.set()
-        if event_type == "error":
-            logger.error("OpenAI error [%s]: %s", client_id, event)
-        if event_type == "response.audio.delta":
-            state["speaking"] = True
-        if event_type == "response.audio.done":
-            state["speaking"] = False
-
-    openai_client.set_event_handler(
-        fanout_event_handler(
-            [log_event_type, audio_relay.handle_event, forward_user_transcript, pipeline.handle_event]
-        )
+
+    async def on_session_updated(_: dict[str, Any]) -> None:
+        session_ready["updated"] = True
+        await openai_client.send_event({"type": "input_audio_buffer.clear"})
+        check_session_ready()
+
+    def on_buffer_cleared(_: dict[str, Any]) -> None:
+        session_ready["cleared"] = True
+        check_session_ready()
+
+    def on_speaking(event: dict[str, Any]) -> None:
+        state["speaking"] = event["type"] == "response.audio.delta"
+
+    # [Event Router] 이벤트 타입별 구독 (오디오 델타는 relay와 상태 갱신만 거침)
+    router = RealtimeEventRouter(logger=logger)
+    router.subscribe("session.updated", on_session_updated)
+    router.subscribe("input_audio_buffer.cleared", on_buffer_cleared)
+    router.subscribe("error", lambda event: logger.error("OpenAI error [%s]: %s", client_id, event))
+    router.subscribe("input_audio_buffer.speech_started", lambda _: pacer.cancel())
+    router.subscribe(("response.audio.delta", "response.audio.done"), on_speaking)
+    router.subscribe_map(audio_relay.event_routes())
+    router.subscribe(
+        ("input_audio_buffer.transcription.completed", "conversation.item.input_audio_transcription.completed"),
+        forward_user_transcript,
     )
+    # LLM 턴은 수신 루프 밖에서 처리 (턴 진행 중에도 발화 시작/오디오 이벤트가 막히지 않도록)
+    router.subscribe(RealtimeScenarioPipeline.EVENT_TYPES, pipeline.handle_event, concurrent=True)
+    openai_client.set_event_handler(router.dispatch)
     openai_client.set_error_handler(build_realtime_error_handler(send_to_client))
 
     openai_task = asyncio.create_task(openai_client.connect_and_run())
-    connected = await openai_client.wait_until_connected(timeout=10.0)
-    if not connected:
-        await client_ws.send(json.dumps({"type": "error", "message": "Realtime connection timeout"}))
-        await openai_client.close()
-        openai_task.cancel()
-        return
-    ready = await _wait_ready(ready_event, timeout=10.0)
-    if not ready:
-        await client_ws.send(json.dumps({"type": "error", "message": "Realtime session not ready"}))
-        await openai_client.close()
-        openai_task.cancel()
-        return
-    await client_ws.send(json.dumps({"type": "ready"}))
-
-    # [Trigger] 강제 발화 유도: "Let's start" 가짜 사용자 메시지 주입
-    logger.info("Triggering AI First Turn with 'Let's start'")
-    await openai_client.send_event({
-        "type": "conversation.item.create",
-        "item": {
-            "type": "message",
-            "role": "user",
-            "content": [
-                {
-                    "type": "input_text",
-                    "text": "Let's start" 
-                }
-            ]
-        }
-    })
-    # await openai_client.send_event({
-    #     "type": "response.create",
-    #     "response": {
-    #         "modalities": ["audio", "text"]
-    #     }
-    # })
     try:
+        connected = await openai_client.wait_until_connected(timeout=10.0)
+        if not connected:
+            await send_to_client({"type": "error", "message": "Realtime connection timeout"})
+            return
+        ready = await _wait_ready(ready_event, timeout=10.0)
+        if not ready:
+            await send_to_client({"type": "error", "message": "Realtime session not ready"})
+            return
+        await send_to_client({"type": "ready"})
+
+        # [Trigger] 강제 발화 유도: "Let's start" 가짜 사용자 메시지 주입
+        logger.info("Triggering AI First Turn with 'Let's start'")
+        await openai_client.send_event({
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": "user",
+                "content": [
+                    {
+                        "type": "input_text",
+                        "text": "Let's start" 
+                    }
+                ]
+            }
+        })
+        # await openai_client.send_event({
+        #     "type": "response.create",
+        #     "response": {
+        #         "modalities": ["audio", "text"]
+        #     }
+        # })
         async for message in client_ws:
             # logger.info("Client event: %s", _safe_event_type(message))
             await handle_client_message(message, openai_client, state, use_server_vad)
     finally:
+        prebuild_task.cancel()
+        await pipeline.close()
+        await router.close()
+        await audio_relay.close()
         await openai_client.close()
         openai_task.cancel()
+        await outbound.close()
+        logger.info("Outbound queue stats [%s]: %s", client_id, outbound.stats())
 
 
 async def handle_client_message(
@@ -339,39 +391,64 @@ async def handle_client_message(
     return
 
 
-def _tts_pcm16_from_text(client: OpenAI, text: str) -> tuple[bytes, int]:
-    response = client.audio.speech.create(
-        model="gpt-4o-mini-tts",
-        voice="alloy",
-        input=text,
-        response_format="wav",
-    )
-    wav_bytes = response.read()
-    if not wav_bytes:
-        return b"", 24000
-    with wave.open(BytesIO(wav_bytes), "rb") as wav:
-        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
-            return b"", wav.getframerate()
-        return wav.readframes(wav.getnframes()), wav.getframerate()
+def _get_tts_cache(config: AppConfig) -> TTSCache:
+    global _tts_cache
+    if _tts_cache is None:
+        _tts_cache = TTSCache(
+            max_bytes=config.tts_cache_max_bytes,
+            cache_dir=config.tts_cache_dir,
+            logger=get_logger("realtime_bridge"),
+        )
+    return _tts_cache
 
 
-async def _send_pcm16_audio(send_to_client, audio_bytes: bytes, sample_rate: int) -> None:
-    if not audio_bytes:
-        return
+async def _send_pcm16_stream(
+    send_to_client,
+    chunks: AsyncIterator[tuple[bytes, int]],
+    *,
+    pacer: Optional[AudioPacer] = None,
+    on_first_audio: Optional[Callable[[], None]] = None,
+) -> None:
     chunk_ms = 100
-    chunk_size = int(sample_rate * (chunk_ms / 1000.0) * 2)
-    for offset in range(0, len(audio_bytes), chunk_size):
-        chunk = audio_bytes[offset : offset + chunk_size]
-        payload = {
-            "type": "response.audio.delta",
-            "delta": base64.b64encode(chunk).decode("ascii"),
-            "sample_rate": sample_rate,
-        }
-        await send_to_client(payload)
-        await asyncio.sleep(chunk_ms / 1000.0)
-    await send_to_client({"type": "response.audio.done"})
-
+    pacer = pacer or AudioPacer()
+    pending = bytearray()
+    sample_rate = 24000
+    sent_any = False
+
+    async def _emit(chunk: bytes) -> bool:
+        nonlocal sent_any
+        if not await pacer.wait_turn(pcm16_duration(len(chunk), sample_rate)):
+            return False
+        if not sent_any:
+            sent_any = True
+            if on_first_audio is not None:
+                on_first_audio()
+        await send_to_client(
+            {
+                "type": "response.audio.delta",
+                "delta": base64.b64encode(chunk).decode("ascii"),
+                "sample_rate": sample_rate,
+            }
+        )
+        return True
 
+    try:
+        async for data, sample_rate in chunks:
+            pending.extend(data)
+            chunk_size = int(sample_rate * (chunk_ms / 1000.0) * 2)
+            while len(pending) >= chunk_size:
+                chunk = bytes(pending[:chunk_size])
+                del pending[:chunk_size]
+                if not await _emit(chunk):
+                    return
+        if pending:
+            await _emit(bytes(pending))
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        if sent_any:
+            await send_to_client({"type": "response.audio.done"})
 
 
 async def _wait_ready(event: asyncio.Event, timeout: float) -> bool:
@@ -410,7 +487,7 @@ async def _persist_scenario_state(
     )
     async with AsyncSessionLocal() as db:
         repo = ChatRepository(db)
-        await repo.create_session_log(session_data, user_id=user_id)
+        await repo.append_session_log(session_data, user_id=user_id)
 
 async def _generate_session_title(
     config: AppConfig,
@@ -446,7 +523,11 @@ def _build_title_prompt(scenario_state: dict[str, Any], transcripts: list[str])
 
 
 def _request_title(api_key: str, model: str, prompt: str) -> str:
-    client = OpenAI(api_key=api_key)
+    with get_client_registry().limit("title"):
+        return _request_title_text(get_openai_client(api_key), model, prompt)
+
+
+def _request_title_text(client: Any, model: str, prompt: str) -> str:
     if hasattr(client, "responses"):
         try:
             response = client.responses.create(
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Awaitable, Callable, Iterable, Union
+import inspect
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
 
 EventHandler = Callable[[dict[str, Any]], Union[Awaitable[None], None]]
 
@@ -16,3 +19,95 @@ def fanout_event_handler(handlers: Iterable[EventHandler]) -> EventHandler:
                 await result
 
     return _handler
+
+
+@dataclass(slots=True)
+class _Route:
+    handler: EventHandler
+    is_async: bool
+    concurrent: bool
+    tail: Optional[asyncio.Task] = field(default=None)
+
+
+class RealtimeEventRouter:
+    """Dispatches Realtime events to handlers subscribed by event type.
+
+    Each event costs one dict lookup; types nobody subscribed to are dropped
+    before any handler runs. Handlers subscribed with ``concurrent=True`` run
+    off the receive loop (still one event at a time, in order, per handler) so
+    a slow handler such as an LLM turn does not hold back audio deltas.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None) -> None:
+        self._routes: dict[str, list[_Route]] = {}
+        self._background: set[asyncio.Task] = set()
+        self._logger = logger or logging.getLogger(__name__)
+        self.dispatched = 0
+        self.dropped = 0
+
+    def subscribe(
+        self,
+        event_types: Union[str, Iterable[str]],
+        handler: EventHandler,
+        *,
+        concurrent: bool = False,
+    ) -> None:
+        if isinstance(event_types, str):
+            event_types = (event_types,)
+        route = _Route(handler=handler, is_async=inspect.iscoroutinefunction(handler), concurrent=concurrent)
+        for event_type in event_types:
+            self._routes.setdefault(event_type, []).append(route)
+
+    def subscribe_map(self, routes: dict[str, EventHandler], *, concurrent: bool = False) -> None:
+        for event_type, handler in routes.items():
+            self.subscribe(event_type, handler, concurrent=concurrent)
+
+    @property
+    def event_types(self) -> frozenset[str]:
+        return frozenset(self._routes)
+
+    async def dispatch(self, event: dict[str, Any]) -> None:
+        routes = self._routes.get(event.get("type"))
+        if routes is None:
+            self.dropped += 1
+            return
+        self.dispatched += 1
+        for route in routes:
+            if route.concurrent:
+                self._schedule(route, event)
+            elif route.is_async:
+                await route.handler(event)
+            else:
+                result = route.handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+
+    def _schedule(self, route: _Route, event: dict[str, Any]) -> None:
+        task = asyncio.create_task(self._run_after(route.tail, route, event))
+        route.tail = task
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _run_after(self, previous: Optional[asyncio.Task], route: _Route, event: dict[str, Any]) -> None:
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+        try:
+            result = route.handler(event)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception:
+            self._logger.exception("Realtime event handler failed for %s", event.get("type"))
+
+    async def close(self) -> None:
+        tasks = list(self._background)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "dispatched": self.dispatched,
+            "dropped": self.dropped,
+            "pending": len(self._background),
+        }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Callable, Optional
 
 from .scenario_builder import ScenarioBuilder
@@ -9,6 +10,16 @@ OnComplete = Callable[[ScenarioBuilder], Any]
 
 
 class RealtimeScenarioPipeline:
+    # Events _extract_user_text can read user text from (for RealtimeEventRouter subscriptions).
+    EVENT_TYPES = (
+        "input_audio_buffer.transcription.completed",
+        "conversation.item.input_audio_transcription.completed",
+        "conversation.item.created",
+        "conversation.item.added",
+        "conversation.item.done",
+        "conversation.item.retrieved",
+    )
+
     def __init__(
         self,
         builder: ScenarioBuilder,
@@ -23,30 +34,54 @@ class RealtimeScenarioPipeline:
         self._max_attempts = max_attempts
         self._on_complete = on_complete
         self._send_final_response = send_final_response
+        self._turn_task: Optional[asyncio.Task] = None
+        self._closed = False
 
     async def handle_event(self, event: dict[str, Any]) -> None:
-        if self._builder.state.completed:
+        if self._closed or self._builder.state.completed:
             return
         user_text = self._extract_user_text(event)
         if not user_text:
             return
 
-        self._builder.ingest_user_text(user_text)
+        self._turn_task = asyncio.create_task(self._handle_user_text(user_text))
+        try:
+            await self._turn_task
+        except asyncio.CancelledError:
+            if not self._closed:
+                raise
+        finally:
+            self._turn_task = None
+
+    async def close(self) -> None:
+        """Cancel the in-flight turn (e.g. pending LLM calls) when the client disconnects."""
+        self._closed = True
+        task = self._turn_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._builder.cancel_speculation()
+
+    async def _handle_user_text(self, user_text: str) -> None:
+        await self._builder.ingest_user_text(user_text)
         if self._builder.state.is_complete():
             if self._send_final_response:
-                await self._maybe_await(self._send_response(self._builder.finalize_scenario()))
+                await self._maybe_await(self._send_response(await self._builder.finalize_scenario()))
             if self._on_complete:
                 await self._maybe_await(self._on_complete(self._builder))
             return
 
-        question = self._builder.build_follow_up_question()
+        question = await self._builder.build_follow_up_question()
         if question is None:
             if self._builder.state.attempts >= self._max_attempts:
                 if self._send_final_response:
-                    await self._maybe_await(self._send_response(self._builder.finalize_with_fallback()))
+                    await self._maybe_await(self._send_response(await self._builder.finalize_with_fallback()))
             else:
                 if self._send_final_response:
-                    await self._maybe_await(self._send_response(self._builder.finalize_scenario()))
+                    await self._maybe_await(self._send_response(await self._builder.finalize_scenario()))
             if self._on_complete:
                 await self._maybe_await(self._on_complete(self._builder))
             return
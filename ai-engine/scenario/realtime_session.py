@@ -5,10 +5,13 @@ import base64
 import inspect
 import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Optional, Union
 
-from openai import OpenAI
+from .openai_clients import get_async_openai_client, get_client_registry, get_openai_client
+from .ttl_cache import SingleFlightCache
+from .upstream_pool import claim_upstream, get_upstream_pool
 
 try:
     import websockets
@@ -19,6 +22,10 @@ except ImportError:  # pragma: no cover - optional dependency
 
 EventHandler = Callable[[dict[str, Any]], Union[Awaitable[None], None]]
 ErrorHandler = Callable[[Exception], Union[Awaitable[None], None]]
+TokenFactory = Callable[[], Awaitable[tuple[Optional[str], Optional[float]]]]
+
+# Stop handing out a cached ephemeral token this many seconds before it expires.
+EPHEMERAL_TOKEN_REFRESH_MARGIN_SEC = 15.0
 
 
 @dataclass(frozen=True)
@@ -36,23 +43,93 @@ class RealtimeSessionInfo:
     model: str
 
 
+class EphemeralTokenCache:
+    """Caches ephemeral realtime tokens per (api_key, model) until shortly before expiry.
+
+    Concurrent misses for the same key share one ``sessions.create`` call.
+    """
+
+    def __init__(
+        self,
+        refresh_margin_sec: float = EPHEMERAL_TOKEN_REFRESH_MARGIN_SEC,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._refresh_margin_sec = refresh_margin_sec
+        self._tokens: SingleFlightCache[tuple[str, str], str] = SingleFlightCache(clock=clock)
+
+    def peek(self, key: tuple[str, str]) -> Optional[str]:
+        return self._tokens.peek(key)
+
+    async def get(self, key: tuple[str, str], factory: TokenFactory) -> Optional[str]:
+        async def load() -> tuple[Optional[str], Optional[float]]:
+            token, expires_at = await factory()
+            if not token or not expires_at:
+                return token, None
+            return token, expires_at - self._refresh_margin_sec
+
+        return await self._tokens.get_or_load(key, load)
+
+    def clear(self) -> None:
+        self._tokens.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return self._tokens.stats()
+
+
+_token_cache = EphemeralTokenCache()
+
+
+def get_ephemeral_token_cache() -> EphemeralTokenCache:
+    return _token_cache
+
+
 class RealtimeSessionManager:
-    def __init__(self, config: RealtimeConfig) -> None:
+    def __init__(self, config: RealtimeConfig, token_cache: Optional[EphemeralTokenCache] = None) -> None:
         self._config = config
+        self._token_cache = token_cache or _token_cache
 
     def create_session(self) -> RealtimeSessionInfo:
-        client = OpenAI(api_key=self._config.api_key)
+        # Pooled sockets authenticate with the API key, so skip minting an ephemeral token.
+        if get_upstream_pool(self.wss_url, self._config.api_key) is not None:
+            return RealtimeSessionInfo(wss_url=self.wss_url, bearer_token=None, model=self._config.model)
+
+        client = get_openai_client(self._config.api_key)
         bearer_token: Optional[str] = None
 
         # Prefer ephemeral session creation when supported by SDK.
         if hasattr(client, "realtime") and hasattr(client.realtime, "sessions"):
-            session = client.realtime.sessions.create(model=self._config.model)
+            with get_client_registry().limit("realtime_session"):
+                session = client.realtime.sessions.create(model=self._config.model)
             client_secret = getattr(session, "client_secret", None)
             if client_secret is not None:
                 bearer_token = getattr(client_secret, "value", None)
 
-        wss_url = self._build_wss_url(self._config.base_url, self._config.model)
-        return RealtimeSessionInfo(wss_url=wss_url, bearer_token=bearer_token, model=self._config.model)
+        return RealtimeSessionInfo(wss_url=self.wss_url, bearer_token=bearer_token, model=self._config.model)
+
+    async def create_session_async(self) -> RealtimeSessionInfo:
+        # Pooled sockets authenticate with the API key, so skip minting an ephemeral token.
+        if get_upstream_pool(self.wss_url, self._config.api_key) is not None:
+            return RealtimeSessionInfo(wss_url=self.wss_url, bearer_token=None, model=self._config.model)
+
+        bearer_token = await self._token_cache.get(
+            (self._config.api_key, self._config.model), self._mint_ephemeral_token
+        )
+        return RealtimeSessionInfo(wss_url=self.wss_url, bearer_token=bearer_token, model=self._config.model)
+
+    async def _mint_ephemeral_token(self) -> tuple[Optional[str], Optional[float]]:
+        client = get_async_openai_client(self._config.api_key)
+        if not (hasattr(client, "realtime") and hasattr(client.realtime, "sessions")):
+            return None, None
+        async with get_client_registry().async_limit("realtime_session"):
+            session = await client.realtime.sessions.create(model=self._config.model)
+        client_secret = getattr(session, "client_secret", None)
+        if client_secret is None:
+            return None, None
+        return getattr(client_secret, "value", None), getattr(client_secret, "expires_at", None)
+
+    @property
+    def wss_url(self) -> str:
+        return self._build_wss_url(self._config.base_url, self._config.model)
 
     @staticmethod
     def _build_wss_url(base_url: str, model: str) -> str:
@@ -111,17 +188,22 @@ class RealtimeWebSocketClient:
                 await asyncio.sleep(0.5)
 
     async def _connect(self) -> None:
+        self._ws = await claim_upstream(self._session.wss_url, self._api_key)
+        if self._ws is None:
+            self._ws = await self._connect_cold()
+        self._connected_event.set()
+
+        if self._session_config:
+            await self.send_event({"type": "session.update", "session": self._session_config})
+
+    async def _connect_cold(self) -> WebSocketClientProtocol:
         bearer = self._session.bearer_token or self._api_key
         headers = {
             "Authorization": f"Bearer {bearer}",
             "OpenAI-Beta": "realtime=v1",
         }
         connect_kwargs = self._build_connect_kwargs(headers)
-        self._ws = await websockets.connect(self._session.wss_url, **connect_kwargs)
-        self._connected_event.set()
-
-        if self._session_config:
-            await self.send_event({"type": "session.update", "session": self._session_config})
+        return await websockets.connect(self._session.wss_url, **connect_kwargs)
 
     async def _run_loop(self) -> None:
         if self._ws is None:
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import json
-from typing import Callable, Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
 
+from .question_cache import FollowUpQuestionCache, QuestionKey
 from .scenario_state import ScenarioState
 
-Extractor = Callable[[str], dict[str, Optional[str]]]
-QuestionGenerator = Callable[[ScenarioState, list[str]], str]
-FinalGenerator = Callable[[ScenarioState], str]
+T = TypeVar("T")
+MaybeAwaitable = Union[T, Awaitable[T]]
+
+Extractor = Callable[[str], MaybeAwaitable[dict[str, Optional[str]]]]
+QuestionGenerator = Callable[[ScenarioState, list[str]], MaybeAwaitable[str]]
+FinalGenerator = Callable[[ScenarioState], MaybeAwaitable[str]]
 
 
 class ScenarioBuilder:
@@ -21,6 +27,8 @@ class ScenarioBuilder:
         fallback_generator: FinalGenerator | None = None,
         max_attempts: int = 3,
         fallback_korean_prompt: str = "음성이 잘 들리지 않았어요. 다시 말해 주세요.",
+        question_cache: FollowUpQuestionCache | None = None,
+        speculative: bool = False,
         logger=None,
     ) -> None:
         self._state = state or ScenarioState()
@@ -31,6 +39,9 @@ class ScenarioBuilder:
         self._max_attempts = max_attempts
         self._fallback_korean_prompt = fallback_korean_prompt
         self._logger = logger
+        self._question_cache = question_cache
+        self._speculative = speculative
+        self._speculation: Optional[tuple[str, QuestionKey, Optional[asyncio.Task]]] = None
         self._default_questions = {
             "place": "Where are you having this conversation?",
             "partner": "Who are you talking to?",
@@ -41,20 +52,28 @@ class ScenarioBuilder:
     def state(self) -> ScenarioState:
         return self._state
 
-    def ingest_user_text(self, text: str) -> None:
+    async def ingest_user_text(self, text: str) -> None:
         if not text.strip():
             return
         if self._state.completed:
             return
         if self._extractor is None:
             return
-        extracted = self._extractor(text)
+        if self._speculative:
+            self._start_speculation()
+        try:
+            extracted = await self._resolve(self._extractor(text))
+        except Exception as exc:
+            self._log_warning("Field extraction failed: %s", exc)
+            return
         self._state.update_from_extraction(extracted)
+        if self._speculation is not None and self._speculation[0] not in self._state.missing_fields():
+            self.cancel_speculation()
 
     def get_missing_fields(self) -> list[str]:
         return self._state.missing_fields()
 
-    def build_follow_up_question(self) -> str | None:
+    async def build_follow_up_question(self) -> str | None:
         if self._state.completed:
             return None
         missing = self.get_missing_fields()
@@ -62,19 +81,45 @@ class ScenarioBuilder:
             return None
         if self._state.attempts >= self._max_attempts:
             return None
-        target = next((field for field in missing if field not in self._state.asked_fields), None)
-        if target is None:
-            target = missing[0]
+        target = self._next_target(missing)
         self._state.asked_fields.add(target)
         self._state.attempts += 1
+        response = self._default_questions.get(target, self._default_questions["goal"])
         if self._question_generator:
-            response = self._question_generator(self._state, [target])
-        else:
-            response = self._default_questions.get(target, self._default_questions["goal"])
+            try:
+                response = await self._generated_question(target)
+            except Exception as exc:
+                self._log_warning("Follow-up generation failed, using default question: %s", exc)
         response = self._sanitize_question(response)
         return response
 
-    def finalize_scenario(self) -> str:
+    async def prebuild_questions(self) -> None:
+        """Fill the question cache for every target field of an empty scenario."""
+        if self._question_generator is None or self._question_cache is None:
+            return
+        empty = ScenarioState()
+        pending = []
+        for target in empty.missing_fields():
+            key = self._question_key(target, empty)
+            if key not in self._question_cache:
+                pending.append(self._generate_and_cache(target, empty, key))
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self._log_warning("Question prebuild failed: %s", result)
+
+    def cancel_speculation(self) -> None:
+        speculation, self._speculation = self._speculation, None
+        if speculation is None or speculation[2] is None:
+            return
+        task = speculation[2]
+        if task.done():
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
+    async def finalize_scenario(self) -> str:
         if self._state.completed:
             place = self._state.place or ""
             partner = self._state.partner or ""
@@ -83,9 +128,12 @@ class ScenarioBuilder:
                 f"Great. You're at {place} talking to {partner} because you want to {goal}. Let's start."
             )
         self._state.completed = True
+        self.cancel_speculation()
         if self._final_generator:
-            response = self._final_generator(self._state)
-            return response
+            try:
+                return await self._resolve(self._final_generator(self._state))
+            except Exception as exc:
+                self._log_warning("Final response generation failed, using template: %s", exc)
         place = self._state.place or ""
         partner = self._state.partner or ""
         goal = self._state.goal or ""
@@ -94,19 +142,22 @@ class ScenarioBuilder:
         )
         return response
 
-    def finalize_with_fallback(self) -> str:
+    async def finalize_with_fallback(self) -> str:
         if self._state.completed:
-            return self.finalize_scenario()
+            return await self.finalize_scenario()
         if self._fallback_generator:
             for attempt in range(2):
-                response = self._fallback_generator(self._state)
+                try:
+                    response = await self._resolve(self._fallback_generator(self._state))
+                except Exception as exc:
+                    self._log_warning("Fallback generation failed (attempt %s): %s", attempt + 1, exc)
+                    continue
                 extracted = self._extract_json_object(response)
                 if extracted:
                     self._state.update_from_extraction(extracted)
-                    return self.finalize_scenario()
-                if self._logger:
-                    self._logger.warning("Fallback JSON parse failed (attempt %s)", attempt + 1)
-        return self.finalize_scenario()
+                    return await self.finalize_scenario()
+                self._log_warning("Fallback JSON parse failed (attempt %s)", attempt + 1)
+        return await self.finalize_scenario()
 
     def ensure_defaults(self) -> None:
         self._fill_defaults_if_missing()
@@ -114,6 +165,66 @@ class ScenarioBuilder:
     def _fill_defaults_if_missing(self) -> None:
         return
 
+    def _next_target(self, missing: list[str]) -> str:
+        target = next((field for field in missing if field not in self._state.asked_fields), None)
+        return target or missing[0]
+
+    def _question_key(self, target: str, state: ScenarioState) -> QuestionKey:
+        return FollowUpQuestionCache.make_key(target, state.place, state.partner, state.goal)
+
+    def _start_speculation(self) -> None:
+        self.cancel_speculation()
+        if self._question_generator is None or self._state.attempts >= self._max_attempts:
+            return
+        missing = self._state.missing_fields()
+        if not missing:
+            return
+        target = self._next_target(missing)
+        snapshot = dataclasses.replace(self._state, asked_fields=set(self._state.asked_fields))
+        key = self._question_key(target, snapshot)
+        if self._question_cache is not None and key in self._question_cache:
+            self._speculation = (target, key, None)
+            return
+        task = asyncio.create_task(self._generate_and_cache(target, snapshot, key))
+        self._speculation = (target, key, task)
+
+    async def _generated_question(self, target: str) -> str:
+        speculation = self._speculation
+        if speculation is not None and speculation[0] == target:
+            self._speculation = None
+            _, key, task = speculation
+            if task is not None:
+                return await task
+            cached = self._question_cache.get(key) if self._question_cache is not None else None
+            if cached is not None:
+                return cached
+        self.cancel_speculation()
+        key = self._question_key(target, self._state)
+        if self._question_cache is not None:
+            cached = self._question_cache.get(key)
+            if cached is not None:
+                return cached
+        return await self._generate_and_cache(target, self._state, key)
+
+    async def _generate_and_cache(self, target: str, state: ScenarioState, key: QuestionKey) -> str:
+        async def generate() -> str:
+            return await self._resolve(self._question_generator(state, [target]))
+
+        if self._question_cache is None:
+            return await generate()
+        # Joins a generation already running for this key (prebuild, speculation or another session).
+        return await self._question_cache.get_or_generate(key, generate)
+
+    @staticmethod
+    async def _resolve(result: Any) -> Any:
+        if hasattr(result, "__await__"):
+            return await result
+        return result
+
+    def _log_warning(self, message: str, *args: Any) -> None:
+        if self._logger:
+            self._logger.warning(message, *args)
+
     @staticmethod
     def _extract_json_object(text: str) -> dict[str, str | None] | None:
         start = text.find("{")
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional
+
+PayloadSender = Callable[[Any], Awaitable[None]]
+
+
+class ClientSendQueue:
+    """Per-connection outbound queue drained by a dedicated writer task.
+
+    Producers (the OpenAI read loop) enqueue without awaiting the client socket.
+    Once the backlog reaches ``high_watermark`` the oldest droppable frames
+    (stale audio deltas) are shed until it falls back to ``low_watermark``.
+    Non-droppable frames are never shed; if ``max_size`` of them pile up the
+    producer waits for the writer.
+    """
+
+    def __init__(
+        self,
+        send: PayloadSender,
+        *,
+        max_size: int = 256,
+        high_watermark: int = 128,
+        low_watermark: int = 32,
+        drop_stale_audio: bool = True,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if not 0 <= low_watermark < high_watermark <= max_size:
+            raise ValueError("Expected 0 <= low_watermark < high_watermark <= max_size")
+        self._send = send
+        self._max_size = max_size
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        self._drop_stale_audio = drop_stale_audio
+        self._logger = logger or logging.getLogger(__name__)
+        self._items: Deque[tuple[Any, bool]] = deque()
+        self._not_empty = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+        self.shed = 0
+        self.peak_depth = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            _live_queues.add(self)
+
+    async def put(self, payload: Any, *, droppable: bool = False) -> None:
+        if self._closed:
+            self.dropped += 1
+            return
+        self._items.append((payload, droppable))
+        if len(self._items) >= self._high_watermark and self._drop_stale_audio:
+            self._shed_stale()
+        self.peak_depth = max(self.peak_depth, len(self._items))
+        self._not_empty.set()
+        if len(self._items) >= self._max_size:
+            self._has_space.clear()
+            await self._has_space.wait()
+
+    async def close(self, *, drain_timeout: float = 2.0) -> None:
+        _live_queues.discard(self)
+        if self._task is None:
+            self._closed = True
+            return
+        if not self._closed and self._items:
+            try:
+                await asyncio.wait_for(self._wait_drained(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                self._logger.warning("Outbound queue drain timed out (%s pending)", len(self._items))
+        self._closed = True
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._release_pending()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "depth": len(self._items),
+            "peak_depth": self.peak_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "shed": self.shed,
+        }
+
+    def _shed_stale(self) -> None:
+        excess = len(self._items) - self._low_watermark
+        kept: Deque[tuple[Any, bool]] = deque()
+        for item in self._items:
+            if excess > 0 and item[1]:
+                excess -= 1
+                self.dropped += 1
+                self.shed += 1
+                continue
+            kept.append(item)
+        self._items = kept
+
+    async def _wait_drained(self) -> None:
+        while self._items and not self._closed:
+            await asyncio.sleep(0.01)
+
+    async def _run(self) -> None:
+        while True:
+            if not self._items:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+            payload, _ = self._items.popleft()
+            if len(self._items) <= self._low_watermark:
+                self._has_space.set()
+            try:
+                await self._send(payload)
+            except Exception as exc:
+                self._logger.warning("Outbound send failed, closing queue: %s", exc)
+                self._closed = True
+                self._release_pending()
+                return
+            self.sent += 1
+
+    def _release_pending(self) -> None:
+        self.dropped += len(self._items)
+        self._items.clear()
+        self._has_space.set()
+
+
+_live_queues: "weakref.WeakSet[ClientSendQueue]" = weakref.WeakSet()
+
+
+def live_send_queue_stats() -> dict[str, Any]:
+    """Aggregate stats of the queues of currently open connections in this process."""
+    queues = [queue.stats() for queue in list(_live_queues)]
+    return {
+        "connections": len(queues),
+        "depth": sum(stats["depth"] for stats in queues),
+        "max_depth": max((stats["depth"] for stats in queues), default=0),
+        "peak_depth": max((stats["peak_depth"] for stats in queues), default=0),
+        "sent": sum(stats["sent"] for stats in queues),
+        "dropped": sum(stats["dropped"] for stats in queues),
+        "shed": sum(stats["shed"] for stats in queues),
+    }
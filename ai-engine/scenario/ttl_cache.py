@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# A load returns the value and the time it expires at (None: do not cache).
+Loader = Callable[[], Awaitable[tuple[Optional[V], Optional[float]]]]
+
+
+class TTLCache(Generic[K, V]):
+    """LRU map whose entries expire at a per-entry time. Thread-safe.
+
+    ``max_entries=None`` means unbounded; ``0`` disables caching.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        self._max_entries = None if max_entries is None else max(max_entries, 0)
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key: K) -> Optional[V]:
+        """Return the live value for ``key`` without counting a lookup."""
+        with self._lock:
+            return self._lookup(key)
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: K, value: V, expires_at: float) -> None:
+        if self._max_entries == 0 or expires_at <= self._clock():
+            return
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if self._max_entries is not None:
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _lookup(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+
+class SingleFlightCache(TTLCache[K, V]):
+    """TTLCache whose misses are filled by one shared load per key.
+
+    Concurrent misses for the same key await the same task. The task is
+    shielded, so a waiter being cancelled does not cancel the load for the
+    others. For use from a single event loop.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        super().__init__(max_entries, clock)
+        self._inflight: dict[K, asyncio.Task] = {}
+        self._background: set[asyncio.Task] = set()
+        self.coalesced = 0
+
+    def inflight(self, key: K) -> Optional[asyncio.Task]:
+        return self._inflight.get(key)
+
+    async def get_or_load(self, key: K, loader: Loader) -> Optional[V]:
+        value = self.peek(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        if key in self._inflight:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+        return await asyncio.shield(self.load(key, loader))
+
+    def load(self, key: K, loader: Loader) -> asyncio.Task:
+        """Start loading ``key`` in the background, or return the load already running."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, loader))
+            self._inflight[key] = task
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+        return task
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> None:
+        """Drop matching entries and cancel their in-flight loads."""
+        super().discard_where(predicate)
+        for key, task in list(self._inflight.items()):
+            if predicate(key):
+                task.cancel()
+
+    def clear(self) -> None:
+        super().clear()
+        self.coalesced = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
+
+    async def _run(self, key: K, loader: Loader) -> Optional[V]:
+        try:
+            value, expires_at = await loader()
+        finally:
+            self._inflight.pop(key, None)
+        if value is not None and expires_at is not None:
+            self.put(key, value, expires_at)
+        return value
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
+
+from .tts_stream import DEFAULT_TTS_MODEL, DEFAULT_TTS_VOICE
+
+PCMBuffer = Union[bytes, mmap.mmap]
+
+DEFAULT_TTS_SAMPLE_RATE = 24000
+
+
+class TTSCache:
+    """Content-addressed PCM16 cache for synthesized speech.
+
+    Entries are keyed on text, voice, model and sample rate and kept in an LRU
+    bounded by ``max_bytes``. When ``cache_dir`` is set, entries are also written
+    to disk and memory-mapped back on a miss, so repeated prompts survive restarts.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 32 * 1024 * 1024,
+        cache_dir: Optional[Union[str, Path]] = None,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._max_bytes = max(max_bytes, 0)
+        self._entries: "OrderedDict[str, PCMBuffer]" = OrderedDict()
+        self._size = 0
+        self._dir = Path(cache_dir) if cache_dir else None
+        self._logger = logger or logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+        if self._dir is not None:
+            self._dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        text: str,
+        *,
+        voice: str = DEFAULT_TTS_VOICE,
+        model: str = DEFAULT_TTS_MODEL,
+        sample_rate: int = DEFAULT_TTS_SAMPLE_RATE,
+    ) -> str:
+        material = "\x1f".join([model, voice, str(sample_rate), text.strip()])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[PCMBuffer]:
+        pcm = self._entries.get(key)
+        if pcm is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return pcm
+        pcm = self._load(key)
+        if pcm is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, pcm)
+        return pcm
+
+    def put(self, key: str, pcm: bytes) -> None:
+        if not pcm:
+            return
+        pcm = bytes(pcm)
+        self._remember(key, pcm)
+        self._store(key, pcm)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _remember(self, key: str, pcm: PCMBuffer) -> None:
+        if len(pcm) > self._max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = pcm
+        self._size += len(pcm)
+        while self._size > self._max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self._dir is None:
+            return None
+        return self._dir / f"{key}.pcm"
+
+    def _load(self, key: str) -> Optional[PCMBuffer]:
+        path = self._path(key)
+        if path is None or not path.is_file():
+            return None
+        try:
+            with path.open("rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    return None
+                return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as exc:
+            self._logger.warning("TTS cache load failed (%s): %s", path.name, exc)
+            return None
+
+    def _store(self, key: str, pcm: bytes) -> None:
+        path = self._path(key)
+        if path is None or path.exists():
+            return
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(pcm)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            self._logger.warning("TTS cache store failed (%s): %s", path.name, exc)
+            tmp_path.unlink(missing_ok=True)
+
+
+async def iter_cached_pcm16(
+    pcm: PCMBuffer,
+    sample_rate: int,
+    *,
+    piece_size: int = 4800,
+) -> AsyncIterator[tuple[bytes, int]]:
+    view = memoryview(pcm)
+    try:
+        for offset in range(0, len(view), piece_size):
+            yield bytes(view[offset : offset + piece_size]), sample_rate
+    finally:
+        view.release()
+
+
+async def cache_pcm16_stream(
+    cache: TTSCache,
+    key: str,
+    chunks: AsyncIterator[tuple[bytes, int]],
+    *,
+    sample_rate: int = DEFAULT_TTS_SAMPLE_RATE,
+) -> AsyncIterator[tuple[bytes, int]]:
+    """Pass ``chunks`` through and store the PCM once the stream finishes uninterrupted."""
+    collected = bytearray()
+    complete = False
+    try:
+        async for data, rate in chunks:
+            if rate != sample_rate:
+                sample_rate = -1
+            collected.extend(data)
+            yield data, rate
+        complete = True
+    finally:
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    if complete and sample_rate > 0:
+        cache.put(key, bytes(collected))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Deque
+
+RECENT_SAMPLES = 1024
+
+
+class TimeToFirstAudioMetrics:
+    """Process-wide time from a scenario reply being requested to its first audio chunk.
+
+    Percentiles are computed over the most recent ``RECENT_SAMPLES`` replies.
+    """
+
+    def __init__(self, recent_samples: int = RECENT_SAMPLES) -> None:
+        self._lock = threading.Lock()
+        self._recent_samples = recent_samples
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+            self.cache_hits = 0
+            self._sum_ms = 0.0
+            self._max_ms = 0.0
+            self._recent: Deque[float] = deque(maxlen=self._recent_samples)
+
+    def record(self, elapsed_ms: float, *, cached: bool = False) -> None:
+        with self._lock:
+            self.count += 1
+            if cached:
+                self.cache_hits += 1
+            self._sum_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+            self._recent.append(elapsed_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent)
+            count = self.count
+            return {
+                "count": count,
+                "cache_hits": self.cache_hits,
+                "avg_ms": round(self._sum_ms / count, 1) if count else 0.0,
+                "p50_ms": round(_percentile(recent, 0.5), 1),
+                "p95_ms": round(_percentile(recent, 0.95), 1),
+                "max_ms": round(self._max_ms, 1),
+            }
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+tts_first_audio_metrics = TimeToFirstAudioMetrics()
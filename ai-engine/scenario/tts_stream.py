@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import struct
+from typing import Any, AsyncContextManager, AsyncIterator, Optional, TypeVar
+
+T = TypeVar("T")
+_DONE = object()
+
+DEFAULT_TTS_MODEL = "gpt-4o-mini-tts"
+DEFAULT_TTS_VOICE = "alloy"
+
+
+class WavStreamParser:
+    """Incremental RIFF/WAVE parser that yields PCM bytes as soon as the data chunk starts.
+
+    Streamed WAV responses carry a placeholder data size, so everything after the
+    ``data`` chunk header is treated as PCM. Output is always frame-aligned.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._offset = 0
+        self._in_data = False
+        self._carry = b""
+        self.audio_format: Optional[int] = None
+        self.channels: Optional[int] = None
+        self.sample_rate: Optional[int] = None
+        self.sample_width: Optional[int] = None
+
+    @property
+    def header_parsed(self) -> bool:
+        return self._in_data
+
+    def feed(self, data: bytes) -> bytes:
+        if self._in_data:
+            return self._align(data)
+        self._buffer.extend(data)
+        self._parse_header()
+        if not self._in_data:
+            return b""
+        rest = bytes(self._buffer)
+        self._buffer.clear()
+        return self._align(rest)
+
+    def _parse_header(self) -> None:
+        buf = self._buffer
+        if self._offset == 0:
+            if len(buf) < 12:
+                return
+            if buf[0:4] != b"RIFF" or buf[8:12] != b"WAVE":
+                raise ValueError("TTS stream is not RIFF/WAVE")
+            self._offset = 12
+        while len(buf) >= self._offset + 8:
+            chunk_id = bytes(buf[self._offset : self._offset + 4])
+            (size,) = struct.unpack_from("<I", buf, self._offset + 4)
+            body = self._offset + 8
+            if chunk_id == b"data":
+                if self.sample_rate is None:
+                    raise ValueError("WAV data chunk arrived before fmt chunk")
+                del buf[:body]
+                self._offset = 0
+                self._in_data = True
+                return
+            end = body + size + (size & 1)
+            if len(buf) < end:
+                return
+            if chunk_id == b"fmt ":
+                (
+                    self.audio_format,
+                    self.channels,
+                    self.sample_rate,
+                    _byte_rate,
+                    _block_align,
+                    bits_per_sample,
+                ) = struct.unpack_from("<HHIIHH", buf, body)
+                self.sample_width = bits_per_sample // 8
+            self._offset = end
+
+    def _align(self, data: bytes) -> bytes:
+        frame_size = (self.sample_width or 1) * (self.channels or 1)
+        if self._carry:
+            data = self._carry + data
+        remainder = len(data) % frame_size
+        if remainder:
+            self._carry = data[-remainder:]
+            return data[:-remainder]
+        self._carry = b""
+        return data
+
+
+async def stream_tts_pcm16(
+    client: Any,
+    text: str,
+    *,
+    model: str = DEFAULT_TTS_MODEL,
+    voice: str = DEFAULT_TTS_VOICE,
+    read_size: int = 4096,
+) -> AsyncIterator[tuple[bytes, int]]:
+    """Stream ``(pcm16_bytes, sample_rate)`` pieces from an ``AsyncOpenAI`` TTS request."""
+    parser = WavStreamParser()
+    async with client.audio.speech.with_streaming_response.create(
+        model=model,
+        voice=voice,
+        input=text,
+        response_format="wav",
+    ) as response:
+        async for data in response.iter_bytes(read_size):
+            pcm = parser.feed(data)
+            if not pcm:
+                continue
+            if parser.sample_width != 2 or parser.channels != 1:
+                raise ValueError("TTS WAV must be 16-bit mono PCM")
+            yield pcm, parser.sample_rate
+
+
+async def read_ahead(
+    chunks: AsyncIterator[T],
+    *,
+    limit: Optional[AsyncContextManager[Any]] = None,
+) -> AsyncIterator[T]:
+    """Read ``chunks`` on a background task and yield them as they arrive.
+
+    The source is drained as fast as it produces, so ``limit`` (e.g. the TTS
+    concurrency slot) is held only while the HTTP stream is read, not while the
+    consumer paces playback. Stopping early cancels the read.
+    """
+    queue: asyncio.Queue[tuple[Any, Optional[Exception]]] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async with limit if limit is not None else contextlib.nullcontext():
+                async for item in chunks:
+                    queue.put_nowait((item, None))
+        except Exception as exc:
+            queue.put_nowait((None, exc))
+            return
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        queue.put_nowait((_DONE, None))
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        if not producer.done():
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
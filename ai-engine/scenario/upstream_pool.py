@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Optional
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_IDLE_SEC = 300.0
+READY_TIMEOUT_SEC = 10.0
+REFILL_BACKOFF_MAX_SEC = 30.0
+
+Connector = Callable[[], Awaitable[Any]]
+
+
+def is_socket_open(ws: Any) -> bool:
+    return getattr(ws, "close_code", None) is None
+
+
+async def _close_quietly(ws: Any) -> None:
+    try:
+        await ws.close()
+    except Exception:
+        pass
+
+
+@dataclass
+class _IdleSocket:
+    ws: Any
+    ready_at: float
+
+
+class UpstreamPool:
+    """Per-process pool of pre-connected OpenAI Realtime sockets.
+
+    A pooled socket has completed the websocket + TLS handshake and received
+    ``session.created``. The session-specific ``session.update`` is still sent
+    by the caller after claiming, since instructions, voice and history differ
+    per session. Sockets idle longer than ``max_idle_sec`` are closed and
+    replaced in the background.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        size: int = DEFAULT_POOL_SIZE,
+        max_idle_sec: float = DEFAULT_MAX_IDLE_SEC,
+        connector: Optional[Connector] = None,
+        clock: Callable[[], float] = time.monotonic,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.url = url
+        self.api_key = api_key
+        self.size = max(size, 0)
+        self.max_idle_sec = max_idle_sec
+        self._connector = connector or self._default_connect
+        self._clock = clock
+        self._logger = logger or logging.getLogger(__name__)
+        self._idle: Deque[_IdleSocket] = deque()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._backoff = 1.0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.failures = 0
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def start(self) -> None:
+        if self._task is None and self.size > 0:
+            self._closed = False
+            self._task = asyncio.create_task(self._refill_loop())
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._idle:
+            await _close_quietly(self._idle.popleft().ws)
+
+    async def claim(self) -> Optional[Any]:
+        """Return a ready socket, or None when the pool is empty (caller connects cold)."""
+        while self._idle:
+            entry = self._idle.popleft()
+            if self._is_usable(entry):
+                self.hits += 1
+                self._wake.set()
+                return entry.ws
+            self.expired += 1
+            await _close_quietly(entry.ws)
+        self.misses += 1
+        self._wake.set()
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        claims = self.hits + self.misses
+        return {
+            "url": self.url,
+            "size": self.size,
+            "idle": len(self._idle),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "failures": self.failures,
+            "hit_rate": round(self.hits / claims, 4) if claims else 0.0,
+        }
+
+    def _is_usable(self, entry: _IdleSocket) -> bool:
+        return is_socket_open(entry.ws) and self._clock() - entry.ready_at < self.max_idle_sec
+
+    async def _reap(self) -> None:
+        kept: Deque[_IdleSocket] = deque()
+        while self._idle:
+            entry = self._idle.popleft()
+            if self._is_usable(entry):
+                kept.append(entry)
+            else:
+                self.expired += 1
+                await _close_quietly(entry.ws)
+        self._idle.extend(kept)
+
+    async def _refill_loop(self) -> None:
+        reap_interval = max(min(self.max_idle_sec / 4, 30.0), 0.5)
+        while not self._closed:
+            self._wake.clear()
+            await self._reap()
+            missing = self.size - len(self._idle)
+            if missing > 0:
+                results = await asyncio.gather(
+                    *(self._fill_one() for _ in range(missing)), return_exceptions=True
+                )
+                errors = [result for result in results if isinstance(result, Exception)]
+                if errors:
+                    self.failures += len(errors)
+                    self._logger.warning(
+                        "Realtime pool refill failed (%d/%d): %s", len(errors), missing, errors[0]
+                    )
+                    await asyncio.sleep(self._backoff)
+                    self._backoff = min(self._backoff * 2, REFILL_BACKOFF_MAX_SEC)
+                else:
+                    self._backoff = 1.0
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=reap_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fill_one(self) -> None:
+        ws = await self._prime()
+        if self._closed:
+            await _close_quietly(ws)
+            return
+        self._idle.append(_IdleSocket(ws=ws, ready_at=self._clock()))
+
+    async def _prime(self) -> Any:
+        ws = await self._connector()
+        try:
+            await asyncio.wait_for(self._wait_session_created(ws), timeout=READY_TIMEOUT_SEC)
+        except BaseException:
+            await _close_quietly(ws)
+            raise
+        return ws
+
+    @staticmethod
+    async def _wait_session_created(ws: Any) -> None:
+        while True:
+            event = json.loads(await ws.recv())
+            event_type = event.get("type")
+            if event_type == "session.created":
+                return
+            if event_type == "error":
+                raise RuntimeError(f"Realtime session error: {event.get('error')}")
+
+    async def _default_connect(self) -> Any:
+        if websockets is None:
+            raise RuntimeError("websockets dependency is required for Realtime API")
+        return await websockets.connect(
+            self.url,
+            additional_headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "OpenAI-Beta": "realtime=v1",
+            },
+        )
+
+
+_pools: dict[tuple[str, str], UpstreamPool] = {}
+
+
+def register_upstream_pool(pool: UpstreamPool) -> UpstreamPool:
+    """Register and start ``pool`` for its (url, api_key). Call from a running event loop."""
+    _pools[(pool.url, pool.api_key)] = pool
+    pool.start()
+    return pool
+
+
+def get_upstream_pool(url: str, api_key: str) -> Optional[UpstreamPool]:
+    return _pools.get((url, api_key))
+
+
+async def claim_upstream(url: str, api_key: str) -> Optional[Any]:
+    pool = get_upstream_pool(url, api_key)
+    if pool is None:
+        return None
+    return await pool.claim()
+
+
+async def close_upstream_pools() -> None:
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
+
+
+def upstream_pool_stats() -> list[dict[str, Any]]:
+    return [pool.stats() for pool in _pools.values()]
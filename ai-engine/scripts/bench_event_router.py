@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: Realtime events/sec for one scenario session.
+
+Compares the old fan-out chain (every handler sees every event) with the
+type-keyed RealtimeEventRouter, using the bridge's handler set and a
+traffic mix dominated by audio deltas.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from scenario.audio_relay import RealtimeAudioRelay
+from scenario.realtime_handlers import RealtimeEventRouter, fanout_event_handler
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
+
+AUDIO_DELTA = {"type": "response.audio.delta", "delta": "AAAA" * 800}
+
+
+def build_events(count: int, audio_share: float) -> list[dict[str, Any]]:
+    others = [
+        {"type": "response.audio_transcript.delta", "transcript_delta": "Hi"},
+        {"type": "rate_limits.updated"},
+        {"type": "response.output_item.added", "item": {}},
+        {"type": "conversation.item.created", "item": {"role": "assistant", "content": []}},
+        {"type": "response.done"},
+    ]
+    every = max(int(round(1 / (1 - audio_share))), 2) if audio_share < 1 else count + 1
+    return [others[i % len(others)] if i % every == 0 else AUDIO_DELTA for i in range(count)]
+
+
+def build_session() -> tuple[dict[str, Any], RealtimeAudioRelay, RealtimeScenarioPipeline]:
+    async def sink(_: Any) -> None:
+        return None
+
+    state = {"speaking": False, "user_transcripts": []}
+    relay = RealtimeAudioRelay(on_audio_chunk_base64=sink, on_transcript=lambda text, final: None)
+    builder = SimpleNamespace(state=SimpleNamespace(completed=False))
+    pipeline = RealtimeScenarioPipeline(builder, sink)
+    return state, relay, pipeline
+
+
+def build_fanout() -> Any:
+    state, relay, pipeline = build_session()
+
+    async def log_event_type(event: dict[str, Any]) -> None:
+        event_type = event.get("type", "unknown")
+        if event_type == "session.updated":
+            pass
+        if event_type == "input_audio_buffer.cleared":
+            pass
+        if event_type == "error":
+            pass
+        if event_type == "input_audio_buffer.speech_started":
+            pass
+        if event_type == "response.audio.delta":
+            state["speaking"] = True
+        if event_type == "response.audio.done":
+            state["speaking"] = False
+
+    async def forward_user_transcript(event: dict[str, Any]) -> None:
+        event_type = event.get("type", "")
+        if event_type in (
+            "input_audio_buffer.transcription.completed",
+            "conversation.item.input_audio_transcription.completed",
+        ):
+            state["user_transcripts"].append(event.get("transcript"))
+
+    return fanout_event_handler([log_event_type, relay.handle_event, forward_user_transcript, pipeline.handle_event])
+
+
+def build_router() -> Any:
+    state, relay, pipeline = build_session()
+
+    def on_speaking(event: dict[str, Any]) -> None:
+        state["speaking"] = event["type"] == "response.audio.delta"
+
+    async def forward_user_transcript(event: dict[str, Any]) -> None:
+        state["user_transcripts"].append(event.get("transcript"))
+
+    router = RealtimeEventRouter()
+    router.subscribe(("response.audio.delta", "response.audio.done"), on_speaking)
+    router.subscribe_map(relay.event_routes())
+    router.subscribe(
+        ("input_audio_buffer.transcription.completed", "conversation.item.input_audio_transcription.completed"),
+        forward_user_transcript,
+    )
+    router.subscribe(RealtimeScenarioPipeline.EVENT_TYPES, pipeline.handle_event, concurrent=True)
+    return router.dispatch
+
+
+async def measure(dispatch: Any, events: list[dict[str, Any]], repeat: int) -> float:
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for event in events:
+            await dispatch(event)
+        elapsed = time.perf_counter() - start
+        best = max(best, len(events) / elapsed)
+        await asyncio.sleep(0)
+    return best
+
+
+async def run(count: int, audio_share: float, repeat: int) -> None:
+    events = build_events(count, audio_share)
+    fanout = await measure(build_fanout(), events, repeat)
+    router = await measure(build_router(), events, repeat)
+    print(f"events={count} audio_share={audio_share:.0%} (best of {repeat})")
+    print(f"  fanout chain : {fanout:>12,.0f} events/s")
+    print(f"  event router : {router:>12,.0f} events/s  ({router / fanout:.2f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Realtime event dispatch micro-benchmark.")
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--audio-share", type=float, default=0.95)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.events, args.audio_share, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
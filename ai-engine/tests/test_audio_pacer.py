@@ -0,0 +1,56 @@
+import asyncio
+import unittest
+
+from scenario.audio_pacer import AudioPacer, base64_decoded_length, pcm16_duration
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class AudioPacerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_lead_window_sent_immediately(self) -> None:
+        clock = FakeClock()
+        pacer = AudioPacer(lead_ms=300, clock=clock)
+
+        self.assertEqual([await pacer.wait_turn(0.1) for _ in range(3)], [True, True, True])
+        self.assertAlmostEqual(pacer.buffered_seconds(), 0.3)
+
+    async def test_playhead_does_not_drift(self) -> None:
+        clock = FakeClock()
+        pacer = AudioPacer(lead_ms=0, clock=clock)
+
+        for _ in range(10):
+            await pacer.wait_turn(0.1)
+            clock.now += 0.1
+        self.assertAlmostEqual(pacer._playhead, 101.0)
+
+    async def test_cancel_interrupts_wait(self) -> None:
+        pacer = AudioPacer(lead_ms=0)
+
+        await pacer.wait_turn(5.0)
+        waiter = asyncio.create_task(pacer.wait_turn(0.1))
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiter.done())
+        pacer.cancel()
+
+        self.assertFalse(await asyncio.wait_for(waiter, timeout=1.0))
+        self.assertTrue(pacer.cancelled)
+        self.assertEqual(pacer.epoch, 1)
+        self.assertEqual(pacer.buffered_seconds(), 0.0)
+        pacer.resume()
+        self.assertFalse(pacer.cancelled)
+
+    def test_duration_helpers(self) -> None:
+        self.assertAlmostEqual(pcm16_duration(4800, 24000), 0.1)
+        self.assertEqual(base64_decoded_length("AAAA"), 3)
+        self.assertEqual(base64_decoded_length("AAA="), 2)
+        self.assertEqual(base64_decoded_length("AA=="), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
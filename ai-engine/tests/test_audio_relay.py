@@ -1,6 +1,8 @@
+import asyncio
 import base64
 import unittest
 
+from scenario.audio_pacer import AudioPacer
 from scenario.audio_relay import RealtimeAudioRelay
 
 
@@ -24,6 +26,28 @@ class AudioRelayTests(unittest.IsolatedAsyncioTestCase):
         await relay.handle_event({"type": "response.audio_transcript.done", "transcript": "Hi there"})
         self.assertEqual(transcript_events, [("Hi", False), ("Hi there", True)])
 
+    async def test_paced_delta_does_not_block_and_cancel_drops_waiting_chunks(self) -> None:
+        chunks: list[str] = []
+        pacer = AudioPacer(lead_ms=0)
+        relay = RealtimeAudioRelay(on_audio_chunk_base64=chunks.append, pacer=pacer)
+        second = base64.b64encode(b"\x00" * 48000).decode("ascii")  # 1s of audio
+        try:
+            await relay.handle_event({"type": "response.audio.delta", "delta": second})
+            await asyncio.wait_for(
+                relay.handle_event({"type": "response.audio.delta", "delta": "AAAA"}), timeout=0.1
+            )
+            await relay.handle_event({"type": "response.audio.delta", "delta": "BBBB"})
+            await asyncio.sleep(0.01)
+            self.assertEqual(chunks, [second])  # "AAAA" is waiting in wait_turn
+
+            pacer.cancel()  # barge-in
+            await relay.handle_event({"type": "response.created"})
+            await relay.handle_event({"type": "response.audio.delta", "delta": "CCCC"})
+            await asyncio.sleep(0.01)
+            self.assertEqual(chunks, [second, "CCCC"])
+        finally:
+            await relay.close()
+
 
 if __name__ == "__main__":
     unittest.main()
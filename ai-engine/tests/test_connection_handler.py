@@ -0,0 +1,30 @@
+import json
+import unittest
+
+from realtime_conversation.connection_handler import rewrite_audio_delta_frame
+
+
+class AudioDeltaPassthroughTests(unittest.TestCase):
+    def test_rewrite_compact_frame(self) -> None:
+        frame = json.dumps(
+            {"type": "response.audio.delta", "event_id": "evt_1", "delta": "AAAA"},
+            separators=(",", ":"),
+        )
+        rewritten = rewrite_audio_delta_frame(frame)
+        payload = json.loads(rewritten)
+        self.assertEqual(payload["type"], "audio.delta")
+        self.assertEqual(payload["delta"], "AAAA")
+
+    def test_rewrite_spaced_frame(self) -> None:
+        frame = json.dumps({"type": "response.audio.delta", "delta": "BBBB"})
+        payload = json.loads(rewrite_audio_delta_frame(frame))
+        self.assertEqual(payload, {"type": "audio.delta", "delta": "BBBB"})
+
+    def test_control_events_not_rewritten(self) -> None:
+        self.assertIsNone(rewrite_audio_delta_frame('{"type":"response.audio.done"}'))
+        self.assertIsNone(rewrite_audio_delta_frame('{"type":"response.audio_transcript.delta","delta":"hi"}'))
+        self.assertIsNone(rewrite_audio_delta_frame(b'{"type":"response.audio.delta"}'))
+
+
+if __name__ == "__main__":
+    unittest.main()
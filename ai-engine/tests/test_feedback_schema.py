@@ -0,0 +1,68 @@
+import json
+import unittest
+
+from conversation_feedback.feedback_schema import (
+    FeedbackAnalysis,
+    merge_analyses,
+    parse_analysis,
+    response_format,
+    split_chunks,
+)
+
+
+def _messages(count):
+    return [
+        {"id": i, "role": "user" if i % 2 == 0 else "assistant", "content": f"line {i}"}
+        for i in range(count)
+    ]
+
+
+def _detail(message_id):
+    return {"message_id": message_id, "fb_before": "b", "fb_content": "c", "fb_after": "a"}
+
+
+class FeedbackSchemaTest(unittest.TestCase):
+    def test_response_format_is_strict_and_summary_is_optional(self):
+        schema = response_format(with_summary=True)["json_schema"]
+        self.assertTrue(schema["strict"])
+        self.assertEqual(schema["schema"]["required"], ["summary", "feedback_top3_ids", "feedback_details"])
+        chunk_schema = response_format(with_summary=False)["json_schema"]["schema"]
+        self.assertNotIn("summary", chunk_schema["properties"])
+
+    def test_parse_analysis_validates_and_falls_back_to_empty(self):
+        content = json.dumps({
+            "summary": "Ordered coffee.",
+            "feedback_top3_ids": [2],
+            "feedback_details": [_detail(2)],
+        })
+        analysis = parse_analysis(content)
+        self.assertEqual(analysis.summary, "Ordered coffee.")
+        self.assertEqual(analysis.feedback_details[0].message_id, 2)
+
+        self.assertEqual(parse_analysis('{"feedback_details": [{"message_id": "x"}]}'), FeedbackAnalysis())
+        self.assertEqual(parse_analysis(None), FeedbackAnalysis())
+
+    def test_split_chunks_overlaps_context_but_owns_disjoint_ids(self):
+        messages = _messages(10)
+        self.assertEqual(len(split_chunks(messages, 40)), 1)
+
+        chunks = split_chunks(messages, 4)
+        self.assertEqual([sorted(owned) for _, owned in chunks], [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]])
+        self.assertEqual([msg["id"] for msg in chunks[1][0]], [2, 3, 4, 5, 6, 7])
+
+    def test_merge_keeps_owned_learner_ids_and_interleaves_top3(self):
+        messages = _messages(10)
+        chunks = split_chunks(messages, 4)
+        analyses = [
+            FeedbackAnalysis(feedback_top3_ids=[2, 0], feedback_details=[_detail(2), _detail(0), _detail(1)]),
+            # 2는 앞 청크 담당(겹침 맥락), 99는 입력에 없는 ID
+            FeedbackAnalysis(feedback_top3_ids=[6, 2, 99], feedback_details=[_detail(6), _detail(2), _detail(99)]),
+            FeedbackAnalysis(feedback_top3_ids=[8], feedback_details=[_detail(8)]),
+        ]
+        top3, details = merge_analyses(messages, chunks, analyses)
+        self.assertEqual(top3, [2, 6, 8])
+        self.assertEqual([detail["message_id"] for detail in details], [0, 2, 6, 8])
+
+
+if __name__ == "__main__":
+    unittest.main()
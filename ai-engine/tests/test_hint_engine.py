@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+
+from realtime_hint.hint_engine import HintEngine
+
+
+class _Generator:
+    def __init__(self, hints=("a", "b", "c")):
+        self.calls = []
+        self.hints = list(hints)
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, messages, context):
+        self.calls.append(messages)
+        await self.release.wait()
+        return self.hints
+
+
+MESSAGES = [
+    {"role": "user", "content": "I'd like a coffee."},
+    {"role": "assistant", "content": "Sure, what size?"},
+]
+
+
+class HintEngineTest(unittest.IsolatedAsyncioTestCase):
+    async def test_repeated_requests_for_same_transcript_hit_cache(self):
+        generator = _Generator()
+        engine = HintEngine(generator)
+
+        self.assertEqual(await engine.get_hints("s1", MESSAGES), ["a", "b", "c"])
+        self.assertEqual(await engine.get_hints("s1", [dict(m) for m in MESSAGES]), ["a", "b", "c"])
+        self.assertEqual(len(generator.calls), 1)
+
+        # 대화가 바뀌면 새로 생성
+        await engine.get_hints("s1", MESSAGES + [{"role": "user", "content": "Large."}])
+        self.assertEqual(len(generator.calls), 2)
+        self.assertEqual(engine.stats()["hits"], 1)
+
+    async def test_concurrent_requests_are_coalesced(self):
+        generator = _Generator()
+        generator.release.clear()
+        engine = HintEngine(generator)
+
+        waiters = [asyncio.create_task(engine.get_hints("s1", MESSAGES)) for _ in range(5)]
+        await asyncio.sleep(0)
+        generator.release.set()
+        results = await asyncio.gather(*waiters)
+
+        self.assertEqual(results, [["a", "b", "c"]] * 5)
+        self.assertEqual(len(generator.calls), 1)
+        self.assertEqual(engine.stats()["coalesced"], 4)
+
+    async def test_prefetch_serves_later_request_and_failures_are_not_cached(self):
+        generator = _Generator()
+        engine = HintEngine(generator)
+
+        await engine.prefetch("s1", MESSAGES)
+        self.assertIsNone(engine.prefetch("s1", MESSAGES))  # 이미 캐시됨
+        self.assertEqual(await engine.get_hints("s1", MESSAGES), ["a", "b", "c"])
+        self.assertEqual(len(generator.calls), 1)
+
+        generator.hints = []
+        await engine.get_hints("s2", MESSAGES)
+        await engine.get_hints("s2", MESSAGES)
+        self.assertEqual(len(generator.calls), 3)
+
+    async def test_discard_session_drops_cache_and_cancels_inflight(self):
+        generator = _Generator()
+        engine = HintEngine(generator)
+        await engine.get_hints("s1", MESSAGES)
+
+        generator.release.clear()
+        task = engine.prefetch("s1", MESSAGES + [{"role": "user", "content": "Small."}])
+        await asyncio.sleep(0)
+        engine.discard_session("s1")
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(engine.stats()["entries"], 0)
+        self.assertEqual(engine.stats()["inflight"], 0)
+
+    async def test_request_waiting_on_discarded_session_gets_empty_hints(self):
+        generator = _Generator()
+        generator.release.clear()
+        engine = HintEngine(generator)
+        waiting = asyncio.create_task(engine.get_hints("s1", MESSAGES))
+        await asyncio.sleep(0)
+
+        engine.discard_session("s1")
+
+        self.assertEqual(await waiting, [])
+
+    async def test_cancelled_request_still_raises(self):
+        generator = _Generator()
+        generator.release.clear()
+        engine = HintEngine(generator)
+        waiting = asyncio.create_task(engine.get_hints("s1", MESSAGES))
+        await asyncio.sleep(0)
+
+        waiting.cancel()
+        engine.discard_session("s1")
+
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+
+
+if __name__ == "__main__":
+    unittest.main()
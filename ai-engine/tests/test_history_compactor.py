@@ -0,0 +1,104 @@
+import json
+import types
+import unittest
+
+from realtime_conversation.conversation_manager import ConversationManager
+from realtime_conversation.history_compactor import (
+    HistorySummary,
+    build_history_events,
+    compact_history,
+    summarize_history,
+)
+
+
+def _history(count):
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"turn {i}"}
+        for i in range(count)
+    ]
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+
+class _FakeCompletions:
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        message = types.SimpleNamespace(content="They talked about coffee.")
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+class HistoryCompactorTest(unittest.TestCase):
+    def test_short_history_is_replayed_verbatim(self):
+        summary, recent = compact_history(_history(5), keep_last=6)
+        self.assertIsNone(summary)
+        self.assertEqual(len(recent), 5)
+
+    def test_long_history_folds_into_one_summary_item(self):
+        summary, recent = compact_history(_history(200), keep_last=6)
+        self.assertEqual([msg["content"] for msg in recent], [f"turn {i}" for i in range(194, 200)])
+        self.assertIn("turn 193", summary)
+        self.assertEqual(len(build_history_events(summary, recent)), 7)
+
+    def test_cached_summary_is_used_and_lagging_part_is_condensed(self):
+        cached = HistorySummary("Ordered a latte.", message_count=10)
+        summary, recent = compact_history(_history(16), cached, keep_last=6)
+        self.assertEqual(summary, "Ordered a latte.")
+        self.assertEqual(len(recent), 6)
+
+        summary, _ = compact_history(_history(20), cached, keep_last=6)
+        self.assertTrue(summary.startswith("Ordered a latte."))
+        self.assertIn("turn 13", summary)
+        self.assertNotIn("turn 9", summary)
+
+
+class InjectHistoryTest(unittest.IsolatedAsyncioTestCase):
+    async def test_inject_history_sends_summary_first(self):
+        manager = ConversationManager()
+        manager.openai_ws = _FakeWebSocket()
+        await manager.inject_history(_history(2) + [{"role": "system", "content": "x"}], summary="Earlier.")
+
+        items = [event["item"] for event in manager.openai_ws.sent]
+        self.assertEqual([item["role"] for item in items], ["system", "user", "assistant"])
+        self.assertIn("Earlier.", items[0]["content"][0]["text"])
+        self.assertEqual(items[2]["content"][0]["type"], "text")
+
+    async def test_summarize_history_only_sends_new_turns(self):
+        completions = _FakeCompletions()
+        client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+
+        self.assertIsNone(await summarize_history(client, "m", _history(6), keep_last=6))
+        previous = HistorySummary("Ordered a latte.", message_count=10)
+        summary = await summarize_history(client, "m", _history(20), previous, keep_last=6)
+
+        self.assertEqual(summary, HistorySummary("They talked about coffee.", 14))
+        prompt = completions.calls[0]["messages"][1]["content"]
+        self.assertIn("Ordered a latte.", prompt)
+        self.assertIn("turn 10", prompt)
+        self.assertNotIn("turn 9", prompt)
+        self.assertIsNone(await summarize_history(client, "m", _history(20), summary, keep_last=6))
+
+    async def test_summarize_history_accepts_only_uncovered_tail(self):
+        completions = _FakeCompletions()
+        client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+        previous = HistorySummary("Ordered a latte.", message_count=10)
+
+        summary = await summarize_history(client, "m", _history(20)[10:], previous, keep_last=6, offset=10)
+
+        self.assertEqual(summary, HistorySummary("They talked about coffee.", 14))
+        prompt = completions.calls[0]["messages"][1]["content"]
+        self.assertIn("turn 10", prompt)
+        self.assertIn("turn 13", prompt)
+        self.assertNotIn("turn 14", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
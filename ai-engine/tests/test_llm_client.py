@@ -0,0 +1,63 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from scenario import llm_client
+from scenario.llm_client import AsyncOpenAIScenarioLLM, OpenAIScenarioLLM
+from scenario.scenario_state import ScenarioState
+
+
+class _Responses:
+    """responses.create that rejects response_format, like older SDKs."""
+
+    def __init__(self, text: str) -> None:
+        self.requests = []
+        self._text = text
+
+    def create(self, **request):
+        self.requests.append(request)
+        if "response_format" in request:
+            raise TypeError("unexpected keyword argument 'response_format'")
+        return SimpleNamespace(output_text=f" {self._text} ")
+
+
+class _AsyncResponses(_Responses):
+    async def create(self, **request):
+        return _Responses.create(self, **request)
+
+
+class ScenarioLLMTests(unittest.IsolatedAsyncioTestCase):
+    def test_sync_extract_retries_without_response_format(self) -> None:
+        responses = _Responses('{"place": "cafe", "partner": "barista", "goal": "order coffee"}')
+        with mock.patch.object(llm_client, "get_openai_client", return_value=SimpleNamespace(responses=responses)):
+            llm = OpenAIScenarioLLM("key", "model")
+        fields = llm.extract_fields("I want to order coffee at a cafe")
+        self.assertEqual(fields, {"place": "cafe", "partner": "barista", "goal": "order coffee"})
+        self.assertEqual([sorted(request) for request in responses.requests],
+                         [["input", "model", "response_format"], ["input", "model"]])
+
+    async def test_async_client_builds_the_same_requests(self) -> None:
+        sync_responses = _Responses("Hello!")
+        async_responses = _AsyncResponses("Hello!")
+        with mock.patch.object(llm_client, "get_openai_client", return_value=SimpleNamespace(responses=sync_responses)):
+            sync_llm = OpenAIScenarioLLM("key", "model")
+        with mock.patch.object(llm_client, "get_async_openai_client",
+                               return_value=SimpleNamespace(responses=async_responses)):
+            async_llm = AsyncOpenAIScenarioLLM("key", "model")
+        state = ScenarioState(place="cafe", partner="barista", goal="order coffee")
+
+        self.assertEqual(sync_llm.generate_final(state), "Hello!")
+        self.assertEqual(await async_llm.generate_final(state), "Hello!")
+        self.assertEqual(sync_responses.requests, async_responses.requests)
+
+    async def test_incomplete_state_rejected_before_request(self) -> None:
+        responses = _AsyncResponses("unused")
+        with mock.patch.object(llm_client, "get_async_openai_client", return_value=SimpleNamespace(responses=responses)):
+            llm = AsyncOpenAIScenarioLLM("key", "model")
+        with self.assertRaises(ValueError):
+            await llm.generate_final(ScenarioState(place="cafe"))
+        self.assertEqual(responses.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from scenario.openai_clients import OpenAIClientRegistry
+
+
+class OpenAIClientRegistryTests(unittest.TestCase):
+    def test_clients_shared_per_api_key(self) -> None:
+        registry = OpenAIClientRegistry()
+        try:
+            self.assertIs(registry.get("sk-a"), registry.get("sk-a"))
+            self.assertIsNot(registry.get("sk-a"), registry.get("sk-b"))
+            self.assertIs(registry.get_async("sk-a"), registry.get_async("sk-a"))
+        finally:
+            asyncio.run(registry.aclose())
+
+    def test_sync_limit_bounds_concurrency(self) -> None:
+        registry = OpenAIClientRegistry(purpose_limits={"llm": 2})
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work() -> None:
+            with registry.limit("llm"):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(peak), 2)
+
+    def test_async_limit_bounds_concurrency(self) -> None:
+        registry = OpenAIClientRegistry(purpose_limits={"tts": 1})
+        peak = 0
+        active = 0
+
+        async def work() -> None:
+            nonlocal peak, active
+            async with registry.async_limit("tts"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def run() -> None:
+            await asyncio.gather(*(work() for _ in range(4)))
+
+        asyncio.run(run())
+        self.assertEqual(peak, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
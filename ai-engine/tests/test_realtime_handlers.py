@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+
+from scenario.realtime_handlers import RealtimeEventRouter
+
+
+class RealtimeEventRouterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_dispatches_by_type_in_subscription_order(self) -> None:
+        router = RealtimeEventRouter()
+        calls = []
+
+        async def relay(event):
+            calls.append(("relay", event["type"]))
+
+        router.subscribe(("response.audio.delta", "response.audio.done"), lambda event: calls.append(("state", event["type"])))
+        router.subscribe_map({"response.audio.delta": relay})
+
+        await router.dispatch({"type": "response.audio.delta"})
+        await router.dispatch({"type": "response.audio.done"})
+        await router.dispatch({"type": "rate_limits.updated"})
+
+        self.assertEqual(
+            calls,
+            [("state", "response.audio.delta"), ("relay", "response.audio.delta"), ("state", "response.audio.done")],
+        )
+        self.assertEqual(router.stats(), {"dispatched": 2, "dropped": 1, "pending": 0})
+
+    async def test_concurrent_handler_does_not_block_dispatch_and_keeps_order(self) -> None:
+        router = RealtimeEventRouter()
+        release = asyncio.Event()
+        seen = []
+
+        async def slow_turn(event):
+            await release.wait()
+            seen.append(event["n"])
+
+        router.subscribe("transcript", slow_turn, concurrent=True)
+        router.subscribe("audio", lambda event: seen.append("audio"))
+
+        await router.dispatch({"type": "transcript", "n": 1})
+        await router.dispatch({"type": "transcript", "n": 2})
+        await router.dispatch({"type": "audio"})
+        self.assertEqual(seen, ["audio"])
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertEqual(seen, ["audio", 1, 2])
+
+    async def test_concurrent_handler_errors_are_logged_and_close_cancels(self) -> None:
+        router = RealtimeEventRouter()
+        blocked = asyncio.Event()
+
+        async def failing(event):
+            raise RuntimeError("boom")
+
+        router.subscribe("bad", failing, concurrent=True)
+        router.subscribe("stuck", lambda event: blocked.wait(), concurrent=True)
+
+        with self.assertLogs("scenario.realtime_handlers", level="ERROR"):
+            await router.dispatch({"type": "bad"})
+            await asyncio.sleep(0)
+        await router.dispatch({"type": "stuck"})
+        await router.close()
+        self.assertEqual(router.stats()["pending"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
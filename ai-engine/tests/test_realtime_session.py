@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from scenario import realtime_session
+from scenario.realtime_session import EphemeralTokenCache, RealtimeConfig, RealtimeSessionManager
+from scenario.upstream_pool import UpstreamPool, close_upstream_pools, register_upstream_pool
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class EphemeralTokenCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.clock = _Clock()
+        self.cache = EphemeralTokenCache(refresh_margin_sec=15.0, clock=self.clock)
+        self.calls = 0
+
+    async def _factory(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return f"tok-{self.calls}", self.clock.now + 60.0
+
+    async def test_concurrent_misses_share_one_creation(self):
+        tokens = await asyncio.gather(*(self.cache.get(("k", "m"), self._factory) for _ in range(5)))
+
+        self.assertEqual(tokens, ["tok-1"] * 5)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cache.stats()["coalesced"], 4)
+
+    async def test_token_reused_until_refresh_margin(self):
+        await self.cache.get(("k", "m"), self._factory)
+        self.clock.now += 44.0
+        self.assertEqual(await self.cache.get(("k", "m"), self._factory), "tok-1")
+
+        self.clock.now += 1.0
+        self.assertEqual(await self.cache.get(("k", "m"), self._factory), "tok-2")
+
+    async def test_failed_creation_is_not_cached(self):
+        async def failing():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            await self.cache.get(("k", "m"), failing)
+        self.assertEqual(await self.cache.get(("k", "m"), self._factory), "tok-1")
+
+
+class RealtimeSessionManagerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await close_upstream_pools()
+
+    async def test_create_session_async_uses_cached_token(self):
+        cache = EphemeralTokenCache()
+        manager = RealtimeSessionManager(RealtimeConfig(api_key="key", model="m"), token_cache=cache)
+        mint = mock.AsyncMock(return_value=("eph", realtime_session.time.time() + 60.0))
+
+        with mock.patch.object(manager, "_mint_ephemeral_token", mint):
+            first = await manager.create_session_async()
+            second = await manager.create_session_async()
+
+        self.assertEqual((first.bearer_token, second.bearer_token), ("eph", "eph"))
+        self.assertEqual(first.wss_url, "wss://api.openai.com/v1/realtime?model=m")
+        mint.assert_awaited_once()
+
+    async def test_pool_served_url_skips_token(self):
+        manager = RealtimeSessionManager(RealtimeConfig(api_key="key", model="m"), token_cache=EphemeralTokenCache())
+        register_upstream_pool(UpstreamPool(manager.wss_url, "key", size=0))
+        mint = mock.AsyncMock()
+
+        with mock.patch.object(manager, "_mint_ephemeral_token", mint):
+            info = await manager.create_session_async()
+
+        self.assertIsNone(info.bearer_token)
+        mint.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    unittest.main()
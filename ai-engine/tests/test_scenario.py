@@ -1,38 +1,148 @@
+import asyncio
 import unittest
 from typing import Optional
 
 from scenario.fallbacks import build_realtime_error_handler
 from scenario.prompts import KOREAN_FALLBACK_MESSAGE
+from scenario.question_cache import FollowUpQuestionCache
+from scenario.realtime_pipeline import RealtimeScenarioPipeline
 from scenario.scenario_builder import ScenarioBuilder
 from scenario.scenario_state import ScenarioState
 
 
-class ScenarioBuilderTests(unittest.TestCase):
-    def test_finalize_when_complete(self) -> None:
+class ScenarioBuilderTests(unittest.IsolatedAsyncioTestCase):
+    async def test_finalize_when_complete(self) -> None:
         state = ScenarioState(place="cafe", partner="barista", goal="order coffee")
         builder = ScenarioBuilder(state=state)
-        response = builder.finalize_scenario()
+        response = await builder.finalize_scenario()
         self.assertIn("cafe", response)
         self.assertIn("barista", response)
 
-    def test_followup_when_missing(self) -> None:
+    async def test_followup_when_missing(self) -> None:
         def extractor(_: str) -> dict[str, Optional[str]]:
             return {"place": "cafe", "partner": None, "goal": None}
 
         builder = ScenarioBuilder(extractor=extractor)
-        builder.ingest_user_text("I am at a cafe")
-        question = builder.build_follow_up_question()
+        await builder.ingest_user_text("I am at a cafe")
+        question = await builder.build_follow_up_question()
         self.assertIsNotNone(question)
         self.assertIn("Who", question)
 
-    def test_finalize_after_max_attempts(self) -> None:
+    async def test_finalize_after_max_attempts(self) -> None:
         builder = ScenarioBuilder(max_attempts=3)
         for _ in range(3):
-            self.assertIsNotNone(builder.build_follow_up_question())
-        self.assertIsNone(builder.build_follow_up_question())
-        response = builder.finalize_scenario()
+            self.assertIsNotNone(await builder.build_follow_up_question())
+        self.assertIsNone(await builder.build_follow_up_question())
+        response = await builder.finalize_scenario()
         self.assertIn("Great.", response)
 
+    async def test_async_extractor_and_generator_failure(self) -> None:
+        async def extractor(_: str) -> dict[str, Optional[str]]:
+            return {"place": "airport", "partner": None, "goal": None}
+
+        async def question_generator(*_: object) -> str:
+            raise asyncio.TimeoutError()
+
+        builder = ScenarioBuilder(extractor=extractor, question_generator=question_generator)
+        await builder.ingest_user_text("I am at the airport")
+        self.assertEqual(builder.state.place, "airport")
+        self.assertEqual(await builder.build_follow_up_question(), "Who are you talking to?")
+
+
+class SpeculativeFollowUpTests(unittest.IsolatedAsyncioTestCase):
+    async def test_question_generated_while_extracting(self) -> None:
+        calls: list[str] = []
+
+        async def extractor(_: str) -> dict[str, Optional[str]]:
+            await asyncio.sleep(0.05)
+            calls.append("extract_done")
+            return {"place": None, "partner": None, "goal": None}
+
+        async def question_generator(_: ScenarioState, missing: list[str]) -> str:
+            calls.append(f"question_start:{missing[0]}")
+            await asyncio.sleep(0.05)
+            return "Where are you right now?"
+
+        builder = ScenarioBuilder(extractor=extractor, question_generator=question_generator, speculative=True)
+        await builder.ingest_user_text("hello")
+        self.assertEqual(calls, ["question_start:place", "extract_done"])
+        self.assertEqual(await builder.build_follow_up_question(), "Where are you right now?")
+
+    async def test_speculation_discarded_when_field_filled(self) -> None:
+        targets: list[str] = []
+
+        async def extractor(_: str) -> dict[str, Optional[str]]:
+            return {"place": "cafe", "partner": None, "goal": None}
+
+        async def question_generator(_: ScenarioState, missing: list[str]) -> str:
+            targets.append(missing[0])
+            return "Who is serving you?"
+
+        builder = ScenarioBuilder(extractor=extractor, question_generator=question_generator, speculative=True)
+        await builder.ingest_user_text("I am at a cafe")
+        await builder.build_follow_up_question()
+        self.assertEqual(targets[-1], "partner")
+
+    async def test_prebuilt_questions_served_from_cache(self) -> None:
+        cache = FollowUpQuestionCache()
+        generated: list[str] = []
+
+        async def question_generator(_: ScenarioState, missing: list[str]) -> str:
+            generated.append(missing[0])
+            return f"Tell me the {missing[0]}?"
+
+        first = ScenarioBuilder(question_generator=question_generator, question_cache=cache)
+        await first.prebuild_questions()
+        self.assertEqual(sorted(generated), ["goal", "partner", "place"])
+
+        second = ScenarioBuilder(question_generator=question_generator, question_cache=cache)
+        self.assertEqual(await second.build_follow_up_question(), "Tell me the place?")
+        self.assertEqual(len(generated), 3)
+
+    async def test_speculation_joins_inflight_prebuild(self) -> None:
+        cache = FollowUpQuestionCache()
+        release = asyncio.Event()
+        generated: list[str] = []
+
+        async def extractor(_: str) -> dict[str, Optional[str]]:
+            return {"place": None, "partner": None, "goal": None}
+
+        async def question_generator(_: ScenarioState, missing: list[str]) -> str:
+            generated.append(missing[0])
+            await release.wait()
+            return f"Tell me the {missing[0]}?"
+
+        builder = ScenarioBuilder(
+            extractor=extractor, question_generator=question_generator, question_cache=cache, speculative=True
+        )
+        prebuild = asyncio.create_task(builder.prebuild_questions())
+        await asyncio.sleep(0)
+        await builder.ingest_user_text("hello")
+        release.set()
+
+        self.assertEqual(await builder.build_follow_up_question(), "Tell me the place?")
+        await prebuild
+        self.assertEqual(sorted(generated), ["goal", "partner", "place"])
+
+
+class RealtimeScenarioPipelineTests(unittest.IsolatedAsyncioTestCase):
+    async def test_close_cancels_inflight_turn(self) -> None:
+        started = asyncio.Event()
+
+        async def extractor(_: str) -> dict[str, Optional[str]]:
+            started.set()
+            await asyncio.sleep(10)
+            return {"place": None, "partner": None, "goal": None}
+
+        sent: list[str] = []
+        pipeline = RealtimeScenarioPipeline(ScenarioBuilder(extractor=extractor), sent.append)
+        event = {"type": "conversation.item.input_audio_transcription.completed", "transcript": "hello"}
+        turn = asyncio.create_task(pipeline.handle_event(event))
+        await started.wait()
+        await pipeline.close()
+        await asyncio.wait_for(turn, timeout=1.0)
+        self.assertEqual(sent, [])
+
 
 class RealtimeFallbackTests(unittest.IsolatedAsyncioTestCase):
     async def test_realtime_error_fallback(self) -> None:
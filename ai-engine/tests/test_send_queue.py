@@ -0,0 +1,78 @@
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+from scenario.config import send_queue_options_from_env
+from scenario.send_queue import ClientSendQueue, live_send_queue_stats
+
+
+class ClientSendQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_sends_in_order(self) -> None:
+        sent: list[str] = []
+
+        async def send(payload: str) -> None:
+            sent.append(payload)
+
+        queue = ClientSendQueue(send)
+        queue.start()
+        for idx in range(5):
+            await queue.put(f"msg-{idx}")
+        await queue.close()
+        self.assertEqual(sent, [f"msg-{idx}" for idx in range(5)])
+        self.assertEqual(queue.stats()["sent"], 5)
+
+    async def test_sheds_stale_audio_when_client_is_slow(self) -> None:
+        sent: list[str] = []
+        release = asyncio.Event()
+
+        async def send(payload: str) -> None:
+            await release.wait()
+            sent.append(payload)
+
+        baseline = live_send_queue_stats()["connections"]
+        queue = ClientSendQueue(send, max_size=20, high_watermark=10, low_watermark=4)
+        queue.start()
+        await queue.put("control-start")
+        await asyncio.sleep(0)
+        for idx in range(12):
+            await queue.put(f"audio-{idx}", droppable=True)
+        await queue.put("control-end")
+        self.assertLessEqual(queue.depth, 10)
+        self.assertGreater(queue.dropped, 0)
+        self.assertEqual(live_send_queue_stats()["connections"], baseline + 1)
+        self.assertGreater(queue.stats()["shed"], 0)
+
+        release.set()
+        await queue.close()
+        self.assertEqual(live_send_queue_stats()["connections"], baseline)
+        self.assertEqual(sent[0], "control-start")
+        self.assertEqual(sent[-1], "control-end")
+        self.assertIn("audio-11", sent)
+        self.assertNotIn("audio-0", sent)
+
+    async def test_send_failure_closes_queue(self) -> None:
+        async def send(_: str) -> None:
+            raise ConnectionError("client gone")
+
+        queue = ClientSendQueue(send)
+        queue.start()
+        await queue.put("first")
+        await asyncio.sleep(0.01)
+        self.assertTrue(queue.closed)
+        await queue.put("second")
+        await queue.close()
+        self.assertEqual(queue.stats()["sent"], 0)
+
+        self.assertEqual(live_send_queue_stats()["connections"], 0)
+
+    def test_watermarks_from_env(self) -> None:
+        env = {"SEND_QUEUE_MAX_SIZE": "64", "SEND_QUEUE_HIGH_WATERMARK": "48", "SEND_QUEUE_LOW_WATERMARK": "8"}
+        with mock.patch.dict(os.environ, env):
+            options = send_queue_options_from_env()
+        self.assertEqual(options, {"max_size": 64, "high_watermark": 48, "low_watermark": 8})
+        ClientSendQueue(lambda _: None, **options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+
+from realtime_conversation.session_manager import InMemorySessionContextStore, SessionManager
+
+
+class _FakeHandler:
+    def __init__(self, messages, context=None):
+        self.messages = messages
+        self.context = context
+
+    def get_transcript_context(self, limit=10):
+        return self.messages[-limit:]
+
+
+class _SlowStore(InMemorySessionContextStore):
+    def __init__(self):
+        super().__init__()
+        self.puts = []
+        self.release = asyncio.Event()
+
+    async def put(self, session_id, context):
+        await self.release.wait()
+        self.puts.append(context)
+        await super().put(session_id, context)
+
+
+class SessionManagerTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        SessionManager._instance = None
+        self.manager = SessionManager()
+
+    def tearDown(self):
+        SessionManager._instance = None
+
+    async def test_context_served_from_store_when_handler_is_on_another_worker(self):
+        store = InMemorySessionContextStore()
+        self.manager.set_context_store(store)
+        handler = _FakeHandler(
+            [{"role": "user", "content": "hi", "timestamp": "t"}], context={"place": "cafe"}
+        )
+
+        self.manager.add_session("s1", handler)
+        local = await self.manager.get_context("s1")
+        self.assertEqual(local["messages"], [{"role": "user", "content": "hi"}])
+        self.assertEqual(local["context"], {"place": "cafe"})
+
+        self.manager.publish_context("s1", local)
+        await asyncio.sleep(0)
+        self.manager.remove_session("s1")  # 다른 워커에는 핸들러가 없음
+        self.assertEqual(await self.manager.get_context("s1"), local)
+
+        await self.manager.discard_session("s1")
+        self.assertIsNone(await self.manager.get_context("s1"))
+
+    async def test_publish_coalesces_to_latest_context(self):
+        store = _SlowStore()
+        self.manager.set_context_store(store)
+
+        for i in range(5):
+            self.manager.publish_context("s1", {"n": i})
+            await asyncio.sleep(0)
+        store.release.set()
+        await self.manager._publishers["s1"]
+
+        self.assertEqual(store.puts, [{"n": 0}, {"n": 4}])
+        self.assertEqual(await store.get("s1"), {"n": 4})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+
+from scenario.ttl_cache import SingleFlightCache, TTLCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TTLCacheTests(unittest.TestCase):
+    def test_entries_expire_and_lru_is_evicted(self):
+        clock = _Clock()
+        cache = TTLCache(max_entries=2, clock=clock)
+        cache.put("a", 1, expires_at=10.0)
+        cache.put("b", 2, expires_at=20.0)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3, expires_at=20.0)  # evicts "b", the least recently used
+
+        self.assertIsNone(cache.get("b"))
+        clock.now = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats(), {"entries": 1, "hits": 1, "misses": 2, "hit_rate": 0.3333})
+
+
+class SingleFlightCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_waiter_cancellation_does_not_cancel_shared_load(self):
+        cache = SingleFlightCache(clock=_Clock())
+        release = asyncio.Event()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await release.wait()
+            return "value", 60.0
+
+        first = asyncio.create_task(cache.get_or_load("k", loader))
+        second = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, "value")
+        self.assertEqual(cache.peek("k"), "value")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats()["coalesced"], 1)
+
+    async def test_loads_without_expiry_are_not_cached(self):
+        cache = SingleFlightCache(clock=_Clock())
+
+        async def loader():
+            return "value", None
+
+        self.assertEqual(await cache.get_or_load("k", loader), "value")
+        self.assertIsNone(cache.peek("k"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import tempfile
+import unittest
+
+from scenario.tts_cache import TTSCache, cache_pcm16_stream, iter_cached_pcm16
+
+
+async def _collect(chunks):
+    return [item async for item in chunks]
+
+
+async def _source(pieces, sample_rate=24000):
+    for piece in pieces:
+        yield piece, sample_rate
+
+
+class TTSCacheTests(unittest.TestCase):
+    def test_key_covers_voice_model_and_rate(self) -> None:
+        base = TTSCache.make_key("안녕하세요")
+        self.assertEqual(base, TTSCache.make_key(" 안녕하세요 "))
+        self.assertNotEqual(base, TTSCache.make_key("안녕하세요", voice="nova"))
+        self.assertNotEqual(base, TTSCache.make_key("안녕하세요", model="tts-1"))
+        self.assertNotEqual(base, TTSCache.make_key("안녕하세요", sample_rate=16000))
+
+    def test_lru_respects_byte_budget(self) -> None:
+        cache = TTSCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"5678")
+        cache.get("a")
+        cache.put("c", b"9012")
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertLessEqual(cache.size_bytes, 10)
+
+    def test_disk_tier_survives_new_instance(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            TTSCache(cache_dir=tmp).put("k", b"\x01\x02" * 100)
+            restored = TTSCache(cache_dir=tmp).get("k")
+            self.assertEqual(bytes(restored), b"\x01\x02" * 100)
+
+    def test_stream_stored_only_when_complete(self) -> None:
+        cache = TTSCache()
+        chunks = asyncio.run(_collect(cache_pcm16_stream(cache, "k", _source([b"ab", b"cd"]))))
+        self.assertEqual(chunks, [(b"ab", 24000), (b"cd", 24000)])
+        self.assertEqual(cache.get("k"), b"abcd")
+
+        async def interrupted() -> None:
+            stream = cache_pcm16_stream(cache, "x", _source([b"ab", b"cd"]))
+            async for _ in stream:
+                break
+            await stream.aclose()
+
+        asyncio.run(interrupted())
+        self.assertIsNone(cache.get("x"))
+
+    def test_iter_cached_pcm16_splits_buffer(self) -> None:
+        pieces = asyncio.run(_collect(iter_cached_pcm16(b"x" * 10, 24000, piece_size=4)))
+        self.assertEqual([len(p) for p, _ in pieces], [4, 4, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
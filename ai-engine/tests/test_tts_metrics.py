@@ -0,0 +1,22 @@
+import unittest
+
+from scenario.tts_metrics import TimeToFirstAudioMetrics
+
+
+class TimeToFirstAudioMetricsTests(unittest.TestCase):
+    def test_snapshot_reports_percentiles_over_recent_samples(self) -> None:
+        metrics = TimeToFirstAudioMetrics(recent_samples=10)
+        for elapsed_ms in range(1, 21):
+            metrics.record(float(elapsed_ms), cached=elapsed_ms % 2 == 0)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual((snapshot["count"], snapshot["cache_hits"]), (20, 10))
+        self.assertEqual(snapshot["avg_ms"], 10.5)
+        self.assertEqual((snapshot["p50_ms"], snapshot["p95_ms"], snapshot["max_ms"]), (16.0, 20.0, 20.0))
+
+    def test_empty_snapshot(self) -> None:
+        self.assertEqual(TimeToFirstAudioMetrics().snapshot()["p95_ms"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import contextlib
+import unittest
+import wave
+from io import BytesIO
+
+from scenario.tts_stream import WavStreamParser, read_ahead, stream_tts_pcm16
+
+
+def _wav_bytes(pcm: bytes, sample_rate: int = 24000) -> bytes:
+    buffer = BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class _FakeStreamingResponse:
+    def __init__(self, payload: bytes, piece: int) -> None:
+        self._payload = payload
+        self._piece = piece
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def iter_bytes(self, _chunk_size: int):
+        for offset in range(0, len(self._payload), self._piece):
+            yield self._payload[offset : offset + self._piece]
+
+
+class _FakeTTSClient:
+    def __init__(self, payload: bytes, piece: int) -> None:
+        response = _FakeStreamingResponse(payload, piece)
+        speech = type("Speech", (), {})()
+        speech.with_streaming_response = type("Streaming", (), {"create": lambda _self, **_: response})()
+        self.audio = type("Audio", (), {"speech": speech})()
+
+
+class WavStreamParserTests(unittest.TestCase):
+    def test_incremental_feed_matches_full_decode(self) -> None:
+        pcm = bytes(range(256)) * 10
+        payload = _wav_bytes(pcm, sample_rate=16000)
+        parser = WavStreamParser()
+        out = bytearray()
+        for offset in range(0, len(payload), 7):
+            chunk = parser.feed(payload[offset : offset + 7])
+            self.assertEqual(len(chunk) % 2, 0)
+            out.extend(chunk)
+        self.assertEqual(bytes(out), pcm)
+        self.assertEqual(parser.sample_rate, 16000)
+        self.assertEqual(parser.channels, 1)
+
+    def test_rejects_non_wave(self) -> None:
+        with self.assertRaises(ValueError):
+            WavStreamParser().feed(b"ID3\x00" + b"\x00" * 20)
+
+
+class StreamTTSTests(unittest.IsolatedAsyncioTestCase):
+    async def test_stream_yields_pcm_before_end(self) -> None:
+        pcm = b"\x01\x02" * 4000
+        client = _FakeTTSClient(_wav_bytes(pcm), piece=1000)
+        pieces = [piece async for piece in stream_tts_pcm16(client, "hello")]
+        self.assertGreater(len(pieces), 1)
+        self.assertEqual(b"".join(chunk for chunk, _ in pieces), pcm)
+        self.assertTrue(all(rate == 24000 for _, rate in pieces))
+
+
+class ReadAheadTests(unittest.IsolatedAsyncioTestCase):
+    async def test_limit_released_before_slow_consumer_finishes(self) -> None:
+        held = []
+
+        @contextlib.asynccontextmanager
+        async def limit():
+            held.append(True)
+            try:
+                yield
+            finally:
+                held.append(False)
+
+        async def source():
+            for idx in range(3):
+                yield idx
+
+        received = []
+        async for item in read_ahead(source(), limit=limit()):
+            received.append(item)
+            await asyncio.sleep(0.01)  # pacing
+            if item == 0:
+                self.assertEqual(held, [True, False])
+        self.assertEqual(received, [0, 1, 2])
+
+    async def test_source_error_is_raised_to_consumer(self) -> None:
+        async def source():
+            yield 1
+            raise ValueError("stream broke")
+
+        with self.assertRaises(ValueError):
+            async for _ in read_ahead(source()):
+                pass
+
+    async def test_early_stop_cancels_source(self) -> None:
+        closed = asyncio.Event()
+
+        async def source():
+            try:
+                for idx in range(100):
+                    yield idx
+                    await asyncio.sleep(0.01)
+            finally:
+                closed.set()
+
+        stream = read_ahead(source())
+        async for _ in stream:
+            break
+        await stream.aclose()
+        self.assertTrue(closed.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
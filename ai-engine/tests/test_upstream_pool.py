@@ -0,0 +1,122 @@
+import asyncio
+import json
+import unittest
+
+from scenario import upstream_pool
+from scenario.realtime_session import RealtimeSessionInfo, RealtimeWebSocketClient
+from scenario.upstream_pool import UpstreamPool, register_upstream_pool
+
+
+class _FakeSocket:
+    def __init__(self, first_event="session.created"):
+        self.sent = []
+        self.close_code = None
+        self._events = asyncio.Queue()
+        self._events.put_nowait(json.dumps({"type": first_event}))
+
+    async def recv(self):
+        return await self._events.get()
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+    async def close(self):
+        self.close_code = 1000
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def _wait_idle(pool, count):
+    for _ in range(100):
+        if pool.idle_count >= count:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError(f"pool idle={pool.idle_count}, expected {count}")
+
+
+class UpstreamPoolTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.sockets = []
+        self.clock = _Clock()
+
+    async def asyncTearDown(self):
+        await upstream_pool.close_upstream_pools()
+
+    async def _connect(self):
+        ws = _FakeSocket()
+        self.sockets.append(ws)
+        return ws
+
+    def _pool(self, size=2, **kwargs):
+        return UpstreamPool("wss://example/realtime", "key", size=size, max_idle_sec=60.0,
+                            connector=kwargs.pop("connector", self._connect), clock=self.clock, **kwargs)
+
+    async def test_claim_returns_primed_socket_and_refills(self):
+        pool = self._pool()
+        pool.start()
+        await _wait_idle(pool, 2)
+
+        ws = await pool.claim()
+        self.assertIs(ws, self.sockets[0])
+        self.assertEqual(ws._events.qsize(), 0)  # session.created consumed while priming
+        await _wait_idle(pool, 2)
+        self.assertEqual(len(self.sockets), 3)
+        self.assertEqual(pool.stats()["hits"], 1)
+        await pool.close()
+        self.assertTrue(all(ws.close_code for ws in self.sockets[1:]))
+
+    async def test_expired_and_closed_sockets_are_not_handed_out(self):
+        pool = self._pool()
+        pool.start()
+        await _wait_idle(pool, 2)
+        await pool.close()  # stop refilling, then put the sockets back by hand
+        stale, dead = self.sockets[0], _FakeSocket()
+        stale.close_code = None
+        dead.close_code = 1006
+        pool._idle.extend([upstream_pool._IdleSocket(stale, 0.0), upstream_pool._IdleSocket(dead, 50.0)])
+        self.clock.now = 61.0
+
+        self.assertIsNone(await pool.claim())
+        self.assertEqual(stale.close_code, 1000)
+        stats = pool.stats()
+        self.assertEqual((stats["expired"], stats["misses"]), (2, 1))
+
+    async def test_failed_priming_counts_failure_and_closes_socket(self):
+        bad = _FakeSocket(first_event="error")
+
+        async def connect():
+            return bad
+
+        pool = self._pool(size=1, connector=connect)
+        pool.start()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        self.assertEqual(pool.failures, 1)
+        self.assertEqual(pool.idle_count, 0)
+        self.assertEqual(bad.close_code, 1000)
+        await pool.close()
+
+    async def test_realtime_client_uses_registered_pool(self):
+        pool = register_upstream_pool(self._pool(size=1))
+        await _wait_idle(pool, 1)
+        client = RealtimeWebSocketClient(
+            RealtimeSessionInfo(wss_url="wss://example/realtime", bearer_token=None, model="m"),
+            api_key="key",
+            event_handler=lambda _: None,
+            session_config={"voice": "alloy"},
+        )
+
+        await client._connect()
+
+        self.assertTrue(await client.wait_until_connected(timeout=1))
+        self.assertEqual(self.sockets[0].sent, [{"type": "session.update", "session": {"voice": "alloy"}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from realtime_conversation import connection_handler
+from realtime_conversation.connection_handler import ConnectionHandler
+from realtime_conversation.upstream_metrics import upstream_switch_metrics
+
+
+class _FakeUpstream:
+    """OpenAI Realtime 소켓 흉내: feed()로 서버 이벤트를 넣고 sent로 보낸 이벤트 확인"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+        self._events = asyncio.Queue()
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+    def feed(self, event):
+        self._events.put_nowait(json.dumps(event))
+
+    async def close(self):
+        self.closed = True
+        self._events.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self._events.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class _FakeClient:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, payload):
+        self.sent.append(json.loads(payload))
+
+    async def send_json(self, payload):
+        self.sent.append(payload)
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class UpstreamSwitchTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        upstream_switch_metrics.reset()
+        self.handler = ConnectionHandler(_FakeClient(), "key", history=[{"role": "user", "content": "hi"}])
+        self.handler.outbound.start()
+        self.old = _FakeUpstream()
+        self.handler.openai_ws = self.old
+        self.handler.conversation_manager.openai_ws = self.old
+        self.handler.openai_task = asyncio.create_task(self.handler.receive_from_openai(self.old))
+        self.handler.conversation_manager.current_config["voice"] = "shimmer"
+
+    async def asyncTearDown(self):
+        await self.handler.cleanup()
+
+    async def test_switch_waits_for_turn_boundary_then_swaps(self):
+        self.old.feed({"type": "response.created"})
+        await _settle()
+
+        standby = _FakeUpstream()
+        with mock.patch.object(connection_handler.websockets, "connect", mock.AsyncMock(return_value=standby)):
+            self.handler.request_upstream_switch()
+            await _settle()
+
+            # 응답 중에는 기존 연결이 계속 중계
+            self.assertIs(self.handler.openai_ws, self.old)
+            self.assertEqual(standby.sent[0]["session"]["voice"], "shimmer")
+            self.old.feed({"type": "response.audio_transcript.done", "transcript": "Welcome!"})
+            self.old.feed({"type": "response.done"})
+            await self.handler.standby_task
+
+        self.assertIs(self.handler.openai_ws, standby)
+        self.assertIs(self.handler.conversation_manager.openai_ws, standby)
+        self.assertTrue(self.old.closed)
+        # 준비 이후 끝난 AI 자막도 새 연결에 반영, "Let's start" 재발화 없음
+        texts = [event["item"]["content"][0]["text"] for event in standby.sent[1:]]
+        self.assertEqual(texts, ["hi", "Welcome!"])
+        self.assertNotIn("response.create", [event["type"] for event in standby.sent])
+
+        metrics = upstream_switch_metrics.snapshot()
+        self.assertEqual(metrics["switches"], 1)
+        self.assertGreaterEqual(metrics["last"]["total_ms"], metrics["last"]["prime_ms"])
+
+    async def test_idle_session_switches_immediately_and_failure_falls_back(self):
+        standby = _FakeUpstream()
+        with mock.patch.object(connection_handler.websockets, "connect", mock.AsyncMock(return_value=standby)):
+            self.handler.request_upstream_switch()
+            await self.handler.standby_task
+        self.assertIs(self.handler.openai_ws, standby)
+
+        with mock.patch.object(connection_handler.websockets, "connect", mock.AsyncMock(side_effect=OSError("down"))), \
+                mock.patch.object(self.handler, "reconnect_to_openai", mock.AsyncMock()) as reconnect:
+            self.handler.request_upstream_switch()
+            await self.handler.standby_task
+        reconnect.assert_awaited_once()
+        self.assertEqual(upstream_switch_metrics.snapshot()["failures"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,272 @@
+"""
+세션 분석 백필 (process_session_analytics의 대량 처리 버전)
+
+is_analyzed가 아닌 세션을 (ended_at, session_id) 순 Keyset 청크로 읽고,
+키워드 분석은 프로세스 풀에서, 저장은 청크마다 한 트랜잭션으로 일괄 수행합니다.
+청크 단위로 커밋되므로 중간에 멈춰도 체크포인트(마지막 ended_at, session_id)부터 이어서 처리할 수 있습니다.
+(session_id는 UUID라 생성 순서와 무관하므로, 새 세션이 커서 뒤에 오도록 ended_at을 앞에 둠)
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.analytics.processor import (
+    MIN_USER_MESSAGES,
+    AnalyticsProcessor,
+    KeywordBatch,
+    ScenarioStatsDelta,
+    TextAnalyzer,
+)
+from app.db.models import ChatMessage, ConversationSession
+
+logger = logging.getLogger(__name__)
+
+# (session_id, user_id, scenario_key, ended_at)
+SessionRow = Tuple[str, Optional[int], str, str]
+# Keyset 커서 (ended_at, session_id)
+Cursor = Tuple[str, str]
+# (session_id, 유저 발화 리스트)
+SessionMessages = Tuple[str, List[str]]
+
+
+@dataclass
+class BackfillReport:
+    sessions: int = 0   # is_analyzed로 표시한 세션 수
+    analyzed: int = 0   # 통계에 반영한 세션 수 (발화가 너무 적은 세션 제외)
+    elapsed_sec: float = 0.0
+    last_cursor: Optional[Cursor] = None
+
+    @property
+    def sessions_per_sec(self) -> float:
+        if self.elapsed_sec <= 0:
+            return 0.0
+        return self.sessions / self.elapsed_sec
+
+
+def analyze_sessions(items: List[SessionMessages]) -> List[Tuple[str, int, Optional[dict]]]:
+    """
+    [Worker] 세션별 키워드 분석 (프로세스 풀에서 실행되므로 모듈 최상위 함수)
+
+    Returns:
+        [(session_id, 유저 발화 수, 키워드 카운트 or None(통계 제외))]
+    """
+    results = []
+    for session_id, messages in items:
+        if len(messages) < MIN_USER_MESSAGES:
+            results.append((session_id, len(messages), None))
+            continue
+        batch = TextAnalyzer.analyze_batch(messages)
+        results.append((session_id, len(messages), dict(batch.counts)))
+    return results
+
+
+def load_checkpoint(path: Optional[str]) -> Optional[Cursor]:
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    # 이전 형식(session_id만 기록)은 처음부터 다시 읽음 (이미 분석된 세션은 is_analyzed로 걸러짐)
+    if "ended_at" not in data or "session_id" not in data:
+        return None
+    return data["ended_at"], data["session_id"]
+
+
+def save_checkpoint(path: Optional[str], cursor: Cursor) -> None:
+    if not path:
+        return
+    tmp_path = f"{path}.tmp"
+    ended_at, session_id = cursor
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"ended_at": ended_at, "session_id": session_id}, f)
+    os.replace(tmp_path, path)
+
+
+async def fetch_chunk(
+    db: AsyncSession,
+    after: Optional[Cursor],
+    chunk_size: int,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    stream_batch_size: int = 5000,
+) -> Tuple[List[SessionRow], List[SessionMessages]]:
+    """
+    (ended_at, session_id) > after 인 미분석 세션 chunk_size개와 그 유저 발화를 읽습니다.
+    메시지는 stream(yield_per)으로 읽어 PostgreSQL에서는 서버 측 커서를 사용합니다.
+    """
+    stmt = (
+        select(
+            ConversationSession.session_id,
+            ConversationSession.user_id,
+            ConversationSession.scenario_id,
+            ConversationSession.scenario_place,
+            ConversationSession.ended_at,
+        )
+        .where(ConversationSession.is_analyzed.isnot(True))
+        .order_by(ConversationSession.ended_at.asc(), ConversationSession.session_id.asc())
+        .limit(chunk_size)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(ConversationSession.ended_at, ConversationSession.session_id) > tuple_(*after))
+    if since is not None:
+        stmt = stmt.where(ConversationSession.ended_at >= since)
+    if until is not None:
+        stmt = stmt.where(ConversationSession.ended_at < until)
+
+    result = await db.execute(stmt)
+    sessions = [
+        # process_session_analytics와 같은 키: scenario_id 우선, 없으면 legacy(place)
+        (session_id, user_id, scenario_id or scenario_place or "unknown_scenario", ended_at)
+        for session_id, user_id, scenario_id, scenario_place, ended_at in result.all()
+    ]
+    if not sessions:
+        return [], []
+
+    messages: Dict[str, List[str]] = {session_id: [] for session_id, _, _, _ in sessions}
+    msg_stmt = (
+        select(ChatMessage.session_id, ChatMessage.content)
+        .where(ChatMessage.session_id.in_(list(messages)), ChatMessage.role == "user")
+        .order_by(ChatMessage.id.asc())
+        .execution_options(yield_per=stream_batch_size)
+    )
+    stream = await db.stream(msg_stmt)
+    async for session_id, content in stream:
+        messages[session_id].append(content)
+    # 읽기 트랜잭션을 열어둔 채로 분석/저장을 기다리지 않도록 종료
+    await db.rollback()
+    return sessions, list(messages.items())
+
+
+async def write_chunk(
+    db: AsyncSession,
+    sessions: List[SessionRow],
+    results: List[Tuple[str, int, Optional[dict]]],
+) -> Tuple[int, int]:
+    """
+    청크 결과를 한 트랜잭션으로 저장합니다. (시나리오 통계 + 세션 통계 + is_analyzed)
+
+    청크를 읽은 뒤 실시간 분석 작업(process_session_analytics)이 먼저 처리한 세션은
+    is_analyzed 선점에서 빠지므로 통계에 두 번 반영되지 않습니다.
+
+    Returns:
+        (is_analyzed로 표시한 세션 수, 통계에 반영한 세션 수)
+    """
+    claimed = await db.execute(
+        update(ConversationSession)
+        .where(
+            ConversationSession.session_id.in_([session_id for session_id, _, _, _ in sessions]),
+            ConversationSession.is_analyzed.isnot(True),
+        )
+        .values(is_analyzed=True)
+        .returning(ConversationSession.session_id)
+    )
+    claimed_ids = set(claimed.scalars().all())
+
+    session_info = {session_id: (user_id, scenario_key) for session_id, user_id, scenario_key, _ in sessions}
+    deltas: Dict[str, ScenarioStatsDelta] = {}
+    analytics_rows = []
+    analyzed = 0
+    for session_id, turns, counts in results:
+        if counts is None or session_id not in claimed_ids:
+            continue
+        analyzed += 1
+        user_id, scenario_key = session_info[session_id]
+        keywords = KeywordBatch(counts=Counter(counts))
+        deltas.setdefault(scenario_key, ScenarioStatsDelta()).add(turns, keywords.counts)
+        if user_id:
+            analytics_rows.append({
+                "session_id": session_id,
+                "user_id": user_id,
+                "word_count": keywords.word_count,
+                "unique_words_count": keywords.unique_words_count,
+                "richness_score": keywords.richness_score,
+            })
+
+    processor = AnalyticsProcessor(db)
+    await processor.add_scenario_stats(deltas)
+    await processor.add_session_analytics_bulk(analytics_rows)
+    await db.commit()
+    return len(claimed_ids), analyzed
+
+
+async def _analyze(
+    items: List[SessionMessages],
+    executor: Optional[Executor],
+    workers: int,
+) -> List[Tuple[str, int, Optional[dict]]]:
+    if executor is None or workers <= 1 or len(items) < workers:
+        return analyze_sessions(items)
+    loop = asyncio.get_running_loop()
+    size = -(-len(items) // workers)
+    parts = await asyncio.gather(*[
+        loop.run_in_executor(executor, analyze_sessions, items[i:i + size])
+        for i in range(0, len(items), size)
+    ])
+    return [row for part in parts for row in part]
+
+
+async def backfill_session_analytics(
+    session_factory: Callable[[], AsyncSession],
+    chunk_size: int = 1000,
+    workers: int = 1,
+    checkpoint_path: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    log: Callable[[str], None] = logger.info,
+) -> BackfillReport:
+    """
+    미분석 세션 전체를 청크 단위로 분석합니다.
+    다음 청크 읽기는 현재 청크의 분석/저장과 겹쳐서 진행합니다.
+
+    Args:
+        workers: 분석 프로세스 수 (1 이하면 현재 프로세스에서 분석)
+            기본 분석기는 가벼워 DB 쓰기가 병목이므로 1이 가장 빠름. 분석이 무거울 때만 늘림
+        checkpoint_path: 마지막으로 커밋한 (ended_at, session_id)를 기록/재개할 파일
+        since, until: ended_at 범위 (ISO 문자열, until은 미포함)
+    """
+    report = BackfillReport(last_cursor=load_checkpoint(checkpoint_path))
+    if report.last_cursor:
+        log(f"Resuming after session {report.last_cursor[1]} (ended_at {report.last_cursor[0]})")
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    start = time.perf_counter()
+    try:
+        async with session_factory() as read_db, session_factory() as write_db:
+            sessions, items = await fetch_chunk(read_db, report.last_cursor, chunk_size, since, until)
+            while sessions:
+                last_session_id, _, _, last_ended_at = sessions[-1]
+                cursor = (last_ended_at, last_session_id)
+                next_fetch = asyncio.create_task(
+                    fetch_chunk(read_db, cursor, chunk_size, since, until)
+                )
+                try:
+                    results = await _analyze(items, executor, workers)
+                    claimed, analyzed = await write_chunk(write_db, sessions, results)
+                except BaseException:
+                    next_fetch.cancel()
+                    raise
+
+                report.sessions += claimed
+                report.analyzed += analyzed
+                report.last_cursor = cursor
+                report.elapsed_sec = time.perf_counter() - start
+                save_checkpoint(checkpoint_path, cursor)
+                log(
+                    f"{report.sessions} sessions ({report.analyzed} analyzed), "
+                    f"{report.sessions_per_sec:.1f} sessions/s"
+                )
+                sessions, items = await next_fetch
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    report.elapsed_sec = time.perf_counter() - start
+    return report
@@ -19,11 +19,25 @@ class ScenarioStatistics(Base):
     
     # {"word": count, ...} 형태의 Top 20 단어 (Word Cloud용)
     # JSON 타입은 MySQL 5.7+, PostgreSQL, SQLite(Text로 저장됨) 등에서 지원
+    # 원본 카운트는 scenario_keyword_counts에 있고, 이 컬럼은 주기적으로 재계산되는 스냅샷
     top_keywords = Column(JSON, nullable=True) 
     
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
+class ScenarioKeywordCount(Base):
+    """
+    시나리오별 단어 사용 횟수 (누적)
+    - 세션 종료마다 INSERT ... ON CONFLICT DO UPDATE로 증가만 시킴 (행 잠금 경합 최소화)
+    - ScenarioStatistics.top_keywords는 이 테이블에서 주기적으로 Top-K를 뽑아 갱신
+    """
+    __tablename__ = "scenario_keyword_counts"
+
+    scenario_id = Column(String, primary_key=True)
+    word = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
 class SessionAnalytics(Base):
     """
     세션별 학습 통계 데이터 (Per-Session Analytics)
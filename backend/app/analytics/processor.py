@@ -1,20 +1,83 @@
-from typing import List, Dict, Set
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence
+from dataclasses import dataclass, field
+from itertools import chain
 import re
 from collections import Counter
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models import ConversationSession, ChatMessage
-from app.analytics.models import ScenarioStatistics, SessionAnalytics
+from app.analytics.models import ScenarioKeywordCount, ScenarioStatistics, SessionAnalytics
+
+# ScenarioStatistics.top_keywords에 유지할 단어 수 (Word Cloud용)
+TOP_KEYWORDS_LIMIT = 20
+# 이보다 유저 발화가 적은 세션은 통계에서 제외 (데이터 오염 방지)
+MIN_USER_MESSAGES = 3
+
+Tokenizer = Callable[[str], List[str]]
+
+
+@dataclass
+class KeywordBatch:
+    """
+    여러 메시지를 한 번에 분석한 결과
+    - counts: 전체 키워드 카운트
+    - token_counts: 메시지별 키워드 수 (입력 순서, per_message=True일 때만)
+    """
+    counts: Counter = field(default_factory=Counter)
+    token_counts: Optional[List[int]] = None
+
+    @property
+    def word_count(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def unique_words_count(self) -> int:
+        return len(self.counts)
+
+    @property
+    def richness_score(self) -> float:
+        """어휘 다양성 점수 (Type-Token Ratio * 100)"""
+        if not self.counts:
+            return 0.0
+        return round((self.unique_words_count / self.word_count) * 100, 2)
+
+
+@dataclass
+class ScenarioStatsDelta:
+    """
+    시나리오 통계 증분 (세션 N개분)
+    """
+    plays: int = 0
+    turns: int = 0
+    keywords: Counter = field(default_factory=Counter)
+
+    def add(self, turns: int, keywords: Counter) -> None:
+        self.plays += 1
+        self.turns += turns
+        self.keywords.update(keywords)
+
 
 class TextAnalyzer:
     """
     텍스트 분석 엔진 (NLP MVP)
     """
-    STOPWORDS: Set[str] = {
+    STOPWORDS: FrozenSet[str] = frozenset({
         "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", 
         "is", "are", "was", "were", "be", "been", "am", "i", "you", "he", "she", "it", "we", "they",
         "this", "that", "these", "those", "my", "your", "his", "her", "its", "our", "their",
         "what", "where", "when", "who", "how", "why", "just", "so", "very", "can", "could", "will", "would"
+    })
+
+    # 알파벳과 공백 외 문자 (extract_keywords)
+    _NON_ALPHA = re.compile(r'[^a-z\s]')
+    # 배치 분석용: 메시지 구분자(\x00)는 남김
+    _SEP = "\x00"
+    _NON_ALPHA_OR_SEP = re.compile(r'[^a-z\s\x00]')
+    # ASCII 텍스트는 정규식 대신 str.translate로 같은 문자를 제거
+    _ASCII_DELETE = {
+        code: None for code in range(128)
+        if not re.match(r'[a-z\s\x00]', chr(code))
     }
 
     @classmethod
@@ -26,7 +89,7 @@ class TextAnalyzer:
         text = text.lower()
         
         # 2. 특수문자 제거 (알파벳과 공백만 남김)
-        text = re.sub(r'[^a-z\s]', '', text)
+        text = cls._NON_ALPHA.sub('', text)
         
         # 3. 토큰화 (띄어쓰기 기준)
         words = text.split()
@@ -49,93 +112,234 @@ class TextAnalyzer:
         # 단순 TTR (0 ~ 100점)
         return round((unique_types / total_tokens) * 100, 2)
 
+    @classmethod
+    def analyze_batch(
+        cls,
+        messages: Sequence[str],
+        tokenizer: Optional[Tokenizer] = None,
+        per_message: bool = False,
+    ) -> KeywordBatch:
+        """
+        여러 메시지의 키워드를 한 번에 분석합니다. (세션 분석/대량 백필용)
+
+        기본 토크나이저는 메시지를 구분자로 이어 붙여 lower()/특수문자 제거/split을 한 번씩만 하고,
+        불용어·길이 필터는 단어 종류(vocabulary)마다 한 번만 검사합니다.
+        결과는 extract_keywords를 메시지마다 호출해 합친 것과 같습니다.
+
+        Args:
+            tokenizer: 메시지 1개 -> 키워드 리스트. 지정하면 메시지마다 호출 (기본 토크나이저 대체)
+            per_message: 메시지별 키워드 수(token_counts)도 계산
+        """
+        if tokenizer is not None:
+            tokenized = [tokenizer(msg) if msg else [] for msg in messages]
+            counts = Counter(chain.from_iterable(tokenized))
+            token_counts = [len(words) for words in tokenized] if per_message else None
+            return KeywordBatch(counts=counts, token_counts=token_counts)
+
+        if not messages:
+            return KeywordBatch(token_counts=[] if per_message else None)
+
+        # 메시지 안의 \x00은 원래도 제거되는 문자이므로 미리 지워 구분자와 섞이지 않게 함
+        sep = cls._SEP
+        text = sep.join((msg or "").replace(sep, "") for msg in messages).lower()
+        if text.isascii():
+            text = text.translate(cls._ASCII_DELETE)
+        else:
+            text = cls._NON_ALPHA_OR_SEP.sub('', text)
+
+        raw_counts = Counter(text.replace(sep, " ").split())
+        stopwords = cls.STOPWORDS
+        counts = Counter({w: c for w, c in raw_counts.items() if len(w) > 2 and w not in stopwords})
+
+        token_counts = None
+        if per_message:
+            vocab = counts.keys()
+            token_counts = [len([w for w in part.split() if w in vocab]) for part in text.split(sep)]
+        return KeywordBatch(counts=counts, token_counts=token_counts)
+
 
 class AnalyticsProcessor:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def update_scenario_stats(self, scenario_id: str, new_user_messages: List[str]):
+    def _upsert(self, model):
+        """
+        INSERT ... ON CONFLICT 구문 생성 (PostgreSQL / SQLite 공통 API)
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(model)
+        return sqlite.insert(model)
+
+    async def update_scenario_stats(
+        self,
+        scenario_id: str,
+        new_user_messages: List[str],
+        keywords: Optional[KeywordBatch] = None,
+    ):
         """
         특정 시나리오의 통계를 갱신합니다. (배치/이벤트 기반)
+
+        행을 읽어서 Python에서 합치는 대신 증분만 UPSERT 하므로
+        인기 시나리오에 세션 종료가 몰려도 SELECT FOR UPDATE 대기가 생기지 않습니다.
+        top_keywords는 여기서 갱신하지 않고 refresh_top_keywords()가 주기적으로 재계산합니다.
+        (keywords: 이미 분석한 결과가 있으면 재사용)
         """
         if not new_user_messages:
             return
 
         # 1. 텍스트 분석
-        all_keywords = []
-        for msg in new_user_messages:
-            all_keywords.extend(TextAnalyzer.extract_keywords(msg))
-        
-        new_word_counts = Counter(all_keywords)
-        
-        # 2. 기존 통계 가져오기 (Row Lock for Concurrency)
-        stmt = select(ScenarioStatistics).where(ScenarioStatistics.scenario_id == scenario_id).with_for_update()
+        if keywords is None:
+            keywords = TextAnalyzer.analyze_batch(new_user_messages)
+
+        delta = ScenarioStatsDelta()
+        delta.add(len(new_user_messages), keywords.counts)
+        await self.add_scenario_stats({scenario_id: delta})
+        await self.db.commit()
+
+    async def add_scenario_stats(self, deltas: Dict[str, ScenarioStatsDelta]) -> None:
+        """
+        여러 시나리오의 통계 증분을 UPSERT 합니다. (Commit은 호출자가 관리)
+        """
+        deltas = {scenario_id: d for scenario_id, d in deltas.items() if d.plays > 0}
+        if not deltas:
+            return
+
+        # 1. 플레이 수 / 평균 턴 수 (DB에서 원자적으로 계산)
+        # Formula: new_avg = ((old_avg * old_count) + added_turns) / (old_count + added_plays)
+        stmt = self._upsert(ScenarioStatistics)
+        added_plays = stmt.excluded.total_plays
+        added_turns = stmt.excluded.avg_turns * stmt.excluded.total_plays
+        old_count = func.coalesce(ScenarioStatistics.total_plays, 0)
+        old_avg = func.coalesce(ScenarioStatistics.avg_turns, 0.0)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScenarioStatistics.scenario_id],
+            set_={
+                "avg_turns": (old_avg * old_count + added_turns) / (old_count + added_plays),
+                "total_plays": old_count + added_plays,
+                "updated_at": func.now(),
+            },
+        )
+        rows = [
+            {
+                "scenario_id": scenario_id,
+                "total_plays": delta.plays,
+                "avg_turns": delta.turns / delta.plays,
+                "top_keywords": {},
+            }
+            for scenario_id, delta in sorted(deltas.items())
+        ]
+        await self.db.execute(stmt, rows)
+
+        # 2. 단어 카운트 증분 (한 번의 executemany)
+        # 키 순으로 정렬해 동시 트랜잭션 간 잠금 순서를 고정 (PostgreSQL 데드락 방지)
+        rows = [
+            {"scenario_id": scenario_id, "word": word, "count": count}
+            for scenario_id, delta in sorted(deltas.items())
+            for word, count in sorted(delta.keywords.items())
+        ]
+        if rows:
+            stmt = self._upsert(ScenarioKeywordCount)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ScenarioKeywordCount.scenario_id, ScenarioKeywordCount.word],
+                set_={"count": ScenarioKeywordCount.count + stmt.excluded["count"]},
+            )
+            await self.db.execute(stmt, rows)
+
+    async def refresh_top_keywords(self, limit: int = TOP_KEYWORDS_LIMIT) -> int:
+        """
+        scenario_keyword_counts에서 시나리오별 Top-K 단어를 뽑아 ScenarioStatistics.top_keywords에 반영합니다.
+        (주기 작업용, 모든 시나리오를 쿼리 2번으로 처리)
+
+        Returns:
+            갱신한 시나리오 수
+        """
+        rank = func.row_number().over(
+            partition_by=ScenarioKeywordCount.scenario_id,
+            order_by=(ScenarioKeywordCount.count.desc(), ScenarioKeywordCount.word.asc()),
+        ).label("rank")
+        ranked = select(
+            ScenarioKeywordCount.scenario_id,
+            ScenarioKeywordCount.word,
+            ScenarioKeywordCount.count,
+            rank,
+        ).subquery()
+        stmt = (
+            select(ranked.c.scenario_id, ranked.c.word, ranked.c["count"])
+            .where(ranked.c.rank <= limit)
+            .order_by(ranked.c.scenario_id, ranked.c.rank)
+        )
         result = await self.db.execute(stmt)
-        stat = result.scalars().first()
-        
-        if not stat:
-            # Insert 시에는 Lock이 없음 (트랜잭션 격리수준에 따름)
-            # 엄밀히는 Upsert(INSERT ON CONFLICT)가 필요하지만, SQLAlchemy ORM에서는 복잡하므로 
-            # 여기서는 '없으면 생성' 로직 유지 (매우 낮은 확률의 Insert 충돌은 감수)
-            stat = ScenarioStatistics(scenario_id=scenario_id, total_plays=0, avg_turns=0.0, top_keywords={})
-            self.db.add(stat)
-
-        # 3. 데이터 업데이트 (누적)
-        # 주의: top_keywords는 DB에서 읽은 기존 값과 합쳐야 함
-        current_keywords = stat.top_keywords or {}
-        # Counter로 합치기
-        total_counter = Counter(current_keywords) + new_word_counts
-        
-        # Top 20만 남기기
-        stat.top_keywords = dict(total_counter.most_common(20))
-        
-        # 평균 턴 수 업데이트 (Moving Average)
-        # Formula: new_avg = ((old_avg * old_count) + current_turns) / (old_count + 1)
-        current_turns = len(new_user_messages)
-        old_avg = stat.avg_turns
-        old_count = stat.total_plays
-        
-        new_avg = ((old_avg * old_count) + current_turns) / (old_count + 1)
-        
-        stat.avg_turns = round(new_avg, 2)
-        stat.total_plays += 1
-        
+
+        top_keywords: Dict[str, Dict[str, int]] = {}
+        for scenario_id, word, count in result.all():
+            top_keywords.setdefault(scenario_id, {})[word] = count
+        if not top_keywords:
+            return 0
+
+        table = ScenarioStatistics.__table__
+        stmt = (
+            update(table)
+            .where(table.c.scenario_id == bindparam("b_scenario_id"))
+            .values(top_keywords=bindparam("b_top_keywords"))
+        )
+        params = [
+            {"b_scenario_id": scenario_id, "b_top_keywords": keywords}
+            for scenario_id, keywords in top_keywords.items()
+        ]
+        await self.db.execute(stmt, params)
         await self.db.commit()
+        return len(params)
 
-    async def save_session_analytics(self, session_id: str, user_id: int, new_user_messages: List[str]):
+    async def save_session_analytics(
+        self,
+        session_id: str,
+        user_id: int,
+        new_user_messages: List[str],
+        keywords: Optional[KeywordBatch] = None,
+    ):
         """
         세션별 통계(성적표)를 저장합니다. (누적 아님)
         """
         if not new_user_messages:
             return
 
-        # 1. 키워드 추출 & 분석
-        session_words = []
-        for msg in new_user_messages:
-            session_words.extend(TextAnalyzer.extract_keywords(msg))
-            
-        word_count = len(session_words)
-        unique_words_count = len(set(session_words))
-        
-        # 2. 다양성 점수
-        richness_score = TextAnalyzer.calculate_richness_score(session_words)
+        # 1. 키워드 추출 & 분석 (단어 수 / 고유 단어 수 / 다양성 점수)
+        if keywords is None:
+            keywords = TextAnalyzer.analyze_batch(new_user_messages)
         
-        # 3. SessionAnalytics 생성 및 저장
+        # 2. SessionAnalytics 생성 및 저장
         # (기존 유저 누적 로직은 삭제됨)
         analytics = SessionAnalytics(
             session_id=session_id,
             user_id=user_id,
-            word_count=word_count,
-            unique_words_count=unique_words_count,
-            richness_score=richness_score
+            word_count=keywords.word_count,
+            unique_words_count=keywords.unique_words_count,
+            richness_score=keywords.richness_score
         )
         self.db.add(analytics)
         await self.db.commit()
 
+    async def add_session_analytics_bulk(self, rows: List[dict]) -> None:
+        """
+        세션별 통계를 한 번에 저장합니다. 이미 저장된 세션은 건너뜁니다. (Commit은 호출자가 관리)
+
+        Args:
+            rows: [{"session_id", "user_id", "word_count", "unique_words_count", "richness_score"}]
+        """
+        if not rows:
+            return
+        stmt = self._upsert(SessionAnalytics).on_conflict_do_nothing(
+            index_elements=[SessionAnalytics.session_id]
+        )
+        await self.db.execute(stmt, rows)
+
     async def process_session_analytics(self, session_id: str):
         """
         [Entry Point] 단일 세션에 대한 분석을 수행하고 is_analyzed 플래그를 업데이트합니다.
         (실시간 Trigger용)
+
+        시나리오 통계 증분 + 세션 통계 + is_analyzed를 한 트랜잭션으로 저장하므로
+        작업이 재시도되어도 같은 세션이 두 번 집계되지 않습니다. (backfill.write_chunk와 동일)
         """
         from sqlalchemy.orm import selectinload
         
@@ -157,31 +361,43 @@ class AnalyticsProcessor:
             
         # 3. 유저 발화 추출
         user_messages = [msg.content for msg in session.messages if msg.role == 'user']
-        
-        if not user_messages:
-            # 발화가 없어도 분석 완료 처리 (더 이상 볼 필요 없음)
-            session.is_analyzed = True
-            await self.db.commit()
-            return True
-            
-        # [Filter] 너무 짧은 세션은 통계에서 제외 (데이터 오염 방지)
-        if len(user_messages) < 3:
-            session.is_analyzed = True
-            await self.db.commit()
-            return True
-            
-        
-        # 4. 통계 업데이트
-        # A. 시나리오 통계
-        # [Phase 2] scenario_id(FK)가 있으면 그것을 우선 사용, 없으면 legacy(place) 사용
         scenario_key = session.scenario_id or session.scenario_place or "unknown_scenario"
-        await self.update_scenario_stats(scenario_key, user_messages)
-        
-        # B. 유저 통계 (세션별 저장)
-        if session.user_id:
-            await self.save_session_analytics(session.session_id, session.user_id, user_messages)
-            
-        # 5. 플래그 업데이트
-        session.is_analyzed = True
+        user_id = session.user_id
+
+        # 4. 플래그 선점: 동시에 실행된 다른 작업이 먼저 표시했다면 집계하지 않음
+        # (발화가 없거나 너무 짧은 세션도 분석 완료 처리 - 더 이상 볼 필요 없음)
+        claimed = await self.db.execute(
+            update(ConversationSession)
+            .where(
+                ConversationSession.session_id == session_id,
+                ConversationSession.is_analyzed.isnot(True),
+            )
+            .values(is_analyzed=True)
+        )
+        if claimed.rowcount == 0:
+            await self.db.rollback()
+            return False
+
+        # [Filter] 너무 짧은 세션은 통계에서 제외 (데이터 오염 방지)
+        if len(user_messages) >= MIN_USER_MESSAGES:
+            keywords = TextAnalyzer.analyze_batch(user_messages)
+
+            # A. 시나리오 통계
+            # [Phase 2] scenario_id(FK)가 있으면 그것을 우선 사용, 없으면 legacy(place) 사용
+            delta = ScenarioStatsDelta()
+            delta.add(len(user_messages), keywords.counts)
+            await self.add_scenario_stats({scenario_key: delta})
+
+            # B. 유저 통계 (세션별 저장)
+            if user_id:
+                await self.add_session_analytics_bulk([{
+                    "session_id": session_id,
+                    "user_id": user_id,
+                    "word_count": keywords.word_count,
+                    "unique_words_count": keywords.unique_words_count,
+                    "richness_score": keywords.richness_score,
+                }])
+
+        # 5. 한 번에 Commit
         await self.db.commit()
         return True
@@ -4,6 +4,7 @@ from app.api import deps
 from app.db import models
 from app.schemas.chat import (
     HintResponse,
+    JobStatusResponse,
     SessionCreate,
     SessionResponse,
     SessionSummary,
@@ -63,13 +64,19 @@ async def start_new_session(
 async def get_user_sessions(
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 skip 무시)"),
     current_user: models.User = Depends(deps.get_current_user),
     service: ChatService = Depends(deps.get_chat_service),
 ):
     """
     사용자의 대화 세션 목록을 조회합니다. (메시지 내용 미포함, 개수만 포함)
+
+    - `cursor`를 사용하면 Keyset 페이지네이션으로 조회합니다 (깊은 페이지에서도 일정한 비용).
     """
-    return await service.get_user_sessions(current_user.id, skip, limit)
+    try:
+        return await service.get_user_sessions(current_user.id, skip, limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @router.get("/sessions/{session_id}", response_model=SessionResponse, summary="대화 세션 상세 조회")
@@ -87,6 +94,21 @@ async def get_session_detail(
     return session
 
 
+@router.get("/sessions/{session_id}/jobs", response_model=List[JobStatusResponse], summary="세션 분석/피드백 작업 상태 조회")
+async def get_session_jobs(
+    session_id: str,
+    current_user: models.User = Depends(deps.get_current_user),
+    service: ChatService = Depends(deps.get_chat_service),
+):
+    """
+    세션 종료 후 백그라운드로 처리되는 분석/피드백 작업의 진행 상태를 조회합니다.
+    """
+    jobs = await service.get_session_jobs(session_id, current_user.id)
+    if jobs is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return jobs
+
+
 @router.get("/recent", response_model=Optional[SessionResponse], summary="가장 최근 대화 세션 조회")
 async def get_recent_chat_session(
     current_user: models.User = Depends(deps.get_current_user),
@@ -152,8 +174,9 @@ async def get_hint(
 ):
     """
     [Hint Generation]
-    현재 진행 중인 세션(메모리)의 대화 맥락을 기반으로 힌트를 생성합니다.
+    현재 진행 중인 세션(세션 레지스트리)의 대화 맥락을 기반으로 힌트를 생성합니다.
     - 5초 이상 무응답 시 프론트엔드에서 호출
+    - AI 응답 직후 미리 생성된 힌트가 있으면 캐시에서 바로 반환 (대화가 그대로면 LLM 재호출 없음)
     - LLM을 통해 추천 답변 3개 생성
     - Note: user_id가 없는(Guest/Demo) 사용자도 힌트를 받을 수 있도록 session_id만 사용합니다.
     """
@@ -1,7 +1,7 @@
 from app.api import deps
 from app.db import models
 from app.services.chat_service import ChatService
-from conversation_feedback.feedback_service import generate_feedback
+from conversation_feedback.feedback_service import generate_feedback_async
 from fastapi import APIRouter, Depends, HTTPException
 
 router = APIRouter()
@@ -27,6 +27,6 @@ async def create_feedback(
         raise HTTPException(status_code=404, detail="Session not found")
 
     # 2. ai-engine 호출
-    result = generate_feedback(messages, session_id)
+    result = await generate_feedback_async(messages, session_id)
 
     return result
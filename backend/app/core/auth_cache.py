@@ -0,0 +1,62 @@
+"""
+인증 캐시 (프로세스 로컬)
+
+- TokenCache: 검증된 JWT -> login_id. 키는 토큰의 SHA-256 다이제스트이고, 토큰의 exp가 지나면 만료
+- UserCache: login_id -> User 컬럼 스냅샷. 짧은 TTL + 수정/탈퇴 시 명시적 무효화
+
+프로세스마다 따로 유지되므로 다른 워커 프로세스의 수정은 UserCache TTL만큼 늦게 반영될 수 있습니다.
+"""
+import hashlib
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+
+Clock = Callable[[], float]
+
+
+class TokenCache(TTLCache[str, str]):
+    """
+    검증에 성공한 토큰만 저장합니다. (실패한 토큰은 매번 다시 검증)
+    """
+    def __init__(self, max_entries: int, clock: Clock = time.time):
+        super().__init__(max_entries, clock)
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[str]:
+        return super().get(self.digest(token))
+
+    def put(self, token: str, login_id: str, exp: Optional[float]) -> None:
+        # exp가 없는 토큰은 만료 시점을 알 수 없으므로 캐시하지 않음
+        if exp is None:
+            return
+        super().put(self.digest(token), login_id, float(exp))
+
+
+class UserCache(TTLCache[str, Dict[str, Any]]):
+    """
+    User 컬럼 값 스냅샷을 저장합니다. (ORM 객체는 세션에 묶여 있으므로 그대로 공유하지 않음)
+    """
+    def __init__(self, max_entries: int, ttl_sec: float, clock: Clock = time.monotonic):
+        super().__init__(max_entries, clock)
+        self._ttl = ttl_sec
+
+    def put(self, login_id: str, snapshot: Dict[str, Any]) -> None:
+        if self._ttl <= 0:
+            return
+        super().put(login_id, snapshot, self._clock() + self._ttl)
+
+    def invalidate(self, login_id: str) -> None:
+        self.pop(login_id)
+
+
+token_cache = TokenCache(settings.AUTH_TOKEN_CACHE_MAX_ENTRIES)
+user_cache = UserCache(settings.AUTH_USER_CACHE_MAX_ENTRIES, settings.AUTH_USER_CACHE_TTL_SECONDS)
+
+
+def auth_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {"token": token_cache.stats(), "user": user_cache.stats()}
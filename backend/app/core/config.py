@@ -18,6 +18,17 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 240
 
+    # Auth Cache (요청마다 JWT 디코딩 + 유저 조회 DB 왕복을 줄이기 위한 프로세스 로컬 캐시)
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10000  # 검증된 토큰 캐시 크기 (토큰 exp까지 유지)
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 10000  # 유저 캐시 크기
+    AUTH_USER_CACHE_TTL_SECONDS: int = 30  # 유저 캐시 TTL (0이면 비활성화)
+
+    # Password Hashing (bcrypt는 전용 스레드 풀에서 실행 - 이벤트 루프 블로킹 방지)
+    BCRYPT_ROUNDS: int = 12  # 변경하면 기존 해시는 다음 로그인 때 새 cost로 재해시됨
+    PASSWORD_HASH_WORKERS: int = 4  # 해시 전용 스레드 수
+    PASSWORD_HASH_MAX_PENDING: int = 64  # 실행 중 + 대기 중 최대 작업 수
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 10.0  # 대기 + 실행 제한 시간 (초과 시 503)
+
     # External APIs
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_MODEL: str = "gpt-5"
@@ -32,6 +43,40 @@ class Settings(BaseSettings):
     SESSION_CLEANUP_INTERVAL_SECONDS: int = 3600  # 정리 주기 (기본 1시간)
     SESSION_GUEST_TTL_MINS: int = 30  # 게스트 세션 만료 시간 (분)
 
+    # Background Job Queue (세션 종료 후 분석/피드백)
+    JOB_WORKER_ENABLED: bool = True  # 워커 실행 여부 (False면 등록만 되고 처리는 다른 프로세스에 맡김)
+    JOB_WORKER_CONCURRENCY: int = 2  # 동시에 처리할 작업 수
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0  # 큐가 비었을 때 폴링 주기
+    JOB_MAX_ATTEMPTS: int = 5  # 최대 시도 횟수
+    JOB_RETRY_BASE_SECONDS: float = 10.0  # 재시도 백오프 기본값 (지수 증가)
+    JOB_RETRY_MAX_SECONDS: float = 600.0  # 재시도 백오프 상한
+    JOB_LOCK_TIMEOUT_SECONDS: int = 900  # running 상태로 이 시간 이상 남은 작업은 중단된 것으로 보고 재등록
+    JOB_REAP_INTERVAL_SECONDS: float = 60.0  # 중단된 작업 재등록 확인 주기
+
+    # Session Registry (실시간 세션 컨텍스트 공유 - 멀티 워커에서 힌트 생성)
+    SESSION_REGISTRY_BACKEND: str = "db"  # "db": live_session_contexts 테이블 공유, "memory": 프로세스 로컬 (단일 워커)
+    SESSION_CONTEXT_TTL_SECONDS: int = 1800  # 이 시간 이상 갱신되지 않은 컨텍스트는 무시/정리 (크래시로 남은 행)
+
+    # Feedback Generation (긴 대화는 메시지 청크로 나눠 병렬 분석)
+    FEEDBACK_CHUNK_MESSAGES: int = 40  # 청크당 메시지 수 (이하이면 요약+피드백을 한 번에 요청)
+
+    # Realtime History Replay (재연결 시 최근 N개만 원문, 그 앞은 요약 1개로 주입)
+    REALTIME_HISTORY_KEEP_MESSAGES: int = 12
+
+    # Realtime Upstream Pool (OpenAI Realtime 연결을 미리 열어 두고 접속 시 바로 사용, 워커 프로세스별)
+    # 기본 비활성화: 켜면 사용자가 없어도 워커마다 대기 소켓을 유지하고 MAX_IDLE마다 새로 연결함
+    # 크기 산정: 수업 시작처럼 몰리는 접속 수 / 워커 수 (/metrics/realtime-pool의 misses를 보고 조정)
+    REALTIME_POOL_SIZE: int = 0  # 엔드포인트(채팅/시나리오)별 대기 소켓 수 (0이면 비활성화)
+    REALTIME_POOL_MAX_IDLE_SECONDS: float = 300.0  # 이 시간 이상 대기한 소켓은 닫고 새로 연결
+
+    # Hint Cache (같은 대화에 대한 반복 힌트 요청은 LLM 재호출 없이 응답)
+    HINT_CACHE_MAX_ENTRIES: int = 1024
+    HINT_CACHE_TTL_SECONDS: int = 300
+
+    # Scenario Statistics (Top 키워드 스냅샷 재계산)
+    SCENARIO_KEYWORDS_REFRESH_ENABLED: bool = True
+    SCENARIO_KEYWORDS_REFRESH_INTERVAL_SECONDS: int = 300  # 재계산 주기 (기본 5분)
+
     # Database
     # 1. 로컬 개발/테스트용: SQLite 사용 (기본값)
     # 2. 배포용: config.sh 및 5-setup_services.sh에서 주입된 환경변수를 통해 PostgreSQL 사용
@@ -7,6 +7,11 @@ class UserAlreadyExistsError(ServiceException):
         self.message = message
         super().__init__(self.message)
 
+class PasswordHasherBusyError(ServiceException):
+    def __init__(self, message: str = "Password hashing is overloaded"):
+        self.message = message
+        super().__init__(self.message)
+
 class UserInactiveError(ServiceException):
     def __init__(self, message: str = "User is inactive"):
         self.message = message
@@ -1,10 +1,18 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
 from jose import jwt
 from passlib.context import CryptContext
+from app.core import exceptions
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+T = TypeVar("T")
+
+# bcrypt__rounds와 다른 cost의 해시는 needs_update로 판정되어 로그인 시 재해시됨
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 ALGORITHM = settings.ALGORITHM
 
@@ -25,3 +33,64 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+# bcrypt(cffi)는 GIL을 놓고 실행되므로 스레드 풀로도 병렬 처리됨
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_slots: Optional[asyncio.Semaphore] = None
+
+
+def _get_hash_executor() -> Tuple[ThreadPoolExecutor, asyncio.Semaphore]:
+    global _hash_executor, _hash_slots
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=max(settings.PASSWORD_HASH_WORKERS, 1), thread_name_prefix="password-hash"
+        )
+        _hash_slots = asyncio.Semaphore(max(settings.PASSWORD_HASH_MAX_PENDING, 1))
+    return _hash_executor, _hash_slots
+
+
+async def _run_password_hash(func: Callable[..., T], *args: Any) -> T:
+    """
+    비밀번호 해시 작업을 전용 스레드 풀에서 실행합니다.
+    대기 중인 작업이 PASSWORD_HASH_MAX_PENDING을 넘거나 제한 시간을 초과하면 PasswordHasherBusyError
+    """
+    executor, slots = _get_hash_executor()
+    loop = asyncio.get_running_loop()
+    timeout = settings.PASSWORD_HASH_TIMEOUT_SECONDS
+    deadline = loop.time() + timeout
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=timeout)
+    except asyncio.TimeoutError:
+        raise exceptions.PasswordHasherBusyError()
+
+    future = loop.run_in_executor(executor, func, *args)
+    # 슬롯은 스레드 작업이 실제로 끝날 때 반납 (타임아웃으로 기다림을 포기해도 풀 크기 제한 유지)
+    future.add_done_callback(lambda _: slots.release())
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout=max(deadline - loop.time(), 0))
+    except asyncio.TimeoutError:
+        raise exceptions.PasswordHasherBusyError()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_hash(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호를 검증하고, 해시 cost가 현재 설정과 다르면 새 해시도 함께 반환합니다.
+    """
+    return await _run_password_hash(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_password_hash(pwd_context.hash, password)
+
+
+def shutdown_password_hash_executor() -> None:
+    global _hash_executor, _hash_slots
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False)
+        _hash_executor = None
+        _hash_slots = None
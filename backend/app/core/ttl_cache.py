@@ -0,0 +1,82 @@
+"""
+TTL + LRU 캐시 (프로세스 로컬, 스레드 안전)
+
+항목마다 만료 시각을 따로 가지며, max_entries를 넘으면 가장 오래 쓰이지 않은 항목부터 제거합니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    max_entries=None이면 크기 제한 없음, 0이면 캐시하지 않음
+    """
+    def __init__(self, max_entries: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        self._max_entries = None if max_entries is None else max(max_entries, 0)
+        self._clock = clock
+        self._entries: "OrderedDict[K, Tuple[V, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key: K) -> Optional[V]:
+        """조회 통계에 반영하지 않고 값을 조회합니다."""
+        with self._lock:
+            return self._lookup(key)
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: K, value: V, expires_at: float) -> None:
+        if self._max_entries == 0 or expires_at <= self._clock():
+            return
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if self._max_entries is not None:
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _lookup(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer, ForeignKey, Boolean, DateTime, Text
+from sqlalchemy import Column, String, Float, Integer, ForeignKey, Boolean, DateTime, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -60,6 +60,9 @@ class ConversationSession(Base):
     total_duration_sec = Column(Float, default=0.0)
     user_speech_duration_sec = Column(Float, default=0.0)
 
+    # [New] 메시지 개수 (비정규화, 메시지 저장 시 함께 증가)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     scenario_place = Column(String, nullable=True)
     scenario_partner = Column(String, nullable=True)
     scenario_goal = Column(String, nullable=True)
@@ -67,6 +70,10 @@ class ConversationSession(Base):
     scenario_completed_at = Column(DateTime(timezone=True), nullable=True)
     deleted = Column(Boolean, default=False)
     scenario_summary = Column(Text, nullable=True) # 시나리오 요약 (English 1 line)
+
+    # [History Compaction] 실시간 세션 재연결 시 앞부분 대화 대신 주입하는 요약 (캐시)
+    history_summary = Column(Text, nullable=True)
+    history_summary_count = Column(Integer, nullable=True) # 요약이 덮는 앞쪽 메시지 수
     
     # Analytics (1:1 Relation)
     analytics = relationship("SessionAnalytics", uselist=False, back_populates="session", cascade="all, delete-orphan")
@@ -89,6 +96,11 @@ class ConversationSession(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True) # 익명 대화 가능성 고려하여 Nullable
     owner = relationship("User", back_populates="sessions")
 
+    # 세션 목록 Keyset 페이지네이션용 복합 인덱스 (user_id, ended_at, session_id)
+    __table_args__ = (
+        Index("ix_conversation_sessions_user_ended", "user_id", "ended_at", "session_id"),
+    )
+
 class ChatMessage(Base):
     """개별 메시지 테이블"""
     __tablename__ = "chat_messages"
@@ -107,3 +119,47 @@ class ChatMessage(Base):
     reason = Column(Text, nullable=True)
 
     session = relationship("ConversationSession", back_populates="messages")
+
+class BackgroundJob(Base):
+    """
+    백그라운드 작업 큐 테이블 (세션 종료 후 분석/피드백 등)
+    - 외부 브로커 없이 DB(SQLite/PostgreSQL)만으로 동작
+    - idempotency_key로 같은 작업의 중복 등록 방지
+    """
+    __tablename__ = "background_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_type = Column(String, nullable=False) # e.g. "session_post_process"
+    idempotency_key = Column(String, unique=True, nullable=False)
+    session_id = Column(String, nullable=True, index=True) # 상태 조회용 (세션 관련 작업)
+    payload = Column(Text, nullable=True) # JSON
+
+    # queued -> running -> succeeded / failed (재시도 시 다시 queued)
+    status = Column(String, nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Audit Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_background_jobs_status_run_after", "status", "run_after"),
+    )
+
+
+class LiveSessionContext(Base):
+    """
+    진행 중인 실시간 세션의 대화 컨텍스트 (워커 간 공유)
+    - WebSocket을 가진 워커가 자막이 추가될 때마다 덮어쓰고, 세션 종료 시 삭제
+    - 다른 워커는 이 테이블을 읽어 힌트를 생성
+    """
+    __tablename__ = "live_session_contexts"
+
+    session_id = Column(String, primary_key=True)
+    context = Column(Text, nullable=False) # JSON (최근 메시지 + 시나리오 컨텍스트)
+    updated_at = Column(DateTime(timezone=True), nullable=False, index=True)
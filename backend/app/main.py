@@ -1,29 +1,48 @@
 from contextlib import asynccontextmanager
 import asyncio
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from app.core import exceptions
 from app.core.config import settings
+from app.core.auth_cache import auth_cache_stats
+from app.core.security import shutdown_password_hash_executor
 from app.api.api import api_router
 from app.db.database import engine
 from app.db.models import Base
 from app.services.session_cleanup import run_cleanup_loop
+from app.services.job_worker import run_job_workers
+from app.services.scenario_stats_refresh import run_scenario_keywords_refresh_loop
+from app.services.live_session_store import configure_session_registry
+from app.services.realtime_pool import configure_upstream_pools
+from realtime_conversation.upstream_metrics import upstream_switch_metrics
+from scenario.send_queue import live_send_queue_stats
+from scenario.tts_metrics import tts_first_audio_metrics
+from scenario.upstream_pool import close_upstream_pools, upstream_pool_stats
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    configure_session_registry()
+    configure_upstream_pools()
     stop_event = asyncio.Event()
     cleanup_task = asyncio.create_task(run_cleanup_loop(stop_event))
+    job_worker_task = asyncio.create_task(run_job_workers(stop_event))
+    keywords_task = asyncio.create_task(run_scenario_keywords_refresh_loop(stop_event))
     yield
     # Shutdown
     stop_event.set()
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+    for task in (cleanup_task, job_worker_task, keywords_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await close_upstream_pools()
+    shutdown_password_hash_executor()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -44,6 +63,36 @@ if settings.BACKEND_CORS_ORIGINS:
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.exception_handler(exceptions.PasswordHasherBusyError)
+async def password_hasher_busy_handler(request: Request, exc: exceptions.PasswordHasherBusyError):
+    # 로그인/회원가입 폭주로 해시 대기열이 가득 찬 경우 (잠시 후 재시도)
+    return JSONResponse(status_code=503, content={"detail": exc.message}, headers={"Retry-After": "1"})
+
 @app.get("/")
 def root():
     return {"message": "Welcome to MaLangEE Backend API"}
+
+@app.get("/metrics/auth-cache")
+def auth_cache_metrics():
+    """인증 캐시 적중률 (프로세스별)"""
+    return auth_cache_stats()
+
+@app.get("/metrics/realtime-upstream")
+def realtime_upstream_metrics():
+    """OpenAI 연결 교체(보이스 변경) 소요 시간 (프로세스별)"""
+    return upstream_switch_metrics.snapshot()
+
+@app.get("/metrics/tts-first-audio")
+def tts_first_audio_metrics_view():
+    """시나리오 응답 요청부터 첫 오디오 청크 전송까지 걸린 시간 (프로세스별)"""
+    return tts_first_audio_metrics.snapshot()
+
+@app.get("/metrics/send-queue")
+def send_queue_metrics():
+    """열려 있는 실시간 연결의 클라이언트 전송 큐 깊이 / 버린(shed) 오디오 프레임 (프로세스별)"""
+    return live_send_queue_stats()
+
+@app.get("/metrics/realtime-pool")
+def realtime_pool_metrics():
+    """OpenAI 연결 풀 적중률 / 대기 소켓 수 (프로세스별)"""
+    return upstream_pool_stats()
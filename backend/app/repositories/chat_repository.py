@@ -1,9 +1,9 @@
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 import json
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, insert, update, tuple_
 from sqlalchemy.orm import selectinload
 from app.db.models import ConversationSession, ChatMessage, ScenarioDefinition
 from app.schemas.chat import SessionCreate
@@ -13,10 +13,40 @@ class ChatRepository:
         self.db = db
 
     async def create_session_log(self, session_data: SessionCreate, user_id: int = None) -> ConversationSession:
-        # 1. Check if session exists
-        stmt = select(ConversationSession).where(ConversationSession.session_id == session_data.session_id).options(selectinload(ConversationSession.messages))
+        await self.append_session_log(session_data, user_id)
+        # [Fix] Async Refresh Issue: refresh() clears relationships.
+        # We must confirm relationships (especially messages) are loaded for Pydantic.
+        # Instead of refresh, we re-fetch with options.
+        stmt = (
+            select(ConversationSession)
+            .where(ConversationSession.session_id == session_data.session_id)
+            .options(
+                selectinload(ConversationSession.messages),
+                selectinload(ConversationSession.analytics)
+            )
+        )
         result = await self.db.execute(stmt)
         db_session = result.scalars().first()
+        
+        return db_session
+
+    async def append_session_log(
+        self, session_data: SessionCreate, user_id: int = None, commit: bool = True
+    ) -> list[int]:
+        """
+        세션 로그를 Append-only로 저장합니다 (기존 메시지는 로드하지 않음).
+
+        - 세션이 있으면 UPDATE 한 번으로 메타데이터 갱신 + 시간 누적(원자적 증가)
+        - 새 메시지는 multi-row INSERT ... RETURNING 한 번으로 추가
+        - commit=False면 Commit은 호출자가 관리 (후처리 작업 등록과 한 트랜잭션으로 묶을 때)
+
+        Returns:
+            새로 추가된 메시지 ID 리스트 (입력 순서)
+        """
+        # 1. Check if session exists (컬럼만 조회, 관계 로드 없음)
+        stmt = select(ConversationSession.deleted).where(ConversationSession.session_id == session_data.session_id)
+        result = await self.db.execute(stmt)
+        existing = result.first()
 
         scenario_state_json = None
         if session_data.scenario_state_json is not None:
@@ -25,103 +55,86 @@ class ChatRepository:
             else:
                 scenario_state_json = json.dumps(session_data.scenario_state_json, ensure_ascii=False)
 
-        scenario_completed_at = session_data.scenario_completed_at
-
-        if db_session:
-            if db_session.deleted:
+        if existing is not None:
+            if existing.deleted:
                 raise ValueError("Session is deleted")
             # [UPDATE]
             # Title은 업데이트하지 않음 (생성 시 또는 별도 API로만 관리)
-            
-            db_session.started_at = session_data.started_at
-            db_session.ended_at = session_data.ended_at
-            
             # [Accumulate] 시간 누적 (기존 시간 + 이번 세션 시간)
-            # Tracker는 이번 연결의 시간만 계산해서 보내주므로, DB에는 계속 더해야 함
-            db_session.total_duration_sec += session_data.total_duration_sec
-            db_session.user_speech_duration_sec += session_data.user_speech_duration_sec
-            
+            # Tracker는 이번 연결의 시간만 계산해서 보내주므로, DB 쪽에서 원자적으로 더함
+            values = {
+                "started_at": session_data.started_at,
+                "ended_at": session_data.ended_at,
+                "total_duration_sec": func.coalesce(ConversationSession.total_duration_sec, 0.0)
+                + session_data.total_duration_sec,
+                "user_speech_duration_sec": func.coalesce(ConversationSession.user_speech_duration_sec, 0.0)
+                + session_data.user_speech_duration_sec,
+                "message_count": func.coalesce(ConversationSession.message_count, 0) + len(session_data.messages),
+            }
             if user_id is not None:
-                db_session.user_id = user_id
-
-            if session_data.scenario_place is not None:
-                db_session.scenario_place = session_data.scenario_place
-            if session_data.scenario_partner is not None:
-                db_session.scenario_partner = session_data.scenario_partner
-            if session_data.scenario_goal is not None:
-                db_session.scenario_goal = session_data.scenario_goal
-            if scenario_state_json is not None:
-                db_session.scenario_state_json = scenario_state_json
-            if scenario_completed_at is not None:
-                db_session.scenario_completed_at = scenario_completed_at
-            
-            if session_data.voice is not None:
-                db_session.voice = session_data.voice
-            if session_data.show_text is not None:
-                db_session.show_text = session_data.show_text
-            
-            if session_data.scenario_summary is not None:
-                db_session.scenario_summary = session_data.scenario_summary
-            
-            # Tracker는 현재 세션의 '새로운' 메시지만 들고 있으므로,
-            # 슬라이싱 없이 그대로 기존 DB 메시지 뒤에 추가(Append)하면 됩니다.
-            for msg in session_data.messages:
-                db_msg = ChatMessage(
-                    session_id=session_data.session_id,
-                    role=msg.role,
-                    content=msg.content,
-                    timestamp=msg.timestamp,
-                    duration_sec=msg.duration_sec
-                )
-                db_session.messages.append(db_msg)
+                values["user_id"] = user_id
+            optional_values = {
+                "scenario_place": session_data.scenario_place,
+                "scenario_partner": session_data.scenario_partner,
+                "scenario_goal": session_data.scenario_goal,
+                "scenario_state_json": scenario_state_json,
+                "scenario_completed_at": session_data.scenario_completed_at,
+                "voice": session_data.voice,
+                "show_text": session_data.show_text,
+                "scenario_summary": session_data.scenario_summary,
+            }
+            values.update({key: value for key, value in optional_values.items() if value is not None})
+            await self.db.execute(
+                update(ConversationSession)
+                .where(ConversationSession.session_id == session_data.session_id)
+                .values(**values)
+            )
         else:
             # [INSERT]
-            db_session = ConversationSession(
-                session_id=session_data.session_id,
-                title=session_data.title,
-                started_at=session_data.started_at,
-                ended_at=session_data.ended_at,
-                total_duration_sec=session_data.total_duration_sec,
-                user_speech_duration_sec=session_data.user_speech_duration_sec,
-                scenario_place=session_data.scenario_place,
-                scenario_partner=session_data.scenario_partner,
-                scenario_goal=session_data.scenario_goal,
-                scenario_state_json=scenario_state_json,
-                scenario_completed_at=scenario_completed_at,
-                voice=session_data.voice,
-                show_text=session_data.show_text,
-                user_id=user_id,
-                scenario_summary=session_data.scenario_summary
-            )
-            self.db.add(db_session)
-            
-            # Add All Messages
-            for msg in session_data.messages:
-                db_msg = ChatMessage(
+            await self.db.execute(
+                insert(ConversationSession).values(
                     session_id=session_data.session_id,
-                    role=msg.role,
-                    content=msg.content,
-                    timestamp=msg.timestamp,
-                    duration_sec=msg.duration_sec
+                    title=session_data.title,
+                    started_at=session_data.started_at,
+                    ended_at=session_data.ended_at,
+                    total_duration_sec=session_data.total_duration_sec,
+                    user_speech_duration_sec=session_data.user_speech_duration_sec,
+                    message_count=len(session_data.messages),
+                    scenario_place=session_data.scenario_place,
+                    scenario_partner=session_data.scenario_partner,
+                    scenario_goal=session_data.scenario_goal,
+                    scenario_state_json=scenario_state_json,
+                    scenario_completed_at=session_data.scenario_completed_at,
+                    voice=session_data.voice,
+                    show_text=session_data.show_text,
+                    user_id=user_id,
+                    scenario_summary=session_data.scenario_summary
                 )
-                db_session.messages.append(db_msg)
-        
-        await self.db.commit()
-        # [Fix] Async Refresh Issue: refresh() clears relationships.
-        # We must confirm relationships (especially messages) are loaded for Pydantic.
-        # Instead of refresh, we re-fetch with options.
-        stmt = (
-            select(ConversationSession)
-            .where(ConversationSession.session_id == db_session.session_id)
-            .options(
-                selectinload(ConversationSession.messages),
-                selectinload(ConversationSession.analytics)
             )
-        )
-        result = await self.db.execute(stmt)
-        db_session = result.scalars().first()
-        
-        return db_session
+
+        # Tracker는 현재 세션의 '새로운' 메시지만 들고 있으므로,
+        # 슬라이싱 없이 그대로 기존 DB 메시지 뒤에 추가(Append)하면 됩니다.
+        message_ids: list[int] = []
+        if session_data.messages:
+            rows = [
+                {
+                    "session_id": session_data.session_id,
+                    "role": msg.role,
+                    "content": msg.content,
+                    "timestamp": msg.timestamp,
+                    "duration_sec": msg.duration_sec,
+                }
+                for msg in session_data.messages
+            ]
+            result = await self.db.execute(
+                insert(ChatMessage).returning(ChatMessage.id, sort_by_parameter_order=True),
+                rows,
+            )
+            message_ids = list(result.scalars().all())
+
+        if commit:
+            await self.db.commit()
+        return message_ids
 
     async def get_recent_session_by_user(self, user_id: int) -> Optional[ConversationSession]:
         stmt = (
@@ -155,24 +168,55 @@ class ChatRepository:
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
-    async def get_sessions_by_user(self, user_id: int, skip: int = 0, limit: int = 20):
-        # 1. Total Count Query
-        count_stmt = select(func.count(ConversationSession.session_id)).where(ConversationSession.user_id == user_id)
+    async def is_session_owner(self, session_id: str, user_id: int) -> bool:
+        """
+        세션 소유 여부만 확인합니다. (메시지/통계 로딩 없음)
+        """
+        stmt = select(ConversationSession.session_id).where(
+            ConversationSession.session_id == session_id,
+            ConversationSession.user_id == user_id,
+            ConversationSession.deleted.is_(False),
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar() is not None
+
+    async def get_sessions_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        after: Optional[Tuple[str, str]] = None,
+    ):
+        """
+        사용자 세션 목록을 (ended_at DESC, session_id DESC) 순으로 조회합니다.
+
+        - after가 주어지면 Keyset 페이지네이션: (ended_at, session_id) < after 인 행부터 조회 (skip 무시)
+        - 메시지 개수는 비정규화 컬럼(message_count)을 사용하므로 chat_messages를 조인하지 않음
+        - (user_id, ended_at, session_id) 복합 인덱스로 정렬/필터 처리
+
+        Returns:
+            (세션 리스트, 전체 개수) 튜플
+        """
+        # 1. Total Count Query (인덱스만으로 계산)
+        count_stmt = select(func.count()).select_from(ConversationSession).where(ConversationSession.user_id == user_id)
         count_result = await self.db.execute(count_stmt)
         total_count = count_result.scalar()
 
         # 2. Data Query (Paginated)
         stmt = (
-            select(ConversationSession, func.count(ChatMessage.id))
-            .outerjoin(ChatMessage, ChatMessage.session_id == ConversationSession.session_id)
+            select(ConversationSession)
             .where(ConversationSession.user_id == user_id)
-            .group_by(ConversationSession.session_id)
-            .order_by(ConversationSession.ended_at.desc())
-            .offset(skip)
+            .order_by(ConversationSession.ended_at.desc(), ConversationSession.session_id.desc())
             .limit(limit)
         )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(ConversationSession.ended_at, ConversationSession.session_id) < tuple_(*after)
+            )
+        else:
+            stmt = stmt.offset(skip)
         result = await self.db.execute(stmt)
-        return result.all(), total_count
+        return result.scalars().all(), total_count
 
     async def update_session_owner(self, session_id: str, user_id: int) -> bool:
         stmt = select(ConversationSession).where(ConversationSession.session_id == session_id)
@@ -218,9 +262,102 @@ class ChatRepository:
         result = await self.db.execute(stmt)
         return result.scalars().all()
         
+    async def get_latest_messages(self, session_id: str, limit: int):
+        """세션의 마지막 limit개 메시지만 조회합니다 (timestamp 오름차순 반환)."""
+        stmt = (
+            select(ChatMessage)
+            .where(ChatMessage.session_id == session_id)
+            .order_by(ChatMessage.timestamp.desc(), ChatMessage.id.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(reversed(result.scalars().all()))
+
+    async def get_messages_by_ids(self, session_id: str, message_ids: list[int]):
+        """세션의 지정된 메시지만 조회합니다 (timestamp 오름차순 반환)."""
+        if not message_ids:
+            return []
+        stmt = (
+            select(ChatMessage)
+            .where(ChatMessage.session_id == session_id, ChatMessage.id.in_(message_ids))
+            .order_by(ChatMessage.timestamp.asc(), ChatMessage.id.asc())
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def update_session_summary(self, session_id: str, scenario_summary: str) -> None:
+        """세션 요약만 갱신합니다 (관계 로드 없음). Commit은 호출자가 관리."""
+        stmt = (
+            update(ConversationSession)
+            .where(ConversationSession.session_id == session_id)
+            .values(scenario_summary=scenario_summary)
+        )
+        await self.db.execute(stmt)
+
+    async def get_history_summary(self, session_id: str) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """캐시된 히스토리 요약 (history_summary, history_summary_count)만 조회합니다. 세션이 없으면 None"""
+        stmt = select(ConversationSession.history_summary, ConversationSession.history_summary_count).where(
+            ConversationSession.session_id == session_id
+        )
+        result = await self.db.execute(stmt)
+        row = result.first()
+        return tuple(row) if row is not None else None
+
+    async def get_dialogue_messages(self, session_id: str, offset: int = 0) -> list[dict]:
+        """user/assistant 메시지의 role, content만 id 순으로 조회합니다 (앞의 offset개 제외)."""
+        stmt = (
+            select(ChatMessage.role, ChatMessage.content)
+            .where(ChatMessage.session_id == session_id, ChatMessage.role.in_(("user", "assistant")))
+            .order_by(ChatMessage.id.asc())
+            .offset(offset)
+        )
+        result = await self.db.execute(stmt)
+        return [{"role": role, "content": content} for role, content in result.all()]
+
+    async def update_history_summary(self, session_id: str, history_summary: str, history_summary_count: int) -> None:
+        """재연결용 히스토리 요약 캐시를 갱신합니다. Commit은 호출자가 관리."""
+        stmt = (
+            update(ConversationSession)
+            .where(ConversationSession.session_id == session_id)
+            .values(history_summary=history_summary, history_summary_count=history_summary_count)
+        )
+        await self.db.execute(stmt)
+
+    async def bulk_update_message_feedback(self, session_id: str, feedback_items: list[dict]) -> int:
+        """
+        여러 메시지의 피드백을 executemany 한 번으로 업데이트합니다.
+        다른 세션의 메시지 ID는 무시됩니다. Commit은 호출자가 관리.
+
+        Args:
+            feedback_items: [{"message_id": int, "feedback": str, "reason": str}]
+
+        Returns:
+            실제로 업데이트된 행 수 (executemany rowcount 합계, 다른 세션 ID는 제외)
+            드라이버가 executemany rowcount를 보고하지 않으면 -1
+        """
+        if not feedback_items:
+            return 0
+        table = ChatMessage.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_message_id"))
+            .where(table.c.session_id == bindparam("b_session_id"))
+            .values(is_feedback=True, feedback=bindparam("b_feedback"), reason=bindparam("b_reason"))
+        )
+        params = [
+            {
+                "b_message_id": item["message_id"],
+                "b_session_id": session_id,
+                "b_feedback": item.get("feedback"),
+                "b_reason": item.get("reason"),
+            }
+            for item in feedback_items
+        ]
+        result = await self.db.execute(stmt, params)
+        return result.rowcount
+
     async def update_message_feedback(self, message_id: int, feedback_data: dict) -> bool:
         """메시지에 피드백 정보를 업데이트합니다."""
-        from sqlalchemy import update
         stmt = (
             update(ChatMessage)
             .where(ChatMessage.id == message_id)
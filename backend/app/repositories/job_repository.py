@@ -0,0 +1,147 @@
+from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+import json
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from app.db.models import BackgroundJob
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(
+        self,
+        job_type: str,
+        idempotency_key: str,
+        payload: dict,
+        session_id: Optional[str] = None,
+        max_attempts: int = 5,
+        commit: bool = True,
+    ) -> BackgroundJob:
+        """
+        작업을 등록합니다. 같은 idempotency_key의 작업이 이미 있으면 기존 작업을 반환합니다.
+
+        commit=False면 flush만 하고 Commit은 호출자가 관리합니다.
+        (작업을 만든 데이터와 같은 트랜잭션으로 등록할 때 사용)
+        """
+        existing = await self.get_by_idempotency_key(idempotency_key)
+        if existing:
+            return existing
+
+        job = BackgroundJob(
+            job_type=job_type,
+            idempotency_key=idempotency_key,
+            session_id=session_id,
+            payload=json.dumps(payload, ensure_ascii=False),
+            status=JOB_QUEUED,
+            attempts=0,
+            max_attempts=max_attempts,
+            run_after=_utcnow(),
+        )
+        self.db.add(job)
+        if not commit:
+            await self.db.flush()
+            return job
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # 동시에 같은 키로 등록된 경우 (unique 제약)
+            await self.db.rollback()
+            return await self.get_by_idempotency_key(idempotency_key)
+        await self.db.refresh(job)
+        return job
+
+    async def get_by_idempotency_key(self, idempotency_key: str) -> Optional[BackgroundJob]:
+        stmt = select(BackgroundJob).where(BackgroundJob.idempotency_key == idempotency_key)
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+
+    async def get_jobs_by_session(self, session_id: str) -> List[BackgroundJob]:
+        stmt = (
+            select(BackgroundJob)
+            .where(BackgroundJob.session_id == session_id)
+            .order_by(BackgroundJob.id.asc())
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def claim_next(self) -> Optional[BackgroundJob]:
+        """
+        실행 가능한 작업 1개를 선점합니다.
+        SELECT 후 상태 조건부 UPDATE(status='queued')로 선점하므로
+        SKIP LOCKED가 없는 SQLite에서도 여러 워커가 같은 작업을 가져가지 않습니다.
+        """
+        now = _utcnow()
+        stmt = (
+            select(BackgroundJob.id)
+            .where(
+                BackgroundJob.status == JOB_QUEUED,
+                BackgroundJob.run_after <= now,
+            )
+            .order_by(BackgroundJob.run_after.asc(), BackgroundJob.id.asc())
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        job_id = result.scalar()
+        if job_id is None:
+            return None
+
+        claim = (
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id, BackgroundJob.status == JOB_QUEUED)
+            .values(status=JOB_RUNNING, locked_at=now, attempts=BackgroundJob.attempts + 1)
+        )
+        result = await self.db.execute(claim)
+        await self.db.commit()
+        if result.rowcount != 1:
+            return None
+        return await self.db.get(BackgroundJob, job_id, populate_existing=True)
+
+    async def mark_succeeded(self, job_id: int) -> None:
+        await self._finish(job_id, status=JOB_SUCCEEDED, finished_at=_utcnow(), last_error=None)
+
+    async def mark_failed(self, job: BackgroundJob, error: str, retry_delay_sec: float) -> None:
+        """
+        실패 처리: 재시도 횟수가 남아 있으면 run_after를 미뤄 다시 queued로, 아니면 failed로 종료
+        """
+        if job.attempts < job.max_attempts:
+            await self._finish(
+                job.id,
+                status=JOB_QUEUED,
+                run_after=_utcnow() + timedelta(seconds=retry_delay_sec),
+                locked_at=None,
+                last_error=error,
+            )
+        else:
+            await self._finish(job.id, status=JOB_FAILED, finished_at=_utcnow(), last_error=error)
+
+    async def requeue_stale(self, lock_timeout_sec: float) -> int:
+        """
+        크래시/재배포로 running 상태에 남은 작업을 다시 queued로 돌립니다.
+        """
+        cutoff = _utcnow() - timedelta(seconds=lock_timeout_sec)
+        stmt = (
+            update(BackgroundJob)
+            .where(BackgroundJob.status == JOB_RUNNING, BackgroundJob.locked_at < cutoff)
+            .values(status=JOB_QUEUED, locked_at=None)
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount or 0
+
+    async def _finish(self, job_id: int, **values) -> None:
+        stmt = update(BackgroundJob).where(BackgroundJob.id == job_id).values(**values)
+        await self.db.execute(stmt)
+        await self.db.commit()
@@ -1,9 +1,11 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import make_transient_to_detached
 from app.db.models import User
+from app.core.auth_cache import user_cache
 from app.schemas.user import UserCreate
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 
 class UserRepository:
     def __init__(self, db: AsyncSession):
@@ -17,6 +19,22 @@ class UserRepository:
         result = await self.db.execute(select(User).where(User.login_id == login_id))
         return result.scalars().first()
 
+    async def get_by_login_id_cached(self, login_id: str) -> Optional[User]:
+        """
+        인증용 유저 조회. 캐시에 있으면 DB 조회 없이 이 세션에 붙인 User를 반환합니다.
+        (조회 결과가 없는 경우는 캐시하지 않음)
+        """
+        snapshot = user_cache.get(login_id)
+        if snapshot is not None:
+            user = User(**snapshot)
+            make_transient_to_detached(user)
+            return await self.db.merge(user, load=False)
+
+        user = await self.get_by_login_id(login_id)
+        if user is not None:
+            user_cache.put(login_id, {c.key: getattr(user, c.key) for c in User.__table__.columns})
+        return user
+
     async def get_by_nickname(self, nickname: str) -> Optional[User]:
         result = await self.db.execute(select(User).where(User.nickname == nickname))
         return result.scalars().first()
@@ -25,7 +43,7 @@ class UserRepository:
         db_user = User(
             login_id=user_in.login_id,
             nickname=user_in.nickname,
-            hashed_password=get_password_hash(user_in.password),
+            hashed_password=await get_password_hash_async(user_in.password),
             is_active=True
         )
         self.db.add(db_user)
@@ -36,5 +54,7 @@ class UserRepository:
     async def update(self, user: User) -> User:
         self.db.add(user)
         await self.db.commit()
+        # 수정/탈퇴 내용이 인증 캐시에 남지 않도록 무효화
+        user_cache.invalidate(user.login_id)
         await self.db.refresh(user)
         return user
@@ -97,6 +97,23 @@ class HintResponse(BaseModel):
     hints: List[str]
     session_id: str
 
+class JobStatusResponse(BaseModel):
+    """
+    세션 후처리(분석/피드백) 작업 상태 스키마
+    """
+    id: int
+    job_type: str
+    status: str  # queued / running / succeeded / failed
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
 class SessionStartRequest(BaseModel):
     """
     세션 시작 요청 스키마 (POST /sessions)
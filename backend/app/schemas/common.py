@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -7,6 +7,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
     total: int
     items: List[T]
     has_next: bool
+    next_cursor: Optional[str] = None  # Keyset 페이지네이션용 다음 페이지 커서
 
 class CheckAvailabilityResponse(BaseModel):
     """
@@ -6,6 +6,7 @@ from jose import jwt, JWTError
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserCreate
 from app.core import security
+from app.core.auth_cache import token_cache
 from app.core.config import settings
 
 class AuthService:
@@ -28,10 +29,15 @@ class AuthService:
         user = await self.user_repo.get_by_login_id(login_id)
         if not user:
             return None
-        if not security.verify_password(password, user.hashed_password):
+        verified, new_hash = await security.verify_and_update_password_async(password, user.hashed_password)
+        if not verified:
             return None
         if not user.is_active:
             raise exceptions.UserInactiveError("탈퇴한 회원입니다.")
+        if new_hash:
+            # BCRYPT_ROUNDS가 바뀐 경우 로그인 성공 시점에 새 cost로 재해시
+            user.hashed_password = new_hash
+            user = await self.user_repo.update(user)
         return user
 
     def create_access_token(self, subject: str) -> str:
@@ -52,12 +58,18 @@ class AuthService:
         """
         토큰을 검증하고 login_id(sub)를 반환합니다.
         실패 시 None을 반환합니다.
+        한 번 검증된 토큰은 exp까지 캐시에서 바로 반환합니다.
         """
+        login_id = token_cache.get(token)
+        if login_id is not None:
+            return login_id
         try:
             payload = jwt.decode(
                 token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
             )
             login_id: str = payload.get("sub")
-            return login_id
         except (JWTError, Exception):
             return None
+        if login_id:
+            token_cache.put(token, login_id, payload.get("exp"))
+        return login_id
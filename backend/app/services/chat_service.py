@@ -1,20 +1,41 @@
 import sys
 import asyncio
+import base64
+import binascii
+import json
+import logging
 from typing import Any, Dict, List, Optional
 
 from app.core.config import settings
 from app.db.models import ConversationSession, User
 from app.repositories.chat_repository import ChatRepository
-from app.schemas.chat import SessionCreate, SessionResponse, SessionSummary, SessionStartRequest
+from app.repositories.job_repository import JobRepository
+from app.schemas.chat import JobStatusResponse, SessionCreate, SessionResponse, SessionSummary, SessionStartRequest
 from app.schemas.common import PaginatedResponse
+from app.services.job_worker import enqueue_job, register_job_handler
 from fastapi import WebSocket
 from realtime_conversation.connection_handler import ConnectionHandler
-from realtime_conversation.session_manager import SessionManager
-from realtime_hint.hint_service import generate_hints
+from realtime_conversation.history_compactor import HistorySummary, summarize_history
+from realtime_conversation.session_manager import SessionManager, build_session_context
+from scenario.openai_clients import get_async_openai_client, get_client_registry
+from realtime_hint.hint_engine import HINT_CONTEXT_MESSAGES, HintEngine, transcript_tail_hash
+from realtime_hint.hint_service import generate_hints_async
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+logger = logging.getLogger(__name__)
+
+SESSION_POST_PROCESS_JOB = "session_post_process"
+
+# [Hint] 프로세스 공용 힌트 엔진 (캐시 + 동시 요청 병합 + AI 응답 직후 선생성)
+hint_engine = HintEngine(
+    generate_hints_async,
+    max_entries=settings.HINT_CACHE_MAX_ENTRIES,
+    ttl_sec=settings.HINT_CACHE_TTL_SECONDS,
+)
+
+
 class ChatService:
     def __init__(self, chat_repo: ChatRepository):
         self.chat_repo = chat_repo
@@ -23,6 +44,25 @@ class ChatService:
     async def save_chat_log(self, session_data: SessionCreate, user_id: int = None) -> ConversationSession:
         return await self.chat_repo.create_session_log(session_data, user_id)
 
+    async def append_chat_log(self, session_data: SessionCreate, user_id: int = None) -> List[int]:
+        """세션 종료 리포트 저장용 Append-only 경로 (기존 메시지 재조회 없음)."""
+        return await self.chat_repo.append_session_log(session_data, user_id)
+
+    async def save_session_report(self, session_data: SessionCreate, user_id: int = None) -> List[int]:
+        """
+        세션 로그 저장과 분석/피드백 작업 등록을 한 트랜잭션으로 처리합니다.
+        (메시지만 저장되고 작업이 누락되는 상태가 생기지 않음)
+        """
+        db = self.chat_repo.db
+        try:
+            message_ids = await self.chat_repo.append_session_log(session_data, user_id, commit=False)
+            await enqueue_session_post_process(session_data, message_ids, db=db)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return message_ids
+
     async def create_new_session(self, session_in: SessionStartRequest, user_id: Optional[int]) -> ConversationSession:
         import uuid
         from datetime import datetime
@@ -73,10 +113,20 @@ class ChatService:
     async def get_recent_session(self, user_id: int) -> Optional[ConversationSession]:
         return await self.chat_repo.get_recent_session_by_user(user_id)
 
-    async def get_user_sessions(self, user_id: int, skip: int = 0, limit: int = 20) -> PaginatedResponse[SessionSummary]:
-        results, total_count = await self.chat_repo.get_sessions_by_user(user_id, skip, limit)
+    async def get_user_sessions(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> PaginatedResponse[SessionSummary]:
+        after = decode_session_cursor(cursor) if cursor else None
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        results, total_count = await self.chat_repo.get_sessions_by_user(user_id, skip, limit + 1, after=after)
+        has_next = len(results) > limit
+        results = results[:limit]
         summaries = []
-        for session, count in results:
+        for session in results:
             # SQLAlchemy model to Pydantic mapping
             summary = SessionSummary(
                 session_id=session.session_id,
@@ -87,16 +137,20 @@ class ChatService:
                 user_speech_duration_sec=session.user_speech_duration_sec,
                 created_at=session.created_at,
                 updated_at=session.updated_at,
-                message_count=count,
+                message_count=session.message_count or 0,
             )
             summaries.append(summary)
-        # Calculate has_next
-        has_next = (skip + len(summaries)) < total_count
+
+        next_cursor = None
+        if has_next and results:
+            last = results[-1]
+            next_cursor = encode_session_cursor(last.ended_at, last.session_id)
 
         return PaginatedResponse(
             total=total_count,
             items=summaries,
-            has_next=has_next
+            has_next=has_next,
+            next_cursor=next_cursor,
         )
 
     async def get_session_detail(self, session_id: str, user_id: int) -> Optional[SessionResponse]:
@@ -105,6 +159,15 @@ class ChatService:
             return None
         return SessionResponse.model_validate(session)
 
+    async def get_session_jobs(self, session_id: str, user_id: int) -> Optional[List[JobStatusResponse]]:
+        """
+        세션의 분석/피드백 작업 상태를 조회합니다. 세션이 없거나 소유자가 아니면 None
+        """
+        if not await self.chat_repo.is_session_owner(session_id, user_id):
+            return None
+        jobs = await JobRepository(self.chat_repo.db).get_jobs_by_session(session_id)
+        return [JobStatusResponse.model_validate(job) for job in jobs]
+
     async def get_messages_for_feedback(self, session_id: str, user_id: int) -> tuple[list[dict], Optional[ConversationSession]]:
         """
         피드백 생성을 위해 세션의 메시지를 조회합니다.
@@ -162,6 +225,7 @@ class ChatService:
 
         # 3. 최신 세션 정보 및 히스토리 조회
         history_messages = []
+        history_summary = None  # 앞부분 대화 요약 캐시 (재연결 시 히스토리 압축용)
         conversation_context = None
         voice_config = None  # DB에서 가져온 보이스 설정
 
@@ -211,19 +275,26 @@ class ChatService:
 
             # 히스토리 추출
             if session_obj.messages:
-                for msg in session_obj.messages:
+                for msg in sorted(session_obj.messages, key=lambda m: m.id):
                     history_messages.append({"role": msg.role, "content": msg.content})
 
+            if session_obj.history_summary and session_obj.history_summary_count:
+                history_summary = HistorySummary(session_obj.history_summary, session_obj.history_summary_count)
+
         # 4. ConnectionHandler 시작
         if ConnectionHandler:
             # context 및 voice 설정 전달
             handler = ConnectionHandler(
-                websocket, api_key, history=history_messages, session_id=session_id, context=conversation_context, voice=voice_config  # [New]
+                websocket, api_key, history=history_messages, session_id=session_id, context=conversation_context, voice=voice_config,  # [New]
+                on_context_update=self._publish_context if session_id else None,
+                history_summary=history_summary,
+                history_keep_last=settings.REALTIME_HISTORY_KEEP_MESSAGES,
             )
 
-            # [Manager] 세션 등록
+            # [Manager] 세션 등록 + 초기 컨텍스트 게시 (다른 워커에서도 힌트 생성 가능)
             if session_id:
                 self.session_manager.add_session(session_id, handler)
+                self._publish_context(handler)
 
             try:
                 report = await handler.start()
@@ -233,73 +304,90 @@ class ChatService:
                 if report:
                     try:
                         session_data = SessionCreate(**report)
-                        await self.save_chat_log(session_data, user_id)
+                        # [Analytics/Feedback Job]
+                        # 분석과 피드백 생성(LLM)은 세션 로그와 같은 트랜잭션으로 DB 작업 큐에 등록만 하고 워커가 처리합니다.
+                        # (WebSocket 핸들러를 붙잡지 않고, 크래시/재배포 시에도 작업이 유실되지 않음)
+                        await self.save_session_report(session_data, user_id)
                         print(f"Session {session_data.session_id} saved (User: {user_id})")
-                        
-                        # [Real-time Analytics Trigger]
-                        # 세션 종료 즉시 분석을 수행합니다.
-                        try:
-                            from app.analytics.processor import AnalyticsProcessor
-                            from app.db.database import AsyncSessionLocal
-                            async with AsyncSessionLocal() as db:
-                                processor = AnalyticsProcessor(db)
-                                await processor.process_session_analytics(session_data.session_id)
-                                print(f"Real-time analytics completed for {session_data.session_id}")
-                                
-                                # [New] Feedback Generation (After DB Save)
-                                # DB에 저장된 메시지 ID를 기반으로 피드백을 생성하고 업데이트합니다.
-                                # 이번 세션에서 추가된 메시지 수만큼만 피드백 대상에 포함시킵니다.
-                                new_message_count = len(session_data.messages)
-                                await self.generate_and_save_feedback(db, session_data.session_id, new_message_count)
-                                
-                        except Exception as e:
-                            print(f"Real-time analytics/feedback failed: {e}")
 
                     except Exception as e:
                         print(f"Failed to auto-save session log: {e}")
             finally:
-                # [Manager] 세션 해제 (항상 보장)
+                # [Manager] 세션 해제 + 공유 컨텍스트 삭제 (항상 보장)
                 if session_id:
-                    self.session_manager.remove_session(session_id)
+                    await self.session_manager.discard_session(session_id)
+                    hint_engine.discard_session(session_id)
 
         else:
             await websocket.close(code=1011, reason="Module error")
 
-    async def generate_and_save_feedback(self, db: AsyncSession, session_id: str, new_message_count: int):
+    def _publish_context(self, handler: ConnectionHandler):
+        """
+        [Session Registry] 핸들러의 최신 대화 컨텍스트를 공유 저장소에 게시
+        AI 응답이 끝난 직후라면 힌트를 미리 생성하고, 생성되면 힌트를 포함해 다시 게시합니다.
+        """
+        session_id = handler.tracker.session_id
+        context = build_session_context(handler)
+        messages = context["messages"][-HINT_CONTEXT_MESSAGES:]
+        key = HintEngine.make_key(session_id, messages, context["context"])
+
+        cached = hint_engine.peek(key)
+        if cached is not None:
+            # 다른 워커로 간 힌트 요청도 캐시된 결과를 쓰도록 대화 해시와 함께 게시
+            context["hints"] = {"key": key[1], "hints": cached}
+        elif messages and messages[-1]["role"] == "assistant":
+            task = hint_engine.prefetch(session_id, messages, context["context"])
+            if task is not None:
+                task.add_done_callback(lambda t: self._on_hints_prefetched(handler, t))
+        self.session_manager.publish_context(session_id, context)
+
+    def _on_hints_prefetched(self, handler: ConnectionHandler, task):
+        if task.cancelled() or not task.result():
+            return
+        if self.session_manager.get_session(handler.tracker.session_id) is handler:
+            self._publish_context(handler)
+
+    async def generate_and_save_feedback(
+        self,
+        db: AsyncSession,
+        session_id: str,
+        message_ids: Optional[List[int]],
+        new_message_count: int = 0,
+    ):
         """
         [Feedback Generation]
         DB에 저장된 세션의 메시지를 조회하여 피드백을 생성하고,
         각 메시지(chat_messages)에 피드백(feedback, reason)을 업데이트합니다.
+
+        message_ids: 이번 연결에서 저장된 메시지 ID (None이면 마지막 new_message_count개 - 이전 작업 호환)
         """
         # [Update] 통합된 generate_feedback 함수 사용
-        from conversation_feedback.feedback_service import generate_feedback
+        from conversation_feedback.feedback_service import generate_feedback_async
         
         print(f"Starting feedback generation for session {session_id} (New messages: {new_message_count})")
         
         # Temporary Repository instance with the current transaction session
         repo = ChatRepository(db)
-        
-        # 1. Repository를 통해 "모든" 메시지 조회 (Count 체크용)
-        db_messages = await repo.get_messages_by_session(session_id)
-        
-        if not db_messages:
-            print("No messages found for feedback.")
-            return
+        if message_ids is not None:
+            new_message_count = len(message_ids)
 
         # [Rule] 이번 세션의 대화가 10개 이하면 피드백을 진행하지 않음
         if new_message_count <= 10:
              print(f"Skipping feedback: New messages ({new_message_count}) <= 10")
              return
 
-        # 2. 메시지 필터링: 이번 세션에서 진행된 메시지(New)만 추출
-        # db_messages는 timestamp 순으로 정렬되어 있으므로, 마지막 new_message_count 개수만큼 가져옴
-        if new_message_count > 0:
-            target_db_messages = db_messages[-new_message_count:]
+        # 1. 이번 세션에서 진행된 메시지(New)만 조회
+        # 저장 시점의 메시지 ID로 조회하므로 작업 재시도 전에 세션이 이어져도 대상이 바뀌지 않음
+        if message_ids is not None:
+            target_db_messages = await repo.get_messages_by_ids(session_id, message_ids)
         else:
-            print("No new messages to process.")
+            target_db_messages = await repo.get_latest_messages(session_id, new_message_count)
+
+        if not target_db_messages:
+            print("No messages found for feedback.")
             return
 
-        # 3. 메시지 변환 (DB Object -> Dict List with ID)
+        # 2. 메시지 변환 (DB Object -> Dict List with ID)
         messages_for_feedback = []
         for msg in target_db_messages:
             messages_for_feedback.append({
@@ -309,61 +397,167 @@ class ChatService:
                 "timestamp": msg.timestamp
             })
 
-        # 4. Feedback Service 호출 (Sync function -> run in thread)
+        # 3. Feedback Service 호출 (AsyncOpenAI - 요약과 피드백을 구조화 출력 1회 호출로 생성)
         # 이번 세션의 메시지만 전달하여 피드백과 요약 생성
-        # OpenAI Sync Client를 사용하므로 메인 루프 차단을 방지하기 위해 스레드에서 실행
-        feedback_result = await asyncio.to_thread(generate_feedback, messages_for_feedback, session_id=session_id)
+        feedback_result = await generate_feedback_async(messages_for_feedback, session_id=session_id)
         
         if not feedback_result:
             print("No feedback generated.")
             return
             
-        # 5. Global Feedback & Summary 저장 (Session Level)
-        session = await repo.get_session_by_id(session_id)
-        if session:
-            # 서머리 업데이트 (이번 세션 내용을 반영)
-            if feedback_result.get("scenario_summary"):
-                session.scenario_summary = feedback_result.get("scenario_summary")
+        # 4. Global Feedback & Summary 저장 (Session Level, 관계 로드 없이 UPDATE)
+        if feedback_result.get("scenario_summary"):
+            await repo.update_session_summary(session_id, feedback_result.get("scenario_summary"))
             
-        # 6. Detailed Feedback 저장 (Message Level)
+        # 5. Detailed Feedback 저장 (Message Level, 일괄 UPDATE)
         feedback_details_list = feedback_result.get("feedback_details", [])
         
         if feedback_details_list:
-            update_count = 0
+            feedback_items = []
             for item in feedback_details_list:
-                msg_id = item.get("message_id")
-                feedback_data = {
+                try:
+                    msg_id = int(item.get("message_id"))
+                except (TypeError, ValueError):
+                    continue
+                feedback_items.append({
+                    "message_id": msg_id,
                     "reason": item.get("fb_content"),
                     "feedback": item.get("fb_after")
-                }
-                
-                await repo.update_message_feedback(msg_id, feedback_data)
-                update_count += 1
+                })
+            update_count = await repo.bulk_update_message_feedback(session_id, feedback_items)
             print(f"Feedback updated for {update_count} messages")
             
         await db.commit()
         print(f"Feedback generation completed for session {session_id}")
 
+    async def refresh_history_summary(self, db: AsyncSession, session_id: str):
+        """
+        [History Compaction]
+        최근 REALTIME_HISTORY_KEEP_MESSAGES개를 제외한 앞부분 대화 요약을 갱신해 세션 행에 캐시합니다.
+        다음 접속/재연결 시 앞부분은 이 요약 1개로 주입됩니다. (이전 요약 이후 구간만 LLM에 전달)
+        """
+        repo = ChatRepository(db)
+        cached = await repo.get_history_summary(session_id)
+        if cached is None:
+            return
+
+        previous = None
+        history_summary, history_summary_count = cached
+        if history_summary and history_summary_count:
+            previous = HistorySummary(history_summary, history_summary_count)
+
+        # 이전 요약이 덮는 구간은 불러오지 않음 (세션 전체 히스토리 크기와 무관)
+        offset = previous.message_count if previous else 0
+        messages = await repo.get_dialogue_messages(session_id, offset=offset)
+        if not messages:
+            return
+
+        client = get_async_openai_client(settings.OPENAI_API_KEY)
+        async with get_client_registry().async_limit("feedback"):
+            summary = await summarize_history(
+                client, settings.OPENAI_MODEL, messages, previous,
+                keep_last=settings.REALTIME_HISTORY_KEEP_MESSAGES,
+                offset=offset,
+            )
+        if summary is None:
+            return
+
+        await repo.update_history_summary(session_id, summary.text, summary.message_count)
+        await db.commit()
+        logger.info(f"History summary updated for session {session_id} ({summary.message_count} messages)")
+
     async def generate_hint(self, session_id: str) -> List[str]:
         """
         [Hint Generation]
         활성 세션의 컨텍스트를 기반으로 LLM을 통해 힌트를 생성합니다.
         """
-        # 1. 활성 세션 핸들러 조회
-        handler = self.session_manager.get_session(session_id)
+        # 1. 세션 컨텍스트 조회 (이 워커의 핸들러 -> 없으면 공유 저장소)
+        session_context = await self.session_manager.get_context(session_id)
 
-        if not handler:
-            print(f"Hint generation failed: Session {session_id} not found in memory.")
+        if not session_context:
+            print(f"Hint generation failed: Session {session_id} not found in registry.")
             return []
 
         # 2. 대화 내용 조회 (최근 5개)
-        messages = handler.get_transcript_context(limit=5)
+        messages = session_context.get("messages", [])[-HINT_CONTEXT_MESSAGES:]
         print(f"[Hint] Context Retrieved: {len(messages)} messages")
 
         # 3. 시나리오 컨텍스트 조회
-        scenario_context = handler.context if hasattr(handler, "context") else None
-
-        # 4. ai-engine LLM 호출
-        hints = generate_hints(messages, scenario_context)
+        scenario_context = session_context.get("context")
+
+        # 4. 다른 워커에서 미리 생성해 게시한 힌트가 현재 대화와 같으면 그대로 사용
+        shared = session_context.get("hints")
+        if shared and shared.get("key") == transcript_tail_hash(messages, scenario_context):
+            return shared["hints"]
+
+        # 5. ai-engine LLM 호출 (캐시 / 진행 중인 동일 요청 병합)
+        return await hint_engine.get_hints(session_id, messages, scenario_context)
+
+
+async def enqueue_session_post_process(
+    session_data: SessionCreate,
+    message_ids: List[int],
+    db: Optional[AsyncSession] = None,
+):
+    """
+    세션 종료 후 분석/피드백 작업을 등록합니다.
+    같은 리포트(session_id + ended_at)는 한 번만 등록됩니다.
+    db를 넘기면 그 트랜잭션에 등록만 합니다. (Commit은 호출자가 관리)
+    """
+    return await enqueue_job(
+        SESSION_POST_PROCESS_JOB,
+        idempotency_key=f"{SESSION_POST_PROCESS_JOB}:{session_data.session_id}:{session_data.ended_at}",
+        payload={
+            "session_id": session_data.session_id,
+            # 이번 세션에서 추가된 메시지만 피드백 대상에 포함시킵니다.
+            "message_ids": message_ids,
+        },
+        session_id=session_data.session_id,
+        db=db,
+    )
+
+
+@register_job_handler(SESSION_POST_PROCESS_JOB)
+async def process_session_post_process(payload: dict) -> None:
+    """
+    [Job Handler] 세션 통계 집계 + 피드백 생성
+    """
+    from app.analytics.processor import AnalyticsProcessor
+    from app.db.database import AsyncSessionLocal
+
+    session_id = payload["session_id"]
+    async with AsyncSessionLocal() as db:
+        processor = AnalyticsProcessor(db)
+        await processor.process_session_analytics(session_id)
+        print(f"Analytics completed for {session_id}")
+
+        # DB에 저장된 메시지 ID를 기반으로 피드백을 생성하고 업데이트합니다.
+        service = ChatService(ChatRepository(db))
+        await service.generate_and_save_feedback(
+            db, session_id, payload.get("message_ids"), payload.get("new_message_count", 0)
+        )
 
-        return hints
+        # 재연결용 히스토리 요약 갱신 (최적화 용도이므로 실패해도 작업은 성공 처리)
+        try:
+            await service.refresh_history_summary(db, session_id)
+        except Exception as e:
+            await db.rollback()
+            logger.warning(f"Failed to refresh history summary for {session_id}: {e}")
+
+
+def encode_session_cursor(ended_at: str, session_id: str) -> str:
+    """세션 목록 커서 생성: (ended_at, session_id)를 URL-safe base64로 인코딩"""
+    raw = json.dumps([ended_at, session_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_session_cursor(cursor: str) -> tuple[str, str]:
+    """세션 목록 커서 해석. 형식이 잘못된 경우 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ended_at, session_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(ended_at, str) or not isinstance(session_id, str):
+        raise ValueError("Invalid cursor")
+    return ended_at, session_id
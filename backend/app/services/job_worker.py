@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models import BackgroundJob
+from app.repositories.job_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict], Awaitable[None]]
+
+_handlers: Dict[str, JobHandler] = {}
+
+
+def register_job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    작업 타입별 처리 함수를 등록합니다.
+
+    handler는 payload(dict)를 받아 실행되며, 예외를 던지면 백오프 후 재시도됩니다.
+    같은 작업이 재시도될 수 있으므로 handler는 멱등하게 작성해야 합니다.
+    """
+    def decorator(handler: JobHandler) -> JobHandler:
+        _handlers[job_type] = handler
+        return handler
+    return decorator
+
+
+async def enqueue_job(
+    job_type: str,
+    idempotency_key: str,
+    payload: dict,
+    session_id: Optional[str] = None,
+    db: Optional[AsyncSession] = None,
+) -> BackgroundJob:
+    """
+    작업을 DB 큐에 등록합니다. (워커가 비동기로 처리)
+
+    db를 넘기면 그 트랜잭션에 등록만 하고 Commit은 호출자가 관리합니다.
+    """
+    if db is not None:
+        return await JobRepository(db).enqueue(
+            job_type,
+            idempotency_key,
+            payload,
+            session_id=session_id,
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+            commit=False,
+        )
+    async with AsyncSessionLocal() as db:
+        repo = JobRepository(db)
+        return await repo.enqueue(
+            job_type,
+            idempotency_key,
+            payload,
+            session_id=session_id,
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+        )
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """지수 백오프: base * 2^(attempts-1), 최대 JOB_RETRY_MAX_SECONDS"""
+    delay = settings.JOB_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return min(delay, settings.JOB_RETRY_MAX_SECONDS)
+
+
+async def run_next_job() -> bool:
+    """
+    실행 가능한 작업 1개를 처리합니다. 처리한 작업이 없으면 False
+    """
+    async with AsyncSessionLocal() as db:
+        repo = JobRepository(db)
+        job = await repo.claim_next()
+        if job is None:
+            return False
+
+        handler = _handlers.get(job.job_type)
+        try:
+            if handler is None:
+                raise RuntimeError(f"No handler registered for job type '{job.job_type}'")
+            payload = json.loads(job.payload) if job.payload else {}
+            await handler(payload)
+        except Exception as e:
+            delay = retry_delay_seconds(job.attempts)
+            logger.warning(
+                f"Job {job.id} ({job.job_type}) failed on attempt {job.attempts}/{job.max_attempts}: {e}"
+            )
+            await repo.mark_failed(job, str(e), delay)
+        else:
+            await repo.mark_succeeded(job.id)
+            logger.info(f"Job {job.id} ({job.job_type}) succeeded")
+        return True
+
+
+async def _worker(worker_id: int, stop_event: asyncio.Event) -> None:
+    interval = settings.JOB_POLL_INTERVAL_SECONDS
+    while not stop_event.is_set():
+        try:
+            processed = await run_next_job()
+        except Exception as e:
+            logger.error(f"Job worker {worker_id} error: {e}")
+            processed = False
+        if processed:
+            continue
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            continue
+
+
+async def requeue_stale_jobs() -> int:
+    """
+    running 상태로 JOB_LOCK_TIMEOUT_SECONDS 이상 남은 작업(크래시/재배포로 중단된 작업)을 다시 queued로 돌립니다.
+    """
+    async with AsyncSessionLocal() as db:
+        requeued = await JobRepository(db).requeue_stale(settings.JOB_LOCK_TIMEOUT_SECONDS)
+    if requeued:
+        logger.info(f"Requeued {requeued} stale background jobs.")
+    return requeued
+
+
+async def _reaper(stop_event: asyncio.Event) -> None:
+    """
+    중단된 작업을 주기적으로 재등록합니다.
+    (재시작 직후에는 lock timeout이 지나지 않아 시작 시 한 번만 확인하면 놓치는 작업이 생김)
+    """
+    interval = settings.JOB_REAP_INTERVAL_SECONDS
+    while not stop_event.is_set():
+        try:
+            await requeue_stale_jobs()
+        except Exception as e:
+            logger.error(f"Job reaper error: {e}")
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            continue
+
+
+async def run_job_workers(stop_event: asyncio.Event) -> None:
+    """
+    설정된 동시성(JOB_WORKER_CONCURRENCY)만큼 워커를 띄워 DB 큐의 작업을 처리합니다.
+    이전 프로세스에서 running으로 남은 작업은 reaper가 주기적으로 다시 queued로 돌립니다.
+    """
+    if not settings.JOB_WORKER_ENABLED:
+        logger.info("Background job workers are DISABLED.")
+        return
+
+    concurrency = max(settings.JOB_WORKER_CONCURRENCY, 1)
+    logger.info(f"Starting {concurrency} background job workers")
+    workers = [asyncio.create_task(_reaper(stop_event))]
+    workers += [asyncio.create_task(_worker(i, stop_event)) for i in range(concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models import LiveSessionContext
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class DBSessionContextStore:
+    """
+    [Session Registry - 공유 저장소]
+    live_session_contexts 테이블에 세션 컨텍스트를 저장합니다. (SessionContextStore 구현)
+    같은 DB를 보는 모든 워커 프로세스가 힌트 생성 시 조회할 수 있습니다.
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        ttl_sec: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self.ttl_sec = settings.SESSION_CONTEXT_TTL_SECONDS if ttl_sec is None else ttl_sec
+
+    async def put(self, session_id: str, context: dict) -> None:
+        async with self.session_factory() as db:
+            if db.get_bind().dialect.name == "postgresql":
+                stmt = postgresql.insert(LiveSessionContext)
+            else:
+                stmt = sqlite.insert(LiveSessionContext)
+            stmt = stmt.values(
+                session_id=session_id,
+                context=json.dumps(context, ensure_ascii=False),
+                updated_at=_utcnow(),
+            ).on_conflict_do_update(
+                index_elements=[LiveSessionContext.session_id],
+                set_={"context": stmt.excluded.context, "updated_at": stmt.excluded.updated_at},
+            )
+            await db.execute(stmt)
+            await db.commit()
+
+    async def get(self, session_id: str) -> Optional[dict]:
+        """TTL 안에 갱신된 컨텍스트만 반환 (크래시로 남은 행은 무시)"""
+        async with self.session_factory() as db:
+            stmt = select(LiveSessionContext.context).where(
+                LiveSessionContext.session_id == session_id,
+                LiveSessionContext.updated_at >= _utcnow() - timedelta(seconds=self.ttl_sec),
+            )
+            result = await db.execute(stmt)
+            raw = result.scalar()
+        return json.loads(raw) if raw else None
+
+    async def delete(self, session_id: str) -> None:
+        async with self.session_factory() as db:
+            await db.execute(delete(LiveSessionContext).where(LiveSessionContext.session_id == session_id))
+            await db.commit()
+
+    async def delete_expired(self) -> int:
+        """TTL이 지난 컨텍스트 삭제 (세션 정리 루프에서 호출)"""
+        async with self.session_factory() as db:
+            stmt = delete(LiveSessionContext).where(
+                LiveSessionContext.updated_at < _utcnow() - timedelta(seconds=self.ttl_sec)
+            )
+            result = await db.execute(stmt)
+            await db.commit()
+            return result.rowcount or 0
+
+
+def configure_session_registry() -> None:
+    """
+    SESSION_REGISTRY_BACKEND 설정에 따라 SessionManager의 컨텍스트 저장소를 선택합니다. (앱 시작 시 호출)
+    """
+    from realtime_conversation.session_manager import InMemorySessionContextStore, SessionManager
+
+    backend = settings.SESSION_REGISTRY_BACKEND.lower()
+    if backend == "db":
+        store = DBSessionContextStore()
+    elif backend == "memory":
+        store = InMemorySessionContextStore()
+    else:
+        raise ValueError(f"Unknown SESSION_REGISTRY_BACKEND: {settings.SESSION_REGISTRY_BACKEND}")
+    SessionManager().set_context_store(store)
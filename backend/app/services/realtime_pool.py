@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def configure_upstream_pools() -> int:
+    """
+    [Upstream Pool]
+    채팅/시나리오 WebSocket용 OpenAI Realtime 연결 풀을 등록하고 백그라운드 충전을 시작합니다. (앱 시작 시 호출)
+    수업 시작처럼 동시 접속이 몰릴 때 연결 핸드셰이크 대신 준비된 소켓을 바로 사용합니다.
+
+    Returns:
+        등록된 풀 수 (REALTIME_POOL_SIZE가 0이거나 API 키가 없으면 0)
+    """
+    if settings.REALTIME_POOL_SIZE <= 0 or not settings.OPENAI_API_KEY:
+        logger.info("Realtime upstream pool is DISABLED.")
+        return 0
+
+    from realtime_conversation.connection_handler import OPENAI_REALTIME_API_URL
+    from scenario.config import AppConfig
+    from scenario.realtime_session import RealtimeConfig, RealtimeSessionManager
+    from scenario.upstream_pool import UpstreamPool, register_upstream_pool
+
+    config = AppConfig.from_env()
+    scenario_url = RealtimeSessionManager(
+        RealtimeConfig(api_key=config.api_key, model=config.realtime_model)
+    ).wss_url
+
+    pools = [
+        UpstreamPool(
+            url,
+            api_key,
+            size=settings.REALTIME_POOL_SIZE,
+            max_idle_sec=settings.REALTIME_POOL_MAX_IDLE_SECONDS,
+        )
+        # 채팅과 시나리오가 같은 모델/키를 쓰면 풀 하나를 공유
+        for url, api_key in dict.fromkeys([
+            (OPENAI_REALTIME_API_URL, settings.OPENAI_API_KEY),
+            (scenario_url, config.api_key),
+        ])
+    ]
+    for pool in pools:
+        register_upstream_pool(pool)
+    logger.info(
+        f"Realtime upstream pool started (size={settings.REALTIME_POOL_SIZE}, "
+        f"max_idle={settings.REALTIME_POOL_MAX_IDLE_SECONDS}s, pools={len(pools)})"
+    )
+    return len(pools)
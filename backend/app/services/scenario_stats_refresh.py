@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.analytics.processor import AnalyticsProcessor
+from app.db.database import AsyncSessionLocal
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_scenario_top_keywords() -> int:
+    """
+    시나리오별 Top 키워드 스냅샷(ScenarioStatistics.top_keywords)을 재계산합니다.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            count = await AnalyticsProcessor(session).refresh_top_keywords()
+            if count > 0:
+                logger.info(f"Refreshed top keywords for {count} scenarios.")
+            return count
+        except Exception as e:
+            logger.error(f"Error during top keywords refresh: {e}")
+            await session.rollback()
+            return 0
+
+
+async def run_scenario_keywords_refresh_loop(stop_event: asyncio.Event) -> None:
+    """
+    설정에 따라 백그라운드에서 주기적으로 Top 키워드 스냅샷을 갱신합니다.
+    """
+    if not settings.SCENARIO_KEYWORDS_REFRESH_ENABLED:
+        logger.info("Scenario keywords refresh loop is DISABLED.")
+        return
+
+    interval = settings.SCENARIO_KEYWORDS_REFRESH_INTERVAL_SECONDS
+    logger.info(f"Starting scenario keywords refresh loop (Interval: {interval}s)")
+
+    while not stop_event.is_set():
+        await refresh_scenario_top_keywords()
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            continue
+        except asyncio.CancelledError:
+            break
@@ -9,6 +9,7 @@ from sqlalchemy import update, and_
 from app.db.database import AsyncSessionLocal
 from app.db.models import ConversationSession
 from app.core.config import settings
+from app.services.live_session_store import DBSessionContextStore
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,22 @@ async def soft_delete_expired_sessions() -> int:
             return 0
 
 
+async def delete_expired_session_contexts() -> int:
+    """
+    크래시/재배포로 삭제되지 못한 실시간 세션 컨텍스트(live_session_contexts)를 정리합니다.
+    """
+    if settings.SESSION_REGISTRY_BACKEND.lower() != "db":
+        return 0
+    try:
+        count = await DBSessionContextStore().delete_expired()
+        if count > 0:
+            logger.info(f"Cleaned up {count} stale live session contexts.")
+        return count
+    except Exception as e:
+        logger.error(f"Error during live session context cleanup: {e}")
+        return 0
+
+
 async def run_cleanup_loop(stop_event: asyncio.Event) -> None:
     """
     설정에 따라 백그라운드에서 주기적으로 세션 정리 작업을 수행합니다.
@@ -59,6 +76,7 @@ async def run_cleanup_loop(stop_event: asyncio.Event) -> None:
     
     while not stop_event.is_set():
         await soft_delete_expired_sessions()
+        await delete_expired_session_contexts()
         try:
             await asyncio.wait_for(stop_event.wait(), timeout=interval)
         except asyncio.TimeoutError:
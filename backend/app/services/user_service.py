@@ -12,11 +12,11 @@ class UserService:
         return await self.user_repo.get_by_id(user_id)
 
     async def get_user_by_login_id(self, login_id: str) -> Optional[User]:
-        return await self.user_repo.get_by_login_id(login_id)
+        return await self.user_repo.get_by_login_id_cached(login_id)
 
     async def update_user_profile(self, user: User, user_in: UserUpdate) -> User:
         if user_in.password and user_in.password.strip():
-            user.hashed_password = security.get_password_hash(user_in.password)
+            user.hashed_password = await security.get_password_hash_async(user_in.password)
         if user_in.nickname and user_in.nickname.strip():
             user.nickname = user_in.nickname
         
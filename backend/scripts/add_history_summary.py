@@ -0,0 +1,90 @@
+"""
+MaLangEE DB Migration Script - Session History Summary
+
+'conversation_sessions' 테이블에 실시간 세션 재연결용 히스토리 요약 캐시 컬럼
+('history_summary', 'history_summary_count')을 추가합니다.
+기존 세션은 비워 두며, 다음 세션 종료 후 작업(session_post_process)에서 채워집니다.
+운영 환경(PostgreSQL) 또는 로컬 환경(SQLite) 모두 지원합니다.
+
+사용 예시:
+python scripts/add_history_summary.py --production --db-name malangee --db-user malangee_user --db-password "password"
+"""
+import sys
+import os
+import argparse
+import asyncio
+from sqlalchemy import text
+from dotenv import load_dotenv
+
+# Path setup to import app.core.config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load environment variables
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+load_dotenv(os.path.join(backend_dir, ".env"))
+load_dotenv(os.path.join(backend_dir, ".env.local"))
+
+from app.core.config import settings
+from app.db.database import engine
+
+ADD_COLUMNS_SQL = {
+    "history_summary": "ALTER TABLE conversation_sessions ADD COLUMN history_summary TEXT;",
+    "history_summary_count": "ALTER TABLE conversation_sessions ADD COLUMN history_summary_count INTEGER;",
+}
+
+
+async def migrate():
+    """
+    history_summary, history_summary_count 컬럼 추가
+    """
+    print(f"Connecting to DB... (SQLite: {settings.USE_SQLITE})")
+
+    for column, sql in ADD_COLUMNS_SQL.items():
+        async with engine.begin() as conn:
+            print(f"Checking/Adding '{column}' column...")
+            try:
+                await conn.execute(text(sql))
+                print(f"-> '{column}' column added.")
+            except Exception as e:
+                if "duplicate column" in str(e) or "already exists" in str(e):
+                    print(f"-> '{column}' column already exists.")
+                else:
+                    raise
+
+    print("\nMigration completed.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add history summary cache columns to MaLangEE DB")
+    parser.add_argument("--production", action="store_true", help="Force use of production database (PostgreSQL)")
+    parser.add_argument("--db-name", type=str, help="Database name")
+    parser.add_argument("--db-user", type=str, help="Database user")
+    parser.add_argument("--db-password", type=str, help="Database password")
+    parser.add_argument("--db-host", type=str, help="Database host", default="localhost")
+    parser.add_argument("--db-port", type=str, help="Database port", default="5432")
+
+    args = parser.parse_args()
+
+    if args.production:
+        print("Switching to PRODUCTION mode (PostgreSQL)")
+        settings.USE_SQLITE = False
+
+        if args.db_name:
+            settings.POSTGRES_DB = args.db_name
+        if args.db_user:
+            settings.POSTGRES_USER = args.db_user
+        if args.db_password:
+            settings.POSTGRES_PASSWORD = args.db_password
+        if args.db_host:
+            settings.POSTGRES_SERVER = args.db_host
+        if args.db_port:
+            settings.POSTGRES_PORT = args.db_port
+
+        # Re-initialize engine with new settings
+        from app.db import database
+        database.engine = database.create_async_engine(
+            settings.DATABASE_URL,
+            echo=True,
+        )
+        engine = database.engine
+
+    asyncio.run(migrate())
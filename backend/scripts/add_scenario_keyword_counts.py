@@ -0,0 +1,100 @@
+"""
+MaLangEE DB Migration Script - Scenario Keyword Counts
+
+시나리오별 단어 카운트 테이블 'scenario_keyword_counts'를 생성하고
+기존 scenario_statistics.top_keywords(Top 20 스냅샷)의 카운트로 초기값을 채웁니다.
+(이전에는 Top 20 밖의 카운트를 버렸기 때문에 그 이상은 복원할 수 없습니다)
+운영 환경(PostgreSQL) 또는 로컬 환경(SQLite) 모두 지원합니다.
+
+사용 예시:
+python scripts/add_scenario_keyword_counts.py --production --db-name malangee --db-user malangee_user --db-password "password"
+"""
+import sys
+import os
+import argparse
+import asyncio
+import json
+from sqlalchemy import select, text
+from dotenv import load_dotenv
+
+# Path setup to import app.core.config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load environment variables
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+load_dotenv(os.path.join(backend_dir, ".env"))
+load_dotenv(os.path.join(backend_dir, ".env.local"))
+
+from app.core.config import settings
+from app.db.database import engine
+from app.analytics.models import ScenarioKeywordCount, ScenarioStatistics
+
+BACKFILL_SQL = text(
+    "INSERT INTO scenario_keyword_counts (scenario_id, word, count) "
+    "VALUES (:scenario_id, :word, :count) "
+    "ON CONFLICT (scenario_id, word) DO NOTHING"
+)
+
+
+async def migrate():
+    """
+    scenario_keyword_counts 테이블 생성 -> top_keywords 스냅샷으로 백필
+    """
+    print(f"Connecting to DB... (SQLite: {settings.USE_SQLITE})")
+
+    async with engine.begin() as conn:
+        print("Creating 'scenario_keyword_counts' table...")
+        await conn.run_sync(
+            lambda sync_conn: ScenarioKeywordCount.__table__.create(sync_conn, checkfirst=True)
+        )
+
+    async with engine.begin() as conn:
+        print("Backfilling keyword counts from scenario_statistics.top_keywords...")
+        result = await conn.execute(select(ScenarioStatistics.scenario_id, ScenarioStatistics.top_keywords))
+        rows = []
+        for scenario_id, top_keywords in result.all():
+            if isinstance(top_keywords, str):
+                top_keywords = json.loads(top_keywords)
+            for word, count in (top_keywords or {}).items():
+                rows.append({"scenario_id": scenario_id, "word": word, "count": int(count)})
+        if rows:
+            await conn.execute(BACKFILL_SQL, rows)
+        print(f"-> {len(rows)} keyword rows")
+
+    print("\nMigration completed.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add scenario_keyword_counts table to MaLangEE DB")
+    parser.add_argument("--production", action="store_true", help="Force use of production database (PostgreSQL)")
+    parser.add_argument("--db-name", type=str, help="Database name")
+    parser.add_argument("--db-user", type=str, help="Database user")
+    parser.add_argument("--db-password", type=str, help="Database password")
+    parser.add_argument("--db-host", type=str, help="Database host", default="localhost")
+    parser.add_argument("--db-port", type=str, help="Database port", default="5432")
+
+    args = parser.parse_args()
+
+    if args.production:
+        print("Switching to PRODUCTION mode (PostgreSQL)")
+        settings.USE_SQLITE = False
+
+        if args.db_name:
+            settings.POSTGRES_DB = args.db_name
+        if args.db_user:
+            settings.POSTGRES_USER = args.db_user
+        if args.db_password:
+            settings.POSTGRES_PASSWORD = args.db_password
+        if args.db_host:
+            settings.POSTGRES_SERVER = args.db_host
+        if args.db_port:
+            settings.POSTGRES_PORT = args.db_port
+
+        # Re-initialize engine with new settings
+        from app.db import database
+        database.engine = database.create_async_engine(
+            settings.DATABASE_URL,
+            echo=True,
+        )
+        engine = database.engine
+
+    asyncio.run(migrate())
@@ -0,0 +1,104 @@
+"""
+MaLangEE DB Migration Script - Session Message Count
+
+'conversation_sessions' 테이블에 비정규화된 'message_count' 컬럼과
+세션 목록 Keyset 페이지네이션용 복합 인덱스 (user_id, ended_at, session_id)를 추가합니다.
+기존 세션의 message_count는 chat_messages 기준으로 채웁니다.
+운영 환경(PostgreSQL) 또는 로컬 환경(SQLite) 모두 지원합니다.
+
+사용 예시:
+python scripts/add_session_message_count.py --production --db-name malangee --db-user malangee_user --db-password "password"
+"""
+import sys
+import os
+import argparse
+import asyncio
+from sqlalchemy import text
+from dotenv import load_dotenv
+
+# Path setup to import app.core.config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load environment variables
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+load_dotenv(os.path.join(backend_dir, ".env"))
+load_dotenv(os.path.join(backend_dir, ".env.local"))
+
+from app.core.config import settings
+from app.db.database import engine
+
+ADD_COLUMN_SQL = "ALTER TABLE conversation_sessions ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0;"
+BACKFILL_SQL = """
+UPDATE conversation_sessions
+SET message_count = (
+    SELECT COUNT(*) FROM chat_messages
+    WHERE chat_messages.session_id = conversation_sessions.session_id
+);
+"""
+CREATE_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS ix_conversation_sessions_user_ended "
+    "ON conversation_sessions (user_id, ended_at, session_id);"
+)
+
+
+async def migrate():
+    """
+    message_count 컬럼 추가 -> 기존 데이터 백필 -> 복합 인덱스 생성
+    """
+    print(f"Connecting to DB... (SQLite: {settings.USE_SQLITE})")
+
+    async with engine.begin() as conn:
+        print("Checking/Adding 'message_count' column...")
+        try:
+            await conn.execute(text(ADD_COLUMN_SQL))
+            print("-> 'message_count' column added.")
+        except Exception as e:
+            if "duplicate column" in str(e) or "already exists" in str(e):
+                print("-> 'message_count' column already exists.")
+            else:
+                raise
+
+    async with engine.begin() as conn:
+        print("Backfilling 'message_count' from chat_messages...")
+        await conn.execute(text(BACKFILL_SQL))
+
+        print("Creating index 'ix_conversation_sessions_user_ended'...")
+        await conn.execute(text(CREATE_INDEX_SQL))
+
+    print("\nMigration completed.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add message_count column and session list index to MaLangEE DB")
+    parser.add_argument("--production", action="store_true", help="Force use of production database (PostgreSQL)")
+    parser.add_argument("--db-name", type=str, help="Database name")
+    parser.add_argument("--db-user", type=str, help="Database user")
+    parser.add_argument("--db-password", type=str, help="Database password")
+    parser.add_argument("--db-host", type=str, help="Database host", default="localhost")
+    parser.add_argument("--db-port", type=str, help="Database port", default="5432")
+
+    args = parser.parse_args()
+
+    if args.production:
+        print("Switching to PRODUCTION mode (PostgreSQL)")
+        settings.USE_SQLITE = False
+
+        if args.db_name:
+            settings.POSTGRES_DB = args.db_name
+        if args.db_user:
+            settings.POSTGRES_USER = args.db_user
+        if args.db_password:
+            settings.POSTGRES_PASSWORD = args.db_password
+        if args.db_host:
+            settings.POSTGRES_SERVER = args.db_host
+        if args.db_port:
+            settings.POSTGRES_PORT = args.db_port
+
+        # Re-initialize engine with new settings
+        from app.db import database
+        database.engine = database.create_async_engine(
+            settings.DATABASE_URL,
+            echo=True,
+        )
+        engine = database.engine
+
+    asyncio.run(migrate())
@@ -0,0 +1,103 @@
+"""
+MaLangEE Analytics Backfill Script
+
+분석되지 않은 세션(is_analyzed = False)의 통계를 일괄 생성합니다.
+- 실시간 분석이 실패한 세션, generate_mock_data.py로 넣은 세션 등
+- (ended_at, session_id) 순 청크 단위로 커밋하고 체크포인트 파일에 마지막 커서를 기록 (중단 후 재실행 시 이어서 처리)
+- 키워드 분석은 --workers > 1이면 프로세스 풀에서 수행
+운영 환경(PostgreSQL) 또는 로컬 환경(SQLite) 모두 지원합니다.
+
+사용 예시:
+python scripts/backfill_session_analytics.py --since 2024-01-01 --until 2024-02-01
+python scripts/backfill_session_analytics.py --production --db-name malangee --db-user malangee_user --db-password "password"
+"""
+import sys
+import os
+import argparse
+import asyncio
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+# Path setup to import app.core.config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Load environment variables
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+load_dotenv(os.path.join(backend_dir, ".env"))
+load_dotenv(os.path.join(backend_dir, ".env.local"))
+
+from app.core.config import settings
+from app.db import database
+from app.db.models import Base
+import app.analytics.models  # noqa: F401  (SessionAnalytics 매퍼 등록)
+from app.analytics.backfill import backfill_session_analytics
+
+DEFAULT_CHECKPOINT = os.path.join(backend_dir, ".analytics_backfill.checkpoint")
+
+
+async def run(args):
+    print(f"Connecting to DB... (SQLite: {settings.USE_SQLITE})")
+    engine = database.engine
+    async with engine.begin() as conn:
+        # scenario_keyword_counts 등 새 테이블이 없으면 생성
+        await conn.run_sync(Base.metadata.create_all)
+
+    checkpoint = None if args.no_checkpoint else args.checkpoint
+    if args.reset and checkpoint and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    report = await backfill_session_analytics(
+        session_factory,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        checkpoint_path=checkpoint,
+        since=args.since,
+        until=args.until,
+        log=print,
+    )
+    await engine.dispose()
+
+    print(
+        f"\nBackfill completed: {report.sessions} sessions ({report.analyzed} analyzed) "
+        f"in {report.elapsed_sec:.1f}s, {report.sessions_per_sec:.1f} sessions/s"
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill analytics for unanalyzed sessions in MaLangEE DB")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Sessions per chunk (one transaction each)")
+    parser.add_argument("--workers", type=int, default=1, help="Analysis processes (1 = analyze in-process)")
+    parser.add_argument("--since", type=str, help="Only sessions with ended_at >= this ISO date")
+    parser.add_argument("--until", type=str, help="Only sessions with ended_at < this ISO date")
+    parser.add_argument("--checkpoint", type=str, default=DEFAULT_CHECKPOINT, help="Checkpoint file path")
+    parser.add_argument("--no-checkpoint", action="store_true", help="Do not read or write a checkpoint")
+    parser.add_argument("--reset", action="store_true", help="Ignore the existing checkpoint and start over")
+    parser.add_argument("--production", action="store_true", help="Force use of production database (PostgreSQL)")
+    parser.add_argument("--db-name", type=str, help="Database name")
+    parser.add_argument("--db-user", type=str, help="Database user")
+    parser.add_argument("--db-password", type=str, help="Database password")
+    parser.add_argument("--db-host", type=str, help="Database host", default="localhost")
+    parser.add_argument("--db-port", type=str, help="Database port", default="5432")
+
+    args = parser.parse_args()
+
+    if args.production:
+        print("Switching to PRODUCTION mode (PostgreSQL)")
+        settings.USE_SQLITE = False
+
+        if args.db_name:
+            settings.POSTGRES_DB = args.db_name
+        if args.db_user:
+            settings.POSTGRES_USER = args.db_user
+        if args.db_password:
+            settings.POSTGRES_PASSWORD = args.db_password
+        if args.db_host:
+            settings.POSTGRES_SERVER = args.db_host
+        if args.db_port:
+            settings.POSTGRES_PORT = args.db_port
+
+        # Re-initialize engine with new settings
+        database.engine = database.create_async_engine(settings.DATABASE_URL)
+
+    asyncio.run(run(args))
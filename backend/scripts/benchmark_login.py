@@ -0,0 +1,99 @@
+"""
+MaLangEE Login Throughput Benchmark
+
+동시 로그인 N건을 처리하면서 이벤트 루프가 얼마나 막히는지 비교합니다.
+- inline: bcrypt 검증을 코루틴 안에서 동기로 실행 (기존 방식)
+- pool: AuthService.authenticate_user (전용 스레드 풀에서 검증)
+
+loop lag는 10ms 주기 타이머가 실제로 얼마나 늦게 깨어났는지의 최댓값으로,
+로그인 폭주 중 같은 워커의 음성 세션이 멈추는 시간에 해당합니다.
+앱 DB를 건드리지 않도록 임시 SQLite 파일을 사용합니다.
+
+사용 예시:
+python scripts/benchmark_login.py --logins 32
+"""
+import sys
+import os
+import argparse
+import asyncio
+import tempfile
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# Path setup to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import security
+from app.core.config import settings
+from app.db.models import Base
+import app.analytics.models  # noqa: F401  (SessionAnalytics 매퍼 등록)
+from app.repositories.user_repository import UserRepository
+from app.schemas.user import UserCreate
+from app.services.auth_service import AuthService
+
+LOGIN_ID = "bench-user"
+PASSWORD = "bench-password-1234"
+
+
+async def inline_login(session_factory) -> bool:
+    async with session_factory() as db:
+        user = await UserRepository(db).get_by_login_id(LOGIN_ID)
+        return security.verify_password(PASSWORD, user.hashed_password)
+
+
+async def pool_login(session_factory) -> bool:
+    async with session_factory() as db:
+        return await AuthService(UserRepository(db)).authenticate_user(LOGIN_ID, PASSWORD) is not None
+
+
+async def measure(label: str, login, session_factory, count: int) -> None:
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal max_lag
+        interval = 0.01
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            max_lag = max(max_lag, time.perf_counter() - start - interval)
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    results = await asyncio.gather(*[login(session_factory) for _ in range(count)])
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick_task
+    assert all(results)
+    print(f"  {label:<8} {count / elapsed:8.1f} logins/s   max loop lag {max_lag * 1000:8.1f} ms")
+
+
+async def run(count: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as db:
+            await UserRepository(db).create(UserCreate(login_id=LOGIN_ID, password=PASSWORD, nickname="bench"))
+
+        print(
+            f"{count} concurrent logins, bcrypt rounds {settings.BCRYPT_ROUNDS}, "
+            f"{settings.PASSWORD_HASH_WORKERS} hash workers, {os.cpu_count()} CPUs"
+        )
+        await measure("inline", inline_login, session_factory, count)
+        await measure("pool", pool_login, session_factory, count)
+
+        security.shutdown_password_hash_executor()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark login throughput and event loop blocking")
+    parser.add_argument("--logins", type=int, default=32, help="Concurrent logins")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.logins))
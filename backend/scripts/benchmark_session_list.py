@@ -0,0 +1,143 @@
+"""
+MaLangEE Session List Benchmark
+
+사용자 1명당 세션 10,000개 환경에서 세션 목록 조회 비용을 비교합니다.
+- legacy: count() + OUTER JOIN chat_messages + GROUP BY + OFFSET (기존 방식)
+- offset: message_count 컬럼 + 복합 인덱스 + OFFSET
+- keyset: message_count 컬럼 + 복합 인덱스 + (ended_at, session_id) 커서
+
+앱 DB를 건드리지 않도록 임시 SQLite 파일을 사용합니다.
+
+사용 예시:
+python scripts/benchmark_session_list.py --sessions 10000 --messages 10 --page-size 20
+"""
+import sys
+import os
+import argparse
+import asyncio
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# Path setup to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.models import Base, ChatMessage, ConversationSession, User
+import app.analytics.models  # noqa: F401  (SessionAnalytics 매퍼 등록)
+from app.repositories.chat_repository import ChatRepository
+
+
+async def seed(session_factory, session_count: int, messages_per_session: int) -> int:
+    async with session_factory() as db:
+        user = User(login_id=f"bench-{uuid.uuid4().hex[:8]}", hashed_password="x", nickname="bench")
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
+
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        batch = 1000
+        for offset in range(0, session_count, batch):
+            sessions = []
+            messages = []
+            for i in range(offset, min(offset + batch, session_count)):
+                session_id = str(uuid.uuid4())
+                ended_at = (base + timedelta(minutes=i)).isoformat()
+                sessions.append({
+                    "session_id": session_id,
+                    "title": f"Session {i}",
+                    "started_at": ended_at,
+                    "ended_at": ended_at,
+                    "total_duration_sec": 60.0,
+                    "user_speech_duration_sec": 30.0,
+                    "user_id": user.id,
+                    "message_count": messages_per_session,
+                    "deleted": False,
+                })
+                for j in range(messages_per_session):
+                    messages.append({
+                        "session_id": session_id,
+                        "role": "user" if j % 2 == 0 else "assistant",
+                        "content": "benchmark message",
+                        "timestamp": ended_at,
+                        "duration_sec": 1.0,
+                    })
+            await db.execute(insert(ConversationSession), sessions)
+            if messages:
+                await db.execute(insert(ChatMessage), messages)
+            await db.commit()
+        return user.id
+
+
+async def legacy_page(db: AsyncSession, user_id: int, skip: int, limit: int):
+    count_stmt = select(func.count(ConversationSession.session_id)).where(ConversationSession.user_id == user_id)
+    await db.execute(count_stmt)
+    stmt = (
+        select(ConversationSession, func.count(ChatMessage.id))
+        .outerjoin(ChatMessage, ChatMessage.session_id == ConversationSession.session_id)
+        .where(ConversationSession.user_id == user_id)
+        .group_by(ConversationSession.session_id)
+        .order_by(ConversationSession.ended_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return result.all()
+
+
+async def timed(label: str, func_, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await func_()
+    elapsed_ms = (time.perf_counter() - start) * 1000.0 / repeat
+    print(f"  {label:<28} {elapsed_ms:8.2f} ms")
+
+
+async def run(session_count: int, messages_per_session: int, page_size: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        print(f"Seeding {session_count} sessions x {messages_per_session} messages...")
+        user_id = await seed(session_factory, session_count, messages_per_session)
+
+        deep_skip = max(session_count - page_size, 0)
+        async with session_factory() as db:
+            repo = ChatRepository(db)
+
+            # 마지막 페이지 직전 커서 (keyset은 깊이와 무관해야 함)
+            rows, _ = await repo.get_sessions_by_user(user_id, deep_skip - 1, 1) if deep_skip else ([], 0)
+            deep_cursor = (rows[0].ended_at, rows[0].session_id) if rows else None
+
+            print(f"\nPage size {page_size}, averaged over {repeat} runs")
+            print("first page:")
+            await timed("legacy (join + offset)", lambda: legacy_page(db, user_id, 0, page_size), repeat)
+            await timed("message_count + offset", lambda: repo.get_sessions_by_user(user_id, 0, page_size), repeat)
+            print(f"deep page (skip={deep_skip}):")
+            await timed("legacy (join + offset)", lambda: legacy_page(db, user_id, deep_skip, page_size), repeat)
+            await timed("message_count + offset", lambda: repo.get_sessions_by_user(user_id, deep_skip, page_size), repeat)
+            if deep_cursor is not None:
+                await timed(
+                    "message_count + keyset",
+                    lambda: repo.get_sessions_by_user(user_id, limit=page_size, after=deep_cursor),
+                    repeat,
+                )
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark session list pagination")
+    parser.add_argument("--sessions", type=int, default=10000, help="Sessions per user")
+    parser.add_argument("--messages", type=int, default=10, help="Messages per session")
+    parser.add_argument("--page-size", type=int, default=20, help="Page size")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.sessions, args.messages, args.page_size, args.repeat))
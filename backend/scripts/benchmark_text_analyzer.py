@@ -0,0 +1,79 @@
+"""
+MaLangEE TextAnalyzer Benchmark
+
+대량 메시지(백필 규모)에서 키워드 분석 비용을 비교합니다.
+- mvp: 메시지마다 extract_keywords + extend + Counter (기존 방식)
+- batch: analyze_batch (이어 붙인 텍스트에 lower/문자 제거/split 한 번)
+- batch+per_message: 메시지별 키워드 수까지 계산
+- batch(mvp tokenizer): analyze_batch(tokenizer=extract_keywords) (플러그인 토크나이저 경로)
+
+DB를 사용하지 않습니다.
+
+사용 예시:
+python scripts/benchmark_text_analyzer.py --messages 200000
+"""
+import sys
+import os
+import argparse
+import random
+import time
+from collections import Counter
+
+# Path setup to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.analytics.processor import TextAnalyzer
+
+VOCAB = [
+    "coffee", "latte", "please", "ticket", "passport", "boarding", "gate", "window", "seat",
+    "reservation", "check", "room", "breakfast", "menu", "order", "water", "thank", "excuse",
+    "could", "would", "the", "a", "to", "is", "I'd", "like", "how", "much", "it's", "okay!",
+]
+
+
+def make_messages(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(VOCAB) for _ in range(rng.randint(3, 15))).capitalize() + "."
+        for _ in range(count)
+    ]
+
+
+def mvp(messages: list) -> Counter:
+    all_keywords = []
+    for msg in messages:
+        all_keywords.extend(TextAnalyzer.extract_keywords(msg))
+    return Counter(all_keywords)
+
+
+def timed(label: str, func_, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func_()
+    elapsed_ms = (time.perf_counter() - start) * 1000.0 / repeat
+    print(f"  {label:<24} {elapsed_ms:10.2f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TextAnalyzer keyword extraction")
+    parser.add_argument("--messages", type=int, default=200000, help="Number of messages")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+    print(f"{args.messages} messages, averaged over {args.repeat} runs")
+
+    expected = timed("mvp", lambda: mvp(messages), args.repeat)
+    batch = timed("batch", lambda: TextAnalyzer.analyze_batch(messages), args.repeat)
+    assert batch.counts == expected, "batch result differs from MVP analyzer"
+    per_message = timed(
+        "batch+per_message", lambda: TextAnalyzer.analyze_batch(messages, per_message=True), args.repeat
+    )
+    assert per_message.token_counts == [len(TextAnalyzer.extract_keywords(m)) for m in messages]
+    plugged = timed(
+        "batch(mvp tokenizer)",
+        lambda: TextAnalyzer.analyze_batch(messages, tokenizer=TextAnalyzer.extract_keywords),
+        args.repeat,
+    )
+    assert plugged.counts == expected
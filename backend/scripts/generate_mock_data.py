@@ -102,6 +102,7 @@ async def create_mock_data(user_identifier: str = None, session_count: int = 10,
                 ended_at=end_time.isoformat(),
                 total_duration_sec=float(duration_minutes * 60),
                 user_speech_duration_sec=float(duration_minutes * 60 * 0.4), # Assume 40% user speech
+                message_count=messages_per_session,
                 scenario_place=fake.city(),
                 scenario_partner=fake.name(),
                 scenario_goal=fake.sentence(),
@@ -0,0 +1,75 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import delete
+
+from app.core import security
+from app.core.auth_cache import TokenCache, UserCache, token_cache, user_cache
+from app.db.database import engine, AsyncSessionLocal
+from app.db.models import Base, User
+from app.repositories.user_repository import UserRepository
+from app.services.auth_service import AuthService
+from app.services.user_service import UserService
+
+
+def test_token_cache_expires_with_token_exp() -> None:
+    now = [1000.0]
+    cache = TokenCache(max_entries=2, clock=lambda: now[0])
+    cache.put("token-a", "alice", exp=1010)
+    cache.put("token-b", "bob", exp=None)  # exp 없는 토큰은 캐시하지 않음
+
+    assert cache.get("token-a") == "alice"
+    assert cache.get("token-b") is None
+    now[0] = 1010.0
+    assert cache.get("token-a") is None
+    assert cache.stats() == {"entries": 0, "hits": 1, "misses": 2, "hit_rate": 0.3333}
+
+
+def test_user_cache_ttl_and_invalidate() -> None:
+    now = [0.0]
+    cache = UserCache(max_entries=10, ttl_sec=30, clock=lambda: now[0])
+    cache.put("alice", {"id": 1})
+    assert cache.get("alice") == {"id": 1}
+    cache.invalidate("alice")
+    assert cache.get("alice") is None
+
+    cache.put("alice", {"id": 1})
+    now[0] = 30.0
+    assert cache.get("alice") is None
+
+
+@pytest.mark.asyncio
+async def test_authenticated_lookup_uses_caches_and_update_invalidates() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    token_cache.clear()
+    user_cache.clear()
+
+    login_id = f"cache-{uuid.uuid4().hex[:8]}"
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(User).where(User.login_id == login_id))
+        db.add(User(login_id=login_id, hashed_password="x", nickname="before", is_active=True))
+        await db.commit()
+
+    token = security.create_access_token({"sub": login_id}, expires_delta=timedelta(minutes=5))
+    for _ in range(3):
+        async with AsyncSessionLocal() as db:
+            repo = UserRepository(db)
+            assert AuthService(repo).verify_token(token) == login_id
+            user = await UserService(repo).get_user_by_login_id(login_id)
+            assert user.nickname == "before"
+    assert (token_cache.hits, token_cache.misses) == (2, 1)
+    assert (user_cache.hits, user_cache.misses) == (2, 1)
+
+    # 캐시에서 꺼낸 User로도 수정이 저장되고, 수정 후에는 캐시가 무효화됨
+    async with AsyncSessionLocal() as db:
+        repo = UserRepository(db)
+        user = await repo.get_by_login_id_cached(login_id)
+        user.nickname = "after"
+        await repo.update(user)
+
+    async with AsyncSessionLocal() as db:
+        user = await UserRepository(db).get_by_login_id_cached(login_id)
+        assert user.nickname == "after"
+    assert user_cache.misses == 2
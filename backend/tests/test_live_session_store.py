@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.db.database import engine, AsyncSessionLocal
+from app.db.models import Base, LiveSessionContext
+from app.services.live_session_store import DBSessionContextStore
+
+
+@pytest.mark.asyncio
+async def test_db_store_shares_context_until_deleted_or_stale() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_id = f"live-{uuid.uuid4().hex[:8]}"
+    # 서로 다른 워커를 흉내: 쓰는 쪽과 읽는 쪽이 각자 저장소 인스턴스를 가짐
+    writer = DBSessionContextStore(AsyncSessionLocal, ttl_sec=60)
+    reader = DBSessionContextStore(AsyncSessionLocal, ttl_sec=60)
+
+    await writer.put(session_id, {"messages": [{"role": "user", "content": "안녕"}], "context": None})
+    await writer.put(session_id, {"messages": [{"role": "user", "content": "hi"}], "context": {"place": "cafe"}})
+    assert await reader.get(session_id) == {
+        "messages": [{"role": "user", "content": "hi"}],
+        "context": {"place": "cafe"},
+    }
+
+    # TTL이 지난 행은 조회되지 않고 정리 대상
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(LiveSessionContext)
+            .where(LiveSessionContext.session_id == session_id)
+            .values(updated_at=datetime.now(timezone.utc) - timedelta(seconds=120))
+        )
+        await db.commit()
+    assert await reader.get(session_id) is None
+    assert await reader.delete_expired() >= 1
+
+    await writer.put(session_id, {"messages": [], "context": None})
+    await writer.delete(session_id)
+    assert await reader.get(session_id) is None
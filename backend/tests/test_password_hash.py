@@ -0,0 +1,55 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+from passlib.context import CryptContext
+from sqlalchemy import delete
+
+from app.core import exceptions, security
+from app.core.config import settings
+from app.db.database import engine, AsyncSessionLocal
+from app.db.models import Base, User
+from app.repositories.user_repository import UserRepository
+from app.services.auth_service import AuthService
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_password_when_cost_changes() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    login_id = f"rehash-{uuid.uuid4().hex[:8]}"
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret-pw")
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(User).where(User.login_id == login_id))
+        db.add(User(login_id=login_id, hashed_password=old_hash, nickname="rehash", is_active=True))
+        await db.commit()
+
+    async with AsyncSessionLocal() as db:
+        service = AuthService(UserRepository(db))
+        assert await service.authenticate_user(login_id, "wrong-pw") is None
+        user = await service.authenticate_user(login_id, "secret-pw")
+        assert user is not None
+
+    assert user.hashed_password != old_hash
+    assert user.hashed_password.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+    assert await security.verify_password_async("secret-pw", user.hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_rejects_when_queue_is_full(monkeypatch) -> None:
+    security.shutdown_password_hash_executor()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 1)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_TIMEOUT_SECONDS", 0.05)
+    try:
+        slow = asyncio.create_task(security._run_password_hash(time.sleep, 0.3))
+        await asyncio.sleep(0.01)
+        with pytest.raises(exceptions.PasswordHasherBusyError):
+            await security._run_password_hash(time.sleep, 0)
+        # 실행 중인 작업도 제한 시간을 넘기면 Busy (스레드 작업은 끝까지 실행됨)
+        with pytest.raises(exceptions.PasswordHasherBusyError):
+            await slow
+    finally:
+        security.shutdown_password_hash_executor()
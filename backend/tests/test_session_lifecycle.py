@@ -1,14 +1,19 @@
+import asyncio
+import json
 import uuid
 from datetime import datetime, timezone, timedelta
 
 import pytest
 from sqlalchemy import delete, update, select
 
+from app.core.config import settings
 from app.db.database import engine, AsyncSessionLocal
-from app.db.models import Base, ConversationSession, User
+from app.db.models import BackgroundJob, Base, ChatMessage, ConversationSession, User
 from app.repositories.chat_repository import ChatRepository
+from app.repositories.job_repository import JOB_FAILED, JOB_QUEUED, JOB_SUCCEEDED, JobRepository
 from app.schemas.chat import SessionCreate
 from app.services.session_cleanup import soft_delete_expired_sessions
+from app.services.job_worker import enqueue_job, register_job_handler, run_job_workers, run_next_job
 
 
 async def _init_db() -> None:
@@ -18,6 +23,9 @@ async def _init_db() -> None:
 
 async def _reset_db() -> None:
     async with AsyncSessionLocal() as session:
+        await session.execute(delete(BackgroundJob))
+        # 고정 session_id를 쓰는 테스트가 이전 실행의 메시지를 보지 않도록 함께 삭제
+        await session.execute(delete(ChatMessage))
         await session.execute(delete(ConversationSession))
         await session.execute(delete(User))
         await session.commit()
@@ -136,3 +144,541 @@ async def test_get_recent_session_excludes_deleted() -> None:
         repo = ChatRepository(db)
         recent = await repo.get_recent_session_by_user(user_id=user.id)
         assert recent is None
+
+
+@pytest.mark.asyncio
+async def test_append_session_log_accumulates_without_loading_messages() -> None:
+    await _init_db()
+    await _reset_db()
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+
+    def _log(contents: list[str]) -> SessionCreate:
+        return SessionCreate(
+            session_id=session_id,
+            title="Append Test",
+            started_at=now,
+            ended_at=now,
+            total_duration_sec=10.0,
+            user_speech_duration_sec=4.0,
+            messages=[
+                {"role": "user", "content": content, "timestamp": now, "duration_sec": 1.0}
+                for content in contents
+            ],
+            voice="alloy",
+        )
+
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        first_ids = await repo.append_session_log(_log(["hi", "there"]), user_id=None)
+        second_ids = await repo.append_session_log(_log(["again"]), user_id=None)
+
+    assert len(first_ids) == 2
+    assert len(second_ids) == 1
+    assert first_ids[1] < second_ids[0]
+
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        saved = await repo.get_session_by_id(session_id)
+        assert saved.total_duration_sec == 20.0
+        assert saved.user_speech_duration_sec == 8.0
+        assert saved.voice == "alloy"
+        assert [msg.content for msg in saved.messages] == ["hi", "there", "again"]
+
+
+@pytest.mark.asyncio
+async def test_get_sessions_by_user_keyset_pagination() -> None:
+    await _init_db()
+    await _reset_db()
+
+    async with AsyncSessionLocal() as db:
+        user = User(login_id="keyset-user", hashed_password="hashed", nickname="tester", is_active=True)
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
+
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        repo = ChatRepository(db)
+        for i in range(5):
+            ended_at = (base + timedelta(minutes=i)).isoformat()
+            await repo.append_session_log(
+                SessionCreate(
+                    session_id=f"session-{i}",
+                    started_at=ended_at,
+                    ended_at=ended_at,
+                    total_duration_sec=0.0,
+                    user_speech_duration_sec=0.0,
+                    messages=[{"role": "user", "content": "hi", "timestamp": ended_at}] * i,
+                ),
+                user_id=user.id,
+            )
+
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        first_page, total = await repo.get_sessions_by_user(user.id, limit=2)
+        assert total == 5
+        assert [s.session_id for s in first_page] == ["session-4", "session-3"]
+        assert [s.message_count for s in first_page] == [4, 3]
+
+        last = first_page[-1]
+        second_page, _ = await repo.get_sessions_by_user(user.id, limit=2, after=(last.ended_at, last.session_id))
+        assert [s.session_id for s in second_page] == ["session-2", "session-1"]
+
+
+@pytest.mark.asyncio
+async def test_latest_messages_and_bulk_feedback_update() -> None:
+    await _init_db()
+    await _reset_db()
+
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    session_id = str(uuid.uuid4())
+    messages = [
+        {"role": "user", "content": f"message {i}", "timestamp": (now + timedelta(seconds=i)).isoformat()}
+        for i in range(6)
+    ]
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        await repo.append_session_log(
+            SessionCreate(
+                session_id=session_id,
+                started_at=now.isoformat(),
+                ended_at=now.isoformat(),
+                total_duration_sec=0.0,
+                user_speech_duration_sec=0.0,
+                messages=messages,
+            )
+        )
+        other_ids = await repo.append_session_log(
+            SessionCreate(
+                session_id=str(uuid.uuid4()),
+                started_at=now.isoformat(),
+                ended_at=now.isoformat(),
+                total_duration_sec=0.0,
+                user_speech_duration_sec=0.0,
+                messages=[{"role": "user", "content": "other", "timestamp": now.isoformat()}],
+            )
+        )
+        other_message_id = other_ids[0]
+        latest = await repo.get_latest_messages(session_id, 3)
+        assert [msg.content for msg in latest] == ["message 3", "message 4", "message 5"]
+
+        updated = await repo.bulk_update_message_feedback(
+            session_id,
+            [
+                {"message_id": latest[0].id, "feedback": "better 3", "reason": "why 3"},
+                {"message_id": latest[2].id, "feedback": "better 5", "reason": "why 5"},
+                # 다른 세션의 메시지 ID는 업데이트되지도, 집계되지도 않음
+                {"message_id": other_message_id, "feedback": "wrong", "reason": "wrong"},
+            ],
+        )
+        await repo.update_session_summary(session_id, "Summary.")
+        await db.commit()
+        assert updated == 2
+
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        saved = await repo.get_messages_by_session(session_id)
+        feedback = {msg.content: (msg.is_feedback, msg.feedback) for msg in saved}
+        assert feedback["message 3"] == (True, "better 3")
+        assert feedback["message 4"][0] is False
+        assert feedback["message 5"] == (True, "better 5")
+        session = await db.get(ConversationSession, session_id)
+        assert session.scenario_summary == "Summary."
+
+
+@pytest.mark.asyncio
+async def test_dialogue_messages_skip_summarized_prefix() -> None:
+    await _init_db()
+    await _reset_db()
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+    roles = ["user", "assistant", "system", "user", "assistant"]
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        await repo.append_session_log(
+            SessionCreate(
+                session_id=session_id,
+                started_at=now,
+                ended_at=now,
+                total_duration_sec=0.0,
+                user_speech_duration_sec=0.0,
+                messages=[
+                    {"role": role, "content": f"m{i}", "timestamp": now} for i, role in enumerate(roles)
+                ],
+            )
+        )
+        await repo.update_history_summary(session_id, "Earlier.", 2)
+        await db.commit()
+
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        assert await repo.get_history_summary(session_id) == ("Earlier.", 2)
+        assert await repo.get_history_summary("missing") is None
+        assert await repo.get_dialogue_messages(session_id, offset=2) == [
+            {"role": "user", "content": "m3"},
+            {"role": "assistant", "content": "m4"},
+        ]
+
+
+@pytest.mark.asyncio
+async def test_job_enqueue_is_idempotent_and_retries_until_failed() -> None:
+    await _init_db()
+    await _reset_db()
+
+    first = await enqueue_job("test_always_fails", "fail:1", {"value": 1}, session_id="s-1")
+    second = await enqueue_job("test_always_fails", "fail:1", {"value": 2}, session_id="s-1")
+    assert second.id == first.id
+
+    @register_job_handler("test_always_fails")
+    async def _fail(payload: dict) -> None:
+        raise RuntimeError("boom")
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(BackgroundJob).where(BackgroundJob.id == first.id).values(max_attempts=2))
+        await db.commit()
+
+    assert await run_next_job() is True
+    async with AsyncSessionLocal() as db:
+        job = await db.get(BackgroundJob, first.id)
+        assert job.status == JOB_QUEUED
+        assert job.attempts == 1
+        assert job.last_error == "boom"
+        # 백오프 동안은 다시 선점되지 않아야 함
+        assert await JobRepository(db).claim_next() is None
+        await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == first.id)
+            .values(run_after=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        await db.commit()
+
+    assert await run_next_job() is True
+    assert await run_next_job() is False
+    async with AsyncSessionLocal() as db:
+        job = await db.get(BackgroundJob, first.id)
+        assert job.status == JOB_FAILED
+        assert job.attempts == 2
+        assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_job_worker_runs_registered_handler() -> None:
+    await _init_db()
+    await _reset_db()
+
+    seen = []
+
+    @register_job_handler("test_records_payload")
+    async def _record(payload: dict) -> None:
+        seen.append(payload)
+
+    job = await enqueue_job("test_records_payload", "record:1", {"session_id": "s-2", "count": 3}, session_id="s-2")
+    assert await run_next_job() is True
+    assert seen == [{"session_id": "s-2", "count": 3}]
+
+    async with AsyncSessionLocal() as db:
+        jobs = await JobRepository(db).get_jobs_by_session("s-2")
+        assert [j.id for j in jobs] == [job.id]
+        assert jobs[0].status == JOB_SUCCEEDED
+        assert jobs[0].attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_running_workers_requeue_jobs_left_running(monkeypatch) -> None:
+    await _init_db()
+    await _reset_db()
+
+    seen = []
+
+    @register_job_handler("test_stale")
+    async def _record(payload: dict) -> None:
+        seen.append(payload)
+
+    job = await enqueue_job("test_stale", "stale:1", {"value": 1})
+    # 이전 프로세스가 선점한 뒤 죽은 작업
+    async with AsyncSessionLocal() as db:
+        claimed = await JobRepository(db).claim_next()
+        assert claimed.id == job.id
+
+    monkeypatch.setattr(settings, "JOB_WORKER_ENABLED", True)
+    monkeypatch.setattr(settings, "JOB_WORKER_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "JOB_REAP_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "JOB_LOCK_TIMEOUT_SECONDS", 60)
+
+    stop_event = asyncio.Event()
+    workers = asyncio.create_task(run_job_workers(stop_event))
+    try:
+        await asyncio.sleep(0.05)
+        assert seen == []  # lock timeout 전에는 그대로 running
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job.id)
+                .values(locked_at=datetime.now(timezone.utc) - timedelta(seconds=61))
+            )
+            await db.commit()
+
+        for _ in range(100):
+            if seen:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        stop_event.set()
+        await workers
+
+    assert seen == [{"value": 1}]
+    async with AsyncSessionLocal() as db:
+        finished = await db.get(BackgroundJob, job.id)
+        assert finished.status == JOB_SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_session_log_and_job_share_transaction() -> None:
+    await _init_db()
+    await _reset_db()
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+
+    def _log(contents):
+        return SessionCreate(
+            session_id=session_id,
+            started_at=now,
+            ended_at=now,
+            total_duration_sec=0.0,
+            user_speech_duration_sec=0.0,
+            messages=[{"role": "user", "content": content, "timestamp": now} for content in contents],
+        )
+
+    async with AsyncSessionLocal() as db:
+        ids = await ChatRepository(db).append_session_log(_log(["lost"]), commit=False)
+        await enqueue_job("test_tx", f"tx:{session_id}:1", {"message_ids": ids}, session_id=session_id, db=db)
+        await db.rollback()
+
+    async with AsyncSessionLocal() as db:
+        assert await db.get(ConversationSession, session_id) is None
+        assert await JobRepository(db).get_jobs_by_session(session_id) == []
+
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        ids = await repo.append_session_log(_log(["first", "second"]), commit=False)
+        await enqueue_job("test_tx", f"tx:{session_id}:2", {"message_ids": ids}, session_id=session_id, db=db)
+        await db.commit()
+        # 작업 처리 전에 세션이 이어져도 작업이 가리키는 메시지는 그대로
+        await repo.append_session_log(_log(["resumed"]))
+
+    async with AsyncSessionLocal() as db:
+        jobs = await JobRepository(db).get_jobs_by_session(session_id)
+        assert len(jobs) == 1
+        message_ids = json.loads(jobs[0].payload)["message_ids"]
+        messages = await ChatRepository(db).get_messages_by_ids(session_id, message_ids)
+        assert [m.content for m in messages] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_process_session_analytics_is_idempotent() -> None:
+    from app.analytics.models import ScenarioKeywordCount, ScenarioStatistics, SessionAnalytics
+    from app.analytics.processor import AnalyticsProcessor
+
+    await _init_db()
+    await _reset_db()
+    scenario = f"idem-{uuid.uuid4().hex[:8]}"
+    async with AsyncSessionLocal() as db:
+        user = User(login_id=f"idem-{uuid.uuid4().hex[:8]}", hashed_password="x", nickname="idem")
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
+        user_id = user.id
+
+    now = datetime.now(timezone.utc).isoformat()
+    session_id = str(uuid.uuid4())
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).append_session_log(
+            SessionCreate(
+                session_id=session_id,
+                started_at=now,
+                ended_at=now,
+                total_duration_sec=0.0,
+                user_speech_duration_sec=0.0,
+                scenario_place=scenario,
+                messages=[{"role": "user", "content": "coffee please", "timestamp": now}] * 3,
+            ),
+            user_id=user_id,
+        )
+
+    async with AsyncSessionLocal() as db:
+        assert await AnalyticsProcessor(db).process_session_analytics(session_id) is True
+    # 재시도된 작업은 다시 집계하지 않음
+    async with AsyncSessionLocal() as db:
+        assert await AnalyticsProcessor(db).process_session_analytics(session_id) is False
+
+    async with AsyncSessionLocal() as db:
+        stat = await db.get(ScenarioStatistics, scenario)
+        assert (stat.total_plays, stat.avg_turns) == (1, pytest.approx(3.0))
+        coffee = await db.get(ScenarioKeywordCount, (scenario, "coffee"))
+        assert coffee.count == 3
+        analytics = await db.get(SessionAnalytics, session_id)
+        assert analytics.user_id == user_id
+        session = await db.get(ConversationSession, session_id)
+        assert session.is_analyzed is True
+
+
+@pytest.mark.asyncio
+async def test_scenario_stats_upsert_and_top_keywords_refresh() -> None:
+    from app.analytics.models import ScenarioKeywordCount, ScenarioStatistics
+    from app.analytics.processor import AnalyticsProcessor
+
+    await _init_db()
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(ScenarioKeywordCount))
+        await db.execute(delete(ScenarioStatistics))
+        await db.commit()
+
+    async with AsyncSessionLocal() as db:
+        processor = AnalyticsProcessor(db)
+        await processor.update_scenario_stats("cafe", ["coffee please", "iced coffee", "thanks"])
+        await processor.update_scenario_stats("cafe", ["latte please"])
+        await processor.update_scenario_stats("airport", ["passport"])
+
+        stat = await db.get(ScenarioStatistics, "cafe", populate_existing=True)
+        assert stat.total_plays == 2
+        assert stat.avg_turns == pytest.approx(2.0)
+        # Top-K는 주기 재계산 전까지 갱신되지 않음
+        assert stat.top_keywords == {}
+
+        assert await processor.refresh_top_keywords(limit=2) == 2
+
+    async with AsyncSessionLocal() as db:
+        counts = await db.execute(
+            select(ScenarioKeywordCount.word, ScenarioKeywordCount.count)
+            .where(ScenarioKeywordCount.scenario_id == "cafe")
+        )
+        assert dict(counts.all()) == {"coffee": 2, "please": 2, "iced": 1, "thanks": 1, "latte": 1}
+        cafe = await db.get(ScenarioStatistics, "cafe")
+        assert cafe.top_keywords == {"coffee": 2, "please": 2}
+        airport = await db.get(ScenarioStatistics, "airport")
+        assert airport.top_keywords == {"passport": 1}
+
+
+@pytest.mark.asyncio
+async def test_backfill_session_analytics_resumes_from_checkpoint(tmp_path) -> None:
+    from app.analytics.backfill import backfill_session_analytics, load_checkpoint
+    from app.analytics.models import ScenarioKeywordCount, ScenarioStatistics, SessionAnalytics
+
+    await _init_db()
+    await _reset_db()
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(ScenarioKeywordCount))
+        await db.execute(delete(ScenarioStatistics))
+        await db.execute(delete(SessionAnalytics))
+        user = User(login_id=f"backfill-{uuid.uuid4().hex[:8]}", hashed_password="x", nickname="backfill")
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
+        user_id = user.id
+
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+    user_turns = {"a-long": 4, "b-short": 1, "c-long": 3}
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        for session_id, turns in user_turns.items():
+            await repo.append_session_log(
+                SessionCreate(
+                    session_id=session_id,
+                    started_at=now,
+                    ended_at=now,
+                    total_duration_sec=0.0,
+                    user_speech_duration_sec=0.0,
+                    scenario_place="cafe",
+                    messages=[{"role": "user", "content": "coffee please", "timestamp": now}] * turns,
+                ),
+                user_id=user_id,
+            )
+
+    checkpoint = str(tmp_path / "backfill.checkpoint")
+    first = await backfill_session_analytics(
+        AsyncSessionLocal, chunk_size=2, workers=1, checkpoint_path=checkpoint, until="2024-01-02"
+    )
+    assert (first.sessions, first.analyzed) == (3, 2)
+    assert load_checkpoint(checkpoint) == (now, "c-long")
+
+    async with AsyncSessionLocal() as db:
+        flags = await db.execute(select(ConversationSession.is_analyzed))
+        assert all(flag for (flag,) in flags.all())
+        stat = await db.get(ScenarioStatistics, "cafe")
+        assert stat.total_plays == 2
+        assert stat.avg_turns == pytest.approx(3.5)
+        coffee = await db.get(ScenarioKeywordCount, ("cafe", "coffee"))
+        assert coffee.count == 7
+        analytics = await db.get(SessionAnalytics, "a-long")
+        assert (analytics.word_count, analytics.unique_words_count) == (8, 2)
+
+    # 체크포인트 이후에 끝난 세션은 session_id가 커서보다 작아도 재개 시 처리됨
+    later = datetime(2024, 1, 3, tzinfo=timezone.utc).isoformat()
+    async with AsyncSessionLocal() as db:
+        await ChatRepository(db).append_session_log(
+            SessionCreate(
+                session_id="0-late",
+                started_at=later,
+                ended_at=later,
+                total_duration_sec=0.0,
+                user_speech_duration_sec=0.0,
+                scenario_place="cafe",
+                messages=[{"role": "user", "content": "coffee please", "timestamp": later}] * 3,
+            ),
+            user_id=user_id,
+        )
+
+    second = await backfill_session_analytics(AsyncSessionLocal, workers=1, checkpoint_path=checkpoint)
+    assert (second.sessions, second.analyzed) == (1, 1)
+    assert load_checkpoint(checkpoint) == (later, "0-late")
+    async with AsyncSessionLocal() as db:
+        stat = await db.get(ScenarioStatistics, "cafe")
+        assert stat.total_plays == 3
+
+    third = await backfill_session_analytics(AsyncSessionLocal, workers=1, checkpoint_path=checkpoint)
+    assert third.sessions == 0
+
+
+@pytest.mark.asyncio
+async def test_backfill_write_skips_sessions_analyzed_after_read() -> None:
+    from app.analytics.backfill import analyze_sessions, fetch_chunk, write_chunk
+    from app.analytics.models import ScenarioStatistics
+    from app.analytics.processor import AnalyticsProcessor
+
+    await _init_db()
+    await _reset_db()
+    scenario = f"race-{uuid.uuid4().hex[:8]}"
+    now = datetime.now(timezone.utc).isoformat()
+    session_ids = [str(uuid.uuid4()) for _ in range(2)]
+    async with AsyncSessionLocal() as db:
+        repo = ChatRepository(db)
+        for session_id in session_ids:
+            await repo.append_session_log(
+                SessionCreate(
+                    session_id=session_id,
+                    started_at=now,
+                    ended_at=now,
+                    total_duration_sec=0.0,
+                    user_speech_duration_sec=0.0,
+                    scenario_place=scenario,
+                    messages=[{"role": "user", "content": "coffee please", "timestamp": now}] * 3,
+                ),
+            )
+
+    async with AsyncSessionLocal() as db:
+        sessions, items = await fetch_chunk(db, None, chunk_size=10)
+    # 청크를 읽은 뒤 실시간 작업이 한 세션을 먼저 분석
+    async with AsyncSessionLocal() as db:
+        assert await AnalyticsProcessor(db).process_session_analytics(session_ids[0]) is True
+
+    async with AsyncSessionLocal() as db:
+        assert await write_chunk(db, sessions, analyze_sessions(items)) == (1, 1)
+
+    async with AsyncSessionLocal() as db:
+        stat = await db.get(ScenarioStatistics, scenario)
+        assert stat.total_plays == 2
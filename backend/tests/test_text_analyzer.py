@@ -0,0 +1,41 @@
+from collections import Counter
+
+from app.analytics.processor import TextAnalyzer
+
+MESSAGES = [
+    "I'd like an ICED coffee, please!",
+    "",
+    "Where is gate 12? My boarding pass says B-12.",
+    "Café au lait — très bien, thank you",
+    "tab\tseparated\nlines and\x00null bytes",
+    "the a an is",
+]
+
+
+def test_analyze_batch_matches_mvp_analyzer() -> None:
+    expected_words = [TextAnalyzer.extract_keywords(msg) for msg in MESSAGES]
+    all_words = [w for words in expected_words for w in words]
+
+    batch = TextAnalyzer.analyze_batch(MESSAGES, per_message=True)
+
+    assert batch.counts == Counter(all_words)
+    assert batch.token_counts == [len(words) for words in expected_words]
+    assert batch.word_count == len(all_words)
+    assert batch.unique_words_count == len(set(all_words))
+    assert batch.richness_score == TextAnalyzer.calculate_richness_score(all_words)
+
+
+def test_analyze_batch_ascii_and_custom_tokenizer() -> None:
+    messages = ["Boarding pass, please.", "Window seat please"]
+    batch = TextAnalyzer.analyze_batch(messages)
+    assert batch.counts == Counter({"please": 2, "boarding": 1, "pass": 1, "window": 1, "seat": 1})
+    assert batch.token_counts is None
+
+    upper = TextAnalyzer.analyze_batch(messages, tokenizer=lambda text: text.upper().split(), per_message=True)
+    assert upper.counts["PLEASE"] == 1
+    assert upper.token_counts == [3, 3]
+
+    empty = TextAnalyzer.analyze_batch([], per_message=True)
+    assert empty.counts == Counter()
+    assert empty.token_counts == []
+    assert empty.richness_score == 0.0
@@ -20,6 +20,52 @@ SET default_tablespace = '';
 
 SET default_table_access_method = heap;
 
+--
+-- Name: background_jobs; Type: TABLE; Schema: public; Owner: aimaster
+--
+
+CREATE TABLE public.background_jobs (
+    id integer NOT NULL,
+    job_type character varying NOT NULL,
+    idempotency_key character varying NOT NULL,
+    session_id character varying,
+    payload text,
+    status character varying NOT NULL,
+    attempts integer NOT NULL,
+    max_attempts integer NOT NULL,
+    run_after timestamp with time zone DEFAULT now() NOT NULL,
+    locked_at timestamp with time zone,
+    last_error text,
+    finished_at timestamp with time zone,
+    created_at timestamp with time zone DEFAULT now(),
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
+ALTER TABLE public.background_jobs OWNER TO aimaster;
+
+--
+-- Name: background_jobs_id_seq; Type: SEQUENCE; Schema: public; Owner: aimaster
+--
+
+CREATE SEQUENCE public.background_jobs_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+ALTER TABLE public.background_jobs_id_seq OWNER TO aimaster;
+
+--
+-- Name: background_jobs_id_seq; Type: SEQUENCE OWNED BY; Schema: public; Owner: aimaster
+--
+
+ALTER SEQUENCE public.background_jobs_id_seq OWNED BY public.background_jobs.id;
+
+
 --
 -- Name: chat_messages; Type: TABLE; Schema: public; Owner: aimaster
 --
@@ -84,13 +130,29 @@ CREATE TABLE public.conversation_sessions (
     updated_at timestamp with time zone DEFAULT now(),
     user_id integer,
     scenario_summary text,
+    history_summary text,
+    history_summary_count integer,
     is_analyzed boolean DEFAULT false,
-    scenario_id character varying
+    scenario_id character varying,
+    message_count integer DEFAULT 0 NOT NULL
 );
 
 
 ALTER TABLE public.conversation_sessions OWNER TO aimaster;
 
+--
+-- Name: live_session_contexts; Type: TABLE; Schema: public; Owner: aimaster
+--
+
+CREATE TABLE public.live_session_contexts (
+    session_id character varying NOT NULL,
+    context text NOT NULL,
+    updated_at timestamp with time zone NOT NULL
+);
+
+
+ALTER TABLE public.live_session_contexts OWNER TO aimaster;
+
 --
 -- Name: scenario_definitions; Type: TABLE; Schema: public; Owner: aimaster
 --
@@ -110,6 +172,19 @@ CREATE TABLE public.scenario_definitions (
 
 ALTER TABLE public.scenario_definitions OWNER TO aimaster;
 
+--
+-- Name: scenario_keyword_counts; Type: TABLE; Schema: public; Owner: aimaster
+--
+
+CREATE TABLE public.scenario_keyword_counts (
+    scenario_id character varying NOT NULL,
+    word character varying NOT NULL,
+    count integer NOT NULL
+);
+
+
+ALTER TABLE public.scenario_keyword_counts OWNER TO aimaster;
+
 --
 -- Name: scenario_statistics; Type: TABLE; Schema: public; Owner: aimaster
 --
@@ -180,6 +255,13 @@ ALTER TABLE public.users_id_seq OWNER TO aimaster;
 ALTER SEQUENCE public.users_id_seq OWNED BY public.users.id;
 
 
+--
+-- Name: background_jobs id; Type: DEFAULT; Schema: public; Owner: aimaster
+--
+
+ALTER TABLE ONLY public.background_jobs ALTER COLUMN id SET DEFAULT nextval('public.background_jobs_id_seq'::regclass);
+
+
 --
 -- Name: chat_messages id; Type: DEFAULT; Schema: public; Owner: aimaster
 --
@@ -194,6 +276,22 @@ ALTER TABLE ONLY public.chat_messages ALTER COLUMN id SET DEFAULT nextval('publi
 ALTER TABLE ONLY public.users ALTER COLUMN id SET DEFAULT nextval('public.users_id_seq'::regclass);
 
 
+--
+-- Name: background_jobs background_jobs_idempotency_key_key; Type: CONSTRAINT; Schema: public; Owner: aimaster
+--
+
+ALTER TABLE ONLY public.background_jobs
+    ADD CONSTRAINT background_jobs_idempotency_key_key UNIQUE (idempotency_key);
+
+
+--
+-- Name: background_jobs background_jobs_pkey; Type: CONSTRAINT; Schema: public; Owner: aimaster
+--
+
+ALTER TABLE ONLY public.background_jobs
+    ADD CONSTRAINT background_jobs_pkey PRIMARY KEY (id);
+
+
 --
 -- Name: chat_messages chat_messages_pkey; Type: CONSTRAINT; Schema: public; Owner: aimaster
 --
@@ -210,6 +308,14 @@ ALTER TABLE ONLY public.conversation_sessions
     ADD CONSTRAINT conversation_sessions_pkey PRIMARY KEY (session_id);
 
 
+--
+-- Name: live_session_contexts live_session_contexts_pkey; Type: CONSTRAINT; Schema: public; Owner: aimaster
+--
+
+ALTER TABLE ONLY public.live_session_contexts
+    ADD CONSTRAINT live_session_contexts_pkey PRIMARY KEY (session_id);
+
+
 --
 -- Name: scenario_definitions scenario_definitions_pkey; Type: CONSTRAINT; Schema: public; Owner: aimaster
 --
@@ -218,6 +324,14 @@ ALTER TABLE ONLY public.scenario_definitions
     ADD CONSTRAINT scenario_definitions_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: scenario_keyword_counts scenario_keyword_counts_pkey; Type: CONSTRAINT; Schema: public; Owner: aimaster
+--
+
+ALTER TABLE ONLY public.scenario_keyword_counts
+    ADD CONSTRAINT scenario_keyword_counts_pkey PRIMARY KEY (scenario_id, word);
+
+
 --
 -- Name: scenario_statistics scenario_statistics_pkey; Type: CONSTRAINT; Schema: public; Owner: aimaster
 --
@@ -242,6 +356,20 @@ ALTER TABLE ONLY public.users
     ADD CONSTRAINT users_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: ix_background_jobs_session_id; Type: INDEX; Schema: public; Owner: aimaster
+--
+
+CREATE INDEX ix_background_jobs_session_id ON public.background_jobs USING btree (session_id);
+
+
+--
+-- Name: ix_background_jobs_status_run_after; Type: INDEX; Schema: public; Owner: aimaster
+--
+
+CREATE INDEX ix_background_jobs_status_run_after ON public.background_jobs USING btree (status, run_after);
+
+
 --
 -- Name: ix_chat_messages_session_id; Type: INDEX; Schema: public; Owner: aimaster
 --
@@ -256,6 +384,20 @@ CREATE INDEX ix_chat_messages_session_id ON public.chat_messages USING btree (se
 CREATE INDEX ix_conversation_sessions_session_id ON public.conversation_sessions USING btree (session_id);
 
 
+--
+-- Name: ix_conversation_sessions_user_ended; Type: INDEX; Schema: public; Owner: aimaster
+--
+
+CREATE INDEX ix_conversation_sessions_user_ended ON public.conversation_sessions USING btree (user_id, ended_at, session_id);
+
+
+--
+-- Name: ix_live_session_contexts_updated_at; Type: INDEX; Schema: public; Owner: aimaster
+--
+
+CREATE INDEX ix_live_session_contexts_updated_at ON public.live_session_contexts USING btree (updated_at);
+
+
 --
 -- Name: ix_scenario_statistics_scenario_id; Type: INDEX; Schema: public; Owner: aimaster
 --